@@ -29,6 +29,8 @@ from ansys.dpf.core import help
 from ansys.dpf.core.core import BaseService, load_library, download_file, upload_file,upload_file_in_tmp_folder, upload_files_in_folder, download_files_in_folder, make_tmp_dir_server
 from ansys.dpf.core.time_freq_support import TimeFreqSupport
 from ansys.dpf.core.meshed_region import MeshedRegion
+from ansys.dpf.core.interpolator import Interpolator
+from ansys.dpf.core.averaging_kernel import AveragingKernel
 from ansys.dpf.core.elements import element_types
 from ansys.dpf.core.result_info import ResultInfo
 from ansys.dpf.core.collection import Collection
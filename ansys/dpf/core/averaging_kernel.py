@@ -0,0 +1,257 @@
+"""
+AveragingKernel
+===============
+Average results between locations on the client side.
+"""
+import hashlib
+
+import numpy as np
+
+from ansys.dpf.core.common import locations
+from ansys.dpf.core.errors import LocationError
+from ansys.dpf.core.nodes import _gather_csr
+
+
+class AveragingKernel:
+    """Averages fields between the nodes and the elements of a mesh on the client.
+
+    The way the values of a field are averaged only depends on the mesh and
+    on the layout of the field, its scoping and its data pointer, which
+    are usually the same for all the time steps of a result. The scatter
+    operator computed for a layout is kept in the topology cache of the
+    mesh and reused for all the fields with this layout, so that averaging
+    a field only costs a gather and a segmented sum of its data.
+
+    Parameters
+    ----------
+    mesh : MeshedRegion
+        Mesh supporting the fields to average.
+
+    Examples
+    --------
+    Average the elemental nodal stress at the nodes for all the time steps.
+
+    >>> import ansys.dpf.core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.download_transient_result())
+    >>> kernel = dpf.AveragingKernel(model.metadata.meshed_region)
+    >>> stress = model.results.stress.on_all_time_freqs()
+    >>> nodal_stress = kernel.elemental_nodal_to_nodal(stress.outputs.fields_container())
+
+    """
+
+    def __init__(self, mesh):
+        self._mesh = mesh
+
+    def elemental_nodal_to_nodal(self, field_or_fields_container, by_body=False, prefetch=2):
+        """Average elemental nodal values at the nodes.
+
+        The value at a node is the mean of the values of the elements
+        using the node. The rows of an element beyond its number of
+        nodes, such as the rows of other shell layers, are ignored.
+
+        Parameters
+        ----------
+        field_or_fields_container : Field or FieldsContainer
+            ``ElementalNodal`` field, or fields container of such fields.
+        by_body : bool, optional
+            Whether to only average the values of the elements of the same
+            body, the elements with the same material ID. The values stay
+            discontinuous between bodies and are returned as elemental
+            nodal values. The default is ``False``.
+        prefetch : int, optional
+            Number of fields of a fields container downloaded ahead. The
+            default is ``2``.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            ``(n_nodes, n_components)`` values on all the nodes of the mesh,
+            in the order of the mesh, ``nan`` for the nodes without values.
+            With ``by_body=True``, averaged values in the layout of the
+            field's data. A first axis of size ``n_fields`` is added for a
+            fields container.
+        """
+        return self._average(field_or_fields_container, locations.elemental_nodal,
+                             "elemental_nodal_by_body" if by_body else "elemental_nodal",
+                             prefetch)
+
+    def elemental_to_nodal(self, field_or_fields_container, prefetch=2):
+        """Average elemental values at the nodes.
+
+        The value at a node is the mean of the values of the elements
+        using the node.
+
+        Parameters
+        ----------
+        field_or_fields_container : Field or FieldsContainer
+            ``Elemental`` field, or fields container of such fields.
+        prefetch : int, optional
+            Number of fields of a fields container downloaded ahead. The
+            default is ``2``.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            ``(n_nodes, n_components)`` values on all the nodes of the mesh,
+            in the order of the mesh, ``nan`` for the nodes without values.
+            A first axis of size ``n_fields`` is added for a fields container.
+        """
+        return self._average(field_or_fields_container, locations.elemental,
+                             "elemental", prefetch)
+
+    def nodal_to_elemental(self, field_or_fields_container, prefetch=2):
+        """Average nodal values on the elements.
+
+        The value of an element is the mean of the values of its nodes
+        that are in the field.
+
+        Parameters
+        ----------
+        field_or_fields_container : Field or FieldsContainer
+            ``Nodal`` field, or fields container of such fields.
+        prefetch : int, optional
+            Number of fields of a fields container downloaded ahead. The
+            default is ``2``.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            ``(n_elements, n_components)`` values on all the elements of
+            the mesh, in the order of the mesh, ``nan`` for the elements
+            without values. A first axis of size ``n_fields`` is added for
+            a fields container.
+        """
+        return self._average(field_or_fields_container, locations.nodal,
+                             "nodal", prefetch)
+
+    def _average(self, field_or_fields_container, location, kind, prefetch):
+        from ansys.dpf.core.field import Field
+        if isinstance(field_or_fields_container, Field):
+            return self._average_field(field_or_fields_container,
+                                       field_or_fields_container.data, location, kind)
+        values = [self._average_field(field, data, location, kind) for field, data
+                  in field_or_fields_container.iter_data(prefetch=prefetch)]
+        if not values:
+            return np.zeros((0, 0))
+        return np.stack(values)
+
+    def _average_field(self, field, data, location, kind):
+        if field.location != location:
+            raise LocationError(f'Location must be "{location}", not "{field.location}"')
+        data = np.asarray(data)
+        scoping = field.scoping
+        data_pointer = np.asarray(field._data_pointer if kind.startswith("elemental_nodal")
+                                  else [], dtype=np.int64)
+        n_rows = data.shape[0]
+        layout = hashlib.blake2b(digest_size=16)
+        layout.update(np.ascontiguousarray(scoping._get_ids(np_array=True)).tobytes())
+        layout.update(data_pointer.tobytes())
+        key = ("averaging_plan", kind, n_rows, layout.hexdigest())
+        plan = self._mesh.topology_cache._get(key, lambda: self._build_plan(
+            kind, scoping, data_pointer, field.component_count, n_rows))
+        return plan.apply(data)
+
+    def _build_plan(self, kind, scoping, data_pointer, n_components, n_rows):
+        """Build the scatter operator of a field layout."""
+        elements = self._mesh.elements
+        connectivity, offsets = elements._connectivity
+        n_nodes = len(self._mesh.nodes._ids)
+        n_elements = len(elements._ids)
+        if kind == "nodal":
+            # field row of each node of the mesh
+            node_rows = np.full(n_nodes + 1, -1, dtype=np.int64)
+            indices, mask = self._mesh.nodes.map_scoping(scoping)
+            node_rows[indices] = np.flatnonzero(mask)
+            node_indices = connectivity[offsets[0]:offsets[-1]]
+            sources = node_rows[np.where(node_indices < 0, n_nodes, node_indices)]
+            targets = np.repeat(np.arange(n_elements), np.diff(offsets))
+            return _ScatterPlan(sources, targets, n_elements)
+
+        element_indices, mask = elements.map_scoping(scoping)
+        entity_rows = np.flatnonzero(mask)
+        if kind == "elemental":
+            sizes = np.diff(offsets)[element_indices]
+            sources = np.repeat(entity_rows, sizes)
+            targets = _gather_csr(connectivity, offsets, element_indices)
+            return _ScatterPlan(sources, targets, n_nodes)
+
+        # elemental nodal: the j-th row of an element goes to its j-th node
+        if data_pointer.size == 0:
+            data_pointer = np.arange(mask.size, dtype=np.int64) * n_components
+        rows_start = data_pointer // n_components
+        rows_count = np.diff(np.append(rows_start, n_rows))
+        rows_start, rows_count = rows_start[mask], rows_count[mask]
+        sizes = np.minimum(rows_count, np.diff(offsets)[element_indices])
+        local = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        sources = np.repeat(rows_start, sizes) + local
+        targets = connectivity[np.repeat(offsets[element_indices], sizes) + local]
+        if kind == "elemental_nodal":
+            return _ScatterPlan(sources, targets, n_nodes)
+        # one target per node and body, scattered back to the rows
+        _, bodies = np.unique(elements._materials[element_indices], return_inverse=True)
+        n_bodies = int(bodies.max()) + 1 if bodies.size else 1
+        targets = np.where(targets < 0, -1, targets * n_bodies + np.repeat(bodies, sizes))
+        return _ScatterPlan(sources, targets, n_nodes * n_bodies, n_rows=n_rows)
+
+
+class _ScatterPlan:
+    """Sparse averaging operator, as the source rows of each target sorted
+    by target.
+
+    Parameters
+    ----------
+    sources : numpy.ndarray
+        Source row of each contribution.
+    targets : numpy.ndarray
+        Target of each contribution, negative for the ignored ones.
+    n_targets : int
+        Number of targets.
+    n_rows : int, optional
+        Number of source rows to scatter the averages back to, each row
+        getting the average of the target of its contribution. The default
+        is ``None``, in which case the averages are returned per target.
+    """
+
+    def __init__(self, sources, targets, n_targets, n_rows=None):
+        valid = (targets >= 0) & (sources >= 0)
+        sources, targets = sources[valid], targets[valid]
+        order = np.argsort(targets, kind="stable")
+        self.sources = sources[order]
+        sorted_targets = targets[order]
+        first = np.ones(sorted_targets.size, dtype=bool)
+        first[1:] = sorted_targets[1:] != sorted_targets[:-1]
+        self.starts = np.flatnonzero(first)
+        self.targets = sorted_targets[self.starts]
+        self.counts = np.diff(np.append(self.starts, sorted_targets.size))
+        self.n_targets = n_targets
+        self.rows = None
+        if n_rows is not None:
+            # average index of each row
+            self.rows = np.full(n_rows, -1, dtype=np.int64)
+            self.rows[self.sources] = np.cumsum(first) - 1
+
+    def _cached_arrays(self):
+        """Arrays of the plan, for the size of the topology cache."""
+        arrays = [self.sources, self.starts, self.targets, self.counts]
+        if self.rows is not None:
+            arrays.append(self.rows)
+        return arrays
+
+    def apply(self, data):
+        """Average data, given as ``(n_rows, ...)`` values."""
+        data = np.asarray(data, dtype=float)
+        if self.sources.size:
+            sums = np.add.reduceat(data[self.sources], self.starts, axis=0)
+            means = sums / self.counts.reshape((-1,) + (1,) * (data.ndim - 1))
+        else:
+            means = np.zeros((0,) + data.shape[1:])
+        if self.rows is not None:
+            values = np.full(data.shape, np.nan)
+            assigned = self.rows >= 0
+            values[assigned] = means[self.rows[assigned]]
+            return values
+        values = np.full((self.n_targets,) + data.shape[1:], np.nan)
+        values[self.targets] = means
+        return values
+
@@ -5,7 +5,11 @@ Used to verify if the server version is a minimum value.
 """
 
 from ansys.dpf.core import errors as dpf_errors
-import sys
+
+# largest number of IDs sent in the single message accepted by the servers 
+# older than 2.1, historically 8 MB divided by the size of a Python int32 scalar
+_PRE_2_1_MAX_IDS = 285714
+
 
 def server_meet_version(required_version, server):
     """Check if a given server version matches with a required version.
@@ -175,8 +179,7 @@ def version_requires(min_version):
                 ids = args[0]
                 size = len(ids)
                 if size != 0:
-                    max_size = 8.0E6//sys.getsizeof(ids[0])
-                    if size > max_size:
+                    if size > _PRE_2_1_MAX_IDS:
                         server.check_version(min_version)
             # default case, just check the compatibility
             else: 
@@ -5,6 +5,10 @@ Contains classes associated with the DPF collection.
 
 """
 
+import weakref
+
+import grpc
+
 from ansys import dpf
 from ansys.grpc.dpf import collection_pb2, collection_pb2_grpc
 from ansys.dpf.core.core import base_pb2
@@ -47,6 +51,7 @@ class Collection:
         self._stub = self._connect()
         self._type = dpf_type
         # self.__info = None  # cached info
+        self._entries_index = None
 
         if collection is None:
             request = collection_pb2.CollectionRequest()
@@ -78,6 +83,7 @@ class Collection:
         request.collection.CopyFrom(self._message)
         request.labels.extend([collection_pb2.NewLabel(label=lab) for lab in labels])
         self._stub.UpdateLabels(request)
+        self._invalidate_entries()
 
     def add_label(self, label, default_value =None):
         """Add the requested label to scope the collection.
@@ -104,6 +110,7 @@ class Collection:
             new_label.default_value.default_value=default_value
         request.labels.extend([new_label])
         self._stub.UpdateLabels(request)
+        self._invalidate_entries()
 
     def _get_labels(self):
         """Retrieve labels scoping the collection.
@@ -158,35 +165,101 @@ class Collection:
         entries : list[Scoping], list[Field], list[MeshedRegion]
             Entries corresponding to the request.
         """
+        entries_index = self._get_entries_index()
+        if isinstance(label_space_or_index, dict):
+            if not set(label_space_or_index).issubset(entries_index.labels):
+                return self._request_entries(label_space_or_index)
+            indices = entries_index.find(label_space_or_index)
+        else:
+            indices = [label_space_or_index] if 0 <= label_space_or_index < len(entries_index) else []
+        list_out = [entries_index.entry(i) for i in indices 
+                    if entries_index.entry(i) is not None]
+        if len(list_out)==0:
+            list_out=None
+        return list_out  
+    
+    def _request_entries(self, label_space):
+        """Retrieve the entries at a requested label space from the server.
+        
+        Used for the label spaces that cannot be answered with the local index.
+        """
         request = collection_pb2.EntryRequest()
         request.collection.CopyFrom(self._message)
-
-        if isinstance(label_space_or_index, dict):
-            for key in label_space_or_index:
-                request.label_space.label_space[key] = label_space_or_index[key]
-        elif isinstance(label_space_or_index, int):
-            request.index = label_space_or_index
+        for key in label_space:
+            request.label_space.label_space[key] = label_space[key]
         
         out = self._stub.GetEntries(request)
-        list_out =[]
-        for obj in out.entries :
-            if obj.HasField("dpf_type"):
-                if self._type == types.scoping:
-                    unpacked_msg = scoping_pb2.Scoping()
-                    obj.dpf_type.Unpack(unpacked_msg)
-                    list_out.append(Scoping(scoping=unpacked_msg, server=self._server))
-                elif self._type == types.field:
-                    unpacked_msg = field_pb2.Field()
-                    obj.dpf_type.Unpack(unpacked_msg)
-                    list_out.append(Field(field=unpacked_msg, server=self._server))
-                elif self._type == types.meshed_region:
-                    unpacked_msg = meshed_region_pb2.MeshedRegion()
-                    obj.dpf_type.Unpack(unpacked_msg)
-                    list_out.append(MeshedRegion(mesh=unpacked_msg, server=self._server))
+        list_out = [self._wrap_entry(obj) for obj in out.entries if obj.HasField("dpf_type")]
         if len(list_out)==0:
             list_out=None
-        return list_out  
+        return list_out
+    
+    def _wrap_entry(self, obj):
+        """Create the DPF entity of an entry message.
+        
+        Returns
+        -------
+        entry : Scoping, Field, MeshedRegion
+            ``None`` if the entry is not a DPF entity of the collection's type.
+        """
+        if not obj.HasField("dpf_type"):
+            return None
+        if self._type == types.scoping:
+            unpacked_msg = scoping_pb2.Scoping()
+            obj.dpf_type.Unpack(unpacked_msg)
+            return Scoping(scoping=unpacked_msg, server=self._server)
+        elif self._type == types.field:
+            unpacked_msg = field_pb2.Field()
+            obj.dpf_type.Unpack(unpacked_msg)
+            return Field(field=unpacked_msg, server=self._server)
+        elif self._type == types.meshed_region:
+            unpacked_msg = meshed_region_pb2.MeshedRegion()
+            obj.dpf_type.Unpack(unpacked_msg)
+            return MeshedRegion(mesh=unpacked_msg, server=self._server)
+        return None
+    
+    def _get_entries_index(self):
+        """Local index of the entries and of their label spaces.
+        
+        All the entries are fetched in one ``GetEntries`` call the first time,
+        and are kept until the collection is modified through this object. 
+        The DPF entity of an entry is created when it is accessed, and only 
+        kept while it is referenced outside of the collection.
+        
+        Returns
+        -------
+        entries_index : _EntriesIndex
+        """
+        if self._entries_index is None:
+            info = self._info
+            count = info["len"]
+            entries = []
+            if count > 0:
+                # an empty label space matches all the entries
+                request = collection_pb2.EntryRequest()
+                request.collection.CopyFrom(self._message)
+                request.label_space.SetInParent()
+                try:
+                    entries = list(self._stub.GetEntries(request).entries)
+                except grpc.RpcError:
+                    entries = []
+            if len(entries) != count:
+                entries = []
+                for i in range(count):
+                    request = collection_pb2.EntryRequest()
+                    request.collection.CopyFrom(self._message)
+                    request.index = i
+                    entries.extend(self._stub.GetEntries(request).entries)
+            self._entries_index = _EntriesIndex(
+                list(info["labels"]),
+                entries,
+                self._wrap_entry,
+                [dict(obj.label_space.label_space) for obj in entries])
+        return self._entries_index
     
+    def _invalidate_entries(self):
+        """Drop the local index of the entries, which is fetched again when needed."""
+        self._entries_index = None
     
     def _get_entry(self, label_space_or_index):
         """Retrieve the entry at a requested label space or index.
@@ -226,16 +299,7 @@ class Collection:
             Scoping of the requested entry. For example,
             ``{"time": 1, "complex": 0}``.
         """
-        request = collection_pb2.EntryRequest()
-        request.collection.CopyFrom(self._message)
-        request.index = index
-        out = self._stub.GetEntries(request).entries
-        out = out[0].label_space.label_space
-        dictOut ={}
-        for key in out:
-            dictOut[key]=out[key]
-
-        return dictOut
+        return dict(self._get_entries_index().label_spaces[index])
 
     def get_available_ids_for_label(self, label="time"):
         """Retrieve the IDs assigned to an input label.
@@ -251,12 +315,7 @@ class Collection:
         ids : list[int]
             List of IDs assigned to the input label.
         """
-        ids = []
-        for i in range(len(self)):
-            current_scop = self.get_label_space(i)
-            if label in current_scop and current_scop[label] not in ids:
-                ids.append(current_scop[label])
-        return ids
+        return list(self._get_entries_index().ids_by_label.get(label, {}))
     
     def get_label_scoping(self, label = "time"):
         """Retrieve the scoping for an input label.
@@ -296,7 +355,8 @@ class Collection:
         entry : Field , Scoping
             Entry at the index value.
         """
-        self_len = len(self)
+        entries_index = self._get_entries_index()
+        self_len = len(entries_index)
         if index < 0:
             # convert to a positive index
             index = self_len + index
@@ -306,7 +366,7 @@ class Collection:
         if index >= self_len:
             raise IndexError(f'This collection contains only {self_len} entrie(s)')
 
-        return self._get_entries(index)[0]
+        return entries_index.entry(index)
 
     def _add_entry(self, label_space, entry):
         """Update or add an entry at a requested label space.
@@ -324,6 +384,7 @@ class Collection:
         for key in label_space:
             request.label_space.label_space[key] = label_space[key]
         self._stub.UpdateEntry(request)
+        self._invalidate_entries()
         
     def _get_time_freq_support(self):
         """Retrieve time frequency support.
@@ -383,5 +444,76 @@ class Collection:
             pass
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        entries_index = self._get_entries_index()
+        for i in range(len(entries_index)):
+            yield entries_index.entry(i)
+
+
+class _EntriesIndex:
+    """Local copy of the entries of a collection, indexed by label space.
+    
+    Parameters
+    ----------
+    labels : list[str]
+        Labels of the collection.
+    entries : list
+        Message of each entry.
+    wrap : callable
+        Creates the DPF entity of an entry message.
+    label_spaces : list[dict[str,int]]
+        Label space of each entry.
+    """
+    
+    def __init__(self, labels, entries, wrap, label_spaces):
+        self.labels = labels
+        self._messages = entries
+        self._wrap = wrap
+        # the entities are only kept while they are used elsewhere
+        self._entries = weakref.WeakValueDictionary()
+        self.label_spaces = label_spaces
+        self.by_label_space = {}
+        # label -> label value -> indices of the entries, in order
+        self.ids_by_label = {label: {} for label in labels}
+        for i, label_space in enumerate(label_spaces):
+            self.by_label_space.setdefault(_label_space_key(label_space), []).append(i)
+            for label, value in label_space.items():
+                self.ids_by_label.setdefault(label, {}).setdefault(value, []).append(i)
+    
+    def __len__(self):
+        return len(self._messages)
+    
+    def entry(self, index):
+        """DPF entity of an entry, created when accessed, and shared by the 
+        accesses while it is referenced elsewhere."""
+        entry = self._entries.get(index)
+        if entry is None:
+            entry = self._wrap(self._messages[index])
+            if entry is not None:
+                self._entries[index] = entry
+        return entry
+    
+    def find(self, label_space):
+        """Indices of the entries matching all the labels of a label space.
+        
+        Parameters
+        ----------
+        label_space : dict[str,int]
+            Complete or partial label space.
+        
+        Returns
+        -------
+        indices : list[int]
+        """
+        if len(label_space) == 0:
+            return list(range(len(self._messages)))
+        if len(label_space) == len(self.labels):
+            return self.by_label_space.get(_label_space_key(label_space), [])
+        candidates = None
+        for label, value in label_space.items():
+            indices = self.ids_by_label.get(label, {}).get(value, [])
+            candidates = set(indices) if candidates is None else candidates.intersection(indices)
+        return sorted(candidates)
+
+
+def _label_space_key(label_space):
+    return tuple(sorted(label_space.items()))
@@ -31,7 +31,8 @@ class Element:
     index : int
         Fortran-based (1-based) index of the element in the result.
     nodes : list
-        List of DPF nodes belonging to the element.
+        List of DPF nodes belonging to the element. When ``None``, the 
+        nodes are read from the arrays cached by the mesh's elements.
 
     Examples
     --------
@@ -50,6 +51,8 @@ class Element:
     
     """
 
+    __slots__ = ("_mesh", "_id", "_index", "_nodes")
+
     def __init__(self, mesh, elementid, index, nodes):
         self._id = elementid
         self._index = index
@@ -71,6 +74,8 @@ class Element:
         [1, 26, 14, 12, 2, 27, 15, 13, 33, 64, 59, 30, 37, 65, 61, 34, 28, 81, 63, 58]
         
         """
+        if self._nodes is None:
+            return self._mesh.nodes._ids[self._mesh.elements._node_indices(self._index)].tolist()
         return [node.id for node in self._nodes]
 
     @property
@@ -110,6 +115,10 @@ class Element:
         >>> first_node = element.nodes[0]
         
         """
+        if self._nodes is None:
+            node_ids = self._mesh.nodes._ids
+            return [nodes.Node(self._mesh, int(node_ids[index]), index, None) 
+                    for index in self.connectivity]
         return self._nodes
 
     @property
@@ -122,6 +131,8 @@ class Element:
             Number of nodes.
             
         """
+        if self._nodes is None:
+            return self._mesh.elements._node_indices(self._index).size
         return len(self._nodes)
 
     def __str__(self):
@@ -147,17 +158,7 @@ class Element:
         <element_types.Hex20: 1>
         
         """
-        return self._get_type()
-
-    @protect_grpc
-    def _get_type(self):
-        """Retrieve the Ansys element type."""
-        
-        request = meshed_region_pb2.ElementalPropertyRequest()
-        request.mesh.CopyFrom(self._mesh._message)
-        request.index = self.index
-        request.property = meshed_region_pb2.ELEMENT_TYPE
-        return element_types(self._mesh._stub.GetElementalProperty(request).prop)
+        return element_types(int(self._mesh.elements._types[self._index]))
 
     @property
     def shape(self) -> str:
@@ -175,17 +176,7 @@ class Element:
         'solid'
         
         """
-        return self._get_shape()
-
-    @protect_grpc
-    def _get_shape(self):
-        """Retrieve the element shape."""
-        request = meshed_region_pb2.ElementalPropertyRequest()
-        request.mesh.CopyFrom(self._mesh._message)
-        request.index = self.index
-        request.property = meshed_region_pb2.ELEMENT_SHAPE
-        prop = self._mesh._stub.GetElementalProperty(request).prop
-        return meshed_region_pb2.ElementShape.Name(prop).lower()
+        return _element_shape(int(self._mesh.elements._types[self._index]))
     
     @property
     def connectivity(self):
@@ -197,6 +188,8 @@ class Element:
             Ordered list of node indices. 
            
         """
+        if self._nodes is None:
+            return self._mesh.elements._node_indices(self._index).tolist()
         list=[]
         for node in self._nodes:
             list.append(node.index)
@@ -205,6 +198,10 @@ class Element:
 class Elements():
     """Contains elements belonging to a meshed region.
     
+    The IDs, types, materials and connectivity of all the elements are 
+    fetched once, as arrays, the first time that they are needed. Elements 
+    returned by indexing or iteration are lightweight views on these arrays.
+    
     Parameters
     ----------
     mesh : str
@@ -236,8 +233,8 @@ class Elements():
         return self.n_elements
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        for i, elementid in enumerate(self._ids.tolist()):
+            yield Element(self._mesh, elementid, i, None)
 
     def element_by_id(self, id) -> Element:
         """Retrieve an element by element ID.
@@ -318,6 +315,7 @@ class Elements():
             element_request.shape =meshed_region_pb2.ElementShape.Value(add.shape.upper())
             request.elements.append(element_request)  
         self._mesh._stub.Add(request)
+        self._invalidate()
     
     def add_solid_element(self, id, connectivity):
         """Add a solid 3D element in the mesh.
@@ -391,8 +389,8 @@ class Elements():
         element_request.shape = meshed_region_pb2.ElementShape.Value(shape.upper())
         request.elements.extend([element_request])
         self._mesh._stub.Add(request)
+        self._invalidate()
     
-    @protect_grpc
     def __get_element(self, elementindex=None, elementid=None):
         """Retrieve the element by ID or index.
 
@@ -407,18 +405,68 @@ class Elements():
         -------
         element : Element
         """
-        request = meshed_region_pb2.GetRequest()
-        request.mesh.CopyFrom(self._mesh._message)
         if elementindex is None:
-            request.id = elementid
-        else:
-            request.index = elementindex
+            elementindex = self._cached_scoping.index(elementid)
+            if elementindex < 0:
+                raise ValueError(f"element {elementid} is not in the mesh")
+        ids = self._ids
+        if not 0 <= elementindex < ids.size:
+            raise IndexError(f"index {elementindex} is out of range for {ids.size} elements")
+        return Element(self._mesh, int(ids[elementindex]), int(elementindex), None)
 
-        elementOut = self._mesh._stub.GetElement(request)
-        nodesOut = []
-        for node in elementOut.nodes:
-            nodesOut.append(nodes.Node(self._mesh, node.id, node.index, node.coordinates))
-        return Element(self._mesh, elementOut.id, elementOut.index, nodesOut)
+    @property
+    def _cached_scoping(self):
+        """Scoping of the elements, with its IDs kept in the topology cache."""
+        return self._mesh.topology_cache._get("element_scoping", self._fetch_scoping)
+
+    @property
+    def _ids(self):
+        """IDs of all the elements, kept in the topology cache."""
+        return self._mesh.topology_cache._get(
+            "element_ids", lambda: self._cached_scoping._get_ids(np_array=True))
+
+    @property
+    def _types(self):
+        """Type of all the elements, kept in the topology cache."""
+        return self._mesh.topology_cache._get(
+            "element_types", lambda: _read_only(self.element_types_field.data))
+
+    @property
+    def _materials(self):
+        """Material ID of all the elements, kept in the topology cache."""
+        return self._mesh.topology_cache._get(
+            "materials", lambda: _read_only(self.materials_field.data))
+
+    @property
+    def _connectivity(self):
+        """Connectivity of all the elements in the CSR format, kept in the 
+        topology cache.
+        
+        Returns
+        -------
+        node_indices : numpy.ndarray
+            Node indices of all the elements, one element after the other.
+        offsets : numpy.ndarray
+            ``n_elements + 1`` offsets, the node indices of element ``i`` 
+            being ``node_indices[offsets[i]:offsets[i+1]]``.
+        """
+        return self._mesh.topology_cache._get(
+            "connectivity", lambda: nodes._read_csr(self.connectivities_field))
+
+    def _node_indices(self, index):
+        """Node indices of the element at an index, as a view on the connectivity."""
+        node_indices, offsets = self._connectivity
+        return node_indices[offsets[index]:offsets[index + 1]]
+
+    def _fetch_scoping(self):
+        element_scoping = self.scoping
+        element_scoping._load_ids()
+        return element_scoping
+
+    def _invalidate(self):
+        """Drop the arrays cached for the mesh, after elements are added."""
+        self._mesh.topology_cache.invalidate()
+        self._mapping_id_to_index = None
 
     @property
     def scoping(self) -> scoping.Scoping:
@@ -519,7 +567,7 @@ class Elements():
 
     def _build_mapping_id_to_index(self):
         """Retrieve the mapping between the IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return {eid: i for i, eid in enumerate(self._ids.tolist())}
 
     @property
     def mapping_id_to_index(self) -> dict:
@@ -571,10 +619,41 @@ class Elements():
         """
         if external_scope.location in ['Nodal', 'NodalElemental']:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+        indices = self._cached_scoping.indices_of(external_scope._get_ids(np_array=True))
+        mask = indices >= 0
+        return indices[mask], mask
+
+    def neighbors(self, element_indices):
+        """Elements sharing at least one node with some elements.
+
+        The elements of the nodes are found with the nodal connectivity 
+        computed on the client, see :attr:`ansys.dpf.core.nodes.Nodes.nodal_connectivity`.
+
+        Parameters
+        ----------
+        element_indices : list, numpy.ndarray
+            Indices of the elements.
+
+        Returns
+        -------
+        neighbor_indices : numpy.ndarray
+            Sorted indices of the other elements sharing a node with at 
+            least one of the elements.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> elements = model.metadata.meshed_region.elements
+        >>> elements.neighbors([0])
+        array([1, 2, 3, 4, 5, 6, 7])
+
+        """
+        element_indices = np.asarray(element_indices, dtype=np.int64).reshape(-1)
+        node_indices = nodes._gather_csr(*self._connectivity, element_indices)
+        connected = self._mesh.nodes.connected_elements(node_indices[node_indices >= 0])
+        return np.setdiff1d(connected, element_indices, assume_unique=False)
     
     @property
     def has_shell_elements(self) -> bool:
@@ -621,6 +700,25 @@ class Elements():
         return self._mesh._stub.List(self._mesh._message).element_shape_info.has_point_elements
     
 
+def _read_only(data):
+    """Flat read-only array, for the arrays cached by :class:`Elements`."""
+    data = np.asarray(data).reshape(-1)
+    data.flags.writeable = False
+    return data
+
+
+def _element_shape(element_type):
+    """Shape of an element type: ``"solid"``, ``"shell"``, ``"beam"`` or 
+    ``"unknown_shape"``, as given by the server."""
+    try:
+        shape = element_types.shape(element_types(element_type))
+    except (ValueError, AttributeError):
+        shape = None
+    if shape in ("solid", "shell", "beam"):
+        return shape
+    return "unknown_shape"
+
+
 class ElementAdder:
     """Provides for adding new elements in a meshed region.
     
@@ -4,6 +4,8 @@
 Field
 =====
 """
+import threading
+
 import numpy as np
 
 from ansys import dpf
@@ -141,6 +143,35 @@ class Field(_FieldBase):
         return _LocalField(self)  
     
    
+    def get_data(self, dtype=None):
+        """Retrieve the data in the field as an array of the requested precision.
+        
+        Parameters
+        ----------
+        dtype : numpy.float32 or numpy.float64, optional
+            Precision in which the data is streamed from the server and 
+            returned. Requesting ``numpy.float32`` halves the network volume 
+            and the memory used. The default is ``None``, in which case the 
+            server's ``float_dtype`` is used.
+        
+        Returns
+        -------
+        numpy.ndarray
+            Data in the field.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> field = model.results.displacement().outputs.fields_container()[0]
+        >>> field.get_data(np.float32).dtype
+        dtype('float32')
+        
+        """
+        return self._get_data(dtype=dtype)
+        
     @property
     def location(self):
         """Field location.
@@ -165,8 +196,7 @@ class Field(_FieldBase):
         'ElementalNodal'
         
         """
-        if self.field_definition:
-            return self.field_definition.location
+        return self._metadata["location"]
         
     @location.setter
     def location(self, value):
@@ -207,8 +237,7 @@ class Field(_FieldBase):
         :class:`ansys.dpf.core.common.shell_layers`
         
         """
-        if self.field_definition:
-            return self.field_definition.shell_layers
+        return self._metadata["shell_layers"]
         
     @shell_layers.setter
     def shell_layers(self, value):
@@ -286,16 +315,44 @@ class Field(_FieldBase):
         request.size.scoping_size = nentities
         request.size.data_size = datasize
         self._stub.UpdateSize(request)
+        self._invalidate_metadata()
 
     def _load_field_definition(self):
-        """Attempt to load the field definition for this field."""
+        """Attempt to load the field definition for this field.
+        
+        The name of the field, returned by the same request, is kept as well.
+        """
+        self._name = None
         try:
             request=field_pb2.GetRequest()
             request.field.CopyFrom(self._message)
             out = self._stub.GetFieldDefinition(request)
-            return FieldDefinition(out.field_definition, self._server)
         except:
             return
+        self._name = out.name
+        field_definition = FieldDefinition(out.field_definition, self._server)
+        field_definition._owner_metadata = self._metadata_snapshot
+        return field_definition
+
+    def _load_metadata(self):
+        """Retrieve the metadata of the field from the server.
+        
+        On top of the counts, the location, unit, shell layers, and
+        dimensionality are read from a single request on the field definition
+        loaded with the field.
+        
+        Returns
+        -------
+        metadata : dict
+        """
+        metadata = super()._load_metadata()
+        metadata["name"] = self._name
+        if self._field_definition is None:
+            metadata.update(dict.fromkeys(["location", "unit", 
+                                           "shell_layers", "dimensionality"]))
+            return metadata
+        metadata.update(self._field_definition._get_properties())
+        return metadata
 
     @property
     def unit(self):
@@ -317,8 +374,7 @@ class Field(_FieldBase):
         'm'
         
         """
-        if self.field_definition:
-            return self.field_definition.unit
+        return self._metadata["unit"]
         
     @unit.setter
     def unit(self, value):
@@ -353,8 +409,7 @@ class Field(_FieldBase):
         dimensionality : :class:`ansys.dpf.core.dimensionality.Dimensionality`
             Nature and size of the elementary data.
         """
-        if self.field_definition:
-            return self.field_definition.dimensionality
+        return self._metadata["dimensionality"]
         
     @dimensionality.setter
     def dimensionality(self, value):
@@ -365,10 +420,7 @@ class Field(_FieldBase):
     @property
     def name(self):
         """Name of the field."""
-        request = field_pb2.GetRequest()
-        request.field.CopyFrom(self._message)
-        out = self._stub.GetFieldDefinition(request)
-        return out.name
+        return self._metadata["name"]
         
             
     def _set_field_definition(self, field_definition):
@@ -383,6 +435,8 @@ class Field(_FieldBase):
         request.field_def.CopyFrom(field_definition._messageDefinition)
         request.field.CopyFrom(self._message)
         self._stub.UpdateFieldDefinition(request)
+        self._field_definition = self._load_field_definition()
+        self._invalidate_metadata()
            
     @property
     def field_definition(self):
@@ -592,26 +646,61 @@ class Field(_FieldBase):
         
         """
         
+        return self._deep_copy(server, _SupportCopies(server))
+    
+    def _deep_copy(self, server, supports):
+        """Create a deep copy of the field on a given server, sharing the 
+        copies of the supports with other fields.
+        
+        The data is piped chunk by chunk from one server to the other.
+        
+        Parameters
+        ----------
+        server : :class:`ansys.dpf.core.server`
+        supports : _SupportCopies
+            Copies of the supports already made on ``server``.
+        """
         f = Field(nentities=len(self.scoping), location=self.location,nature=self.field_definition.dimensionality.nature, server=server)
         f.scoping = self.scoping.deep_copy(server)
-        f.data = self.data
+        self._copy_data_to(f)
         f.unit = self.unit
         f.location = self.location
        
         try:
-            f._data_pointer = self._data_pointer
+            f.meshed_region = supports.get(self.meshed_region)
         except:
             pass
         try:
-            f.meshed_region = self.meshed_region.deep_copy(server=server)
-        except:
-            pass
-        try:
-            f.time_freq_support = self.time_freq_support.deep_copy(server=server)
+            f.time_freq_support = supports.get(self.time_freq_support)
         except:
             pass
         
         return f
+
+
+class _SupportCopies:
+    """Deep copies of the supports of several fields copied to the same server.
+    
+    Each support, such as a meshed region shared by all the fields of a 
+    fields container, is copied only once. Safe to use from several threads.
+    
+    Parameters
+    ----------
+    server : :class:`ansys.dpf.core.server`
+        Server to copy the supports to.
+    """
+    def __init__(self, server):
+        self._server = server
+        self._copies = {}
+        self._lock = threading.Lock()
+    
+    def get(self, support):
+        """Copy of a meshed region or time frequency support on the server."""
+        key = (type(support).__name__, support._message.SerializeToString())
+        with self._lock:
+            if key not in self._copies:
+                self._copies[key] = support.deep_copy(server=self._server)
+            return self._copies[key]
         
 class _LocalField(_LocalFieldBase,Field):
     """Caches the internal data of a field so that it can be modified locally.
@@ -643,5 +732,7 @@ class _LocalField(_LocalFieldBase,Field):
     """
     
     def __init__(self, field):
+        self._field_definition = field._field_definition
+        self._name = field._name
         super().__init__(field)
         
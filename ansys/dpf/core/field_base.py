@@ -4,6 +4,10 @@ from ansys.dpf.core import scoping
 from ansys.dpf.core.common import natures, locations
 from ansys.dpf.core import errors 
 from ansys.dpf.core import server as serverlib
+from ansys.dpf.core.check_version import server_meet_version
+
+import threading
+import weakref
 
 import numpy as np
 
@@ -82,10 +86,7 @@ class _FieldBase:
         int
             Number of components in each elementary data of the field.
         """
-        request = field_pb2.CountRequest()
-        request.entity = base_pb2.NUM_COMPONENT
-        request.field.CopyFrom(self._message)
-        return self._stub.Count(request).count
+        return self._metadata["component_count"]
     
     @property
     def elementary_data_count(self):
@@ -97,11 +98,54 @@ class _FieldBase:
             Number of elementary data in the field.
         
         """
+        return self._metadata["elementary_data_count"]
+    
+    def _count(self, entity):
         request = field_pb2.CountRequest()
-        request.entity = base_pb2.NUM_ELEMENTARY_DATA
+        request.entity = entity
         request.field.CopyFrom(self._message)
         return self._stub.Count(request).count
     
+    def _load_metadata(self):
+        """Retrieve the metadata of the field from the server.
+        
+        Returns
+        -------
+        metadata : dict
+            Number of components and number of elementary data of the field.
+        """
+        return {"component_count": self._count(base_pb2.NUM_COMPONENT),
+                "elementary_data_count": self._count(base_pb2.NUM_ELEMENTARY_DATA)}
+    
+    @property
+    def _metadata(self):
+        """Snapshot of the field metadata.
+        
+        The snapshot is fetched from the server on first access and kept until 
+        a mutating call, such as setting the data or appending an entity, 
+        invalidates it. It is shared by all the fields wrapping the same 
+        server field, and is also invalidated by modifications of the field's
+        scoping and field definition.
+        """
+        snapshot = self._metadata_snapshot
+        if snapshot.values is None:
+            snapshot.values = self._load_metadata()
+        return snapshot.values
+    
+    @property
+    def _metadata_snapshot(self):
+        snapshot = getattr(self, "_metadata_snapshot_cache", None)
+        if snapshot is None:
+            snapshot = _MetadataSnapshot.of(self._server, self._message)
+            self._metadata_snapshot_cache = snapshot
+        return snapshot
+    
+    def _invalidate_metadata(self):
+        self._metadata_snapshot.values = None
+        cached_scoping = getattr(self, "_scoping_cache", None)
+        if cached_scoping is not None:
+            cached_scoping._invalidate_ids()
+    
     @property
     def size(self):
         """Length of the data vector.
@@ -151,6 +195,9 @@ class _FieldBase:
             self._stub.Delete(self._message)
         except:
             pass
+        snapshot = getattr(self, "_metadata_snapshot_cache", None)
+        if snapshot is not None:
+            _MetadataSnapshot.release(self._server, self._message, snapshot)
 
     def _connect(self):
         """Connect to the gRPC service."""
@@ -168,6 +215,8 @@ class _FieldBase:
         request.scoping.CopyFrom(scoping._message)
         request.field.CopyFrom(self._message)
         self._stub.UpdateScoping(request)
+        self._invalidate_metadata()
+        self._scoping_cache = None
         
     def _get_scoping(self):
         """Retrieve the scoping.
@@ -177,10 +226,13 @@ class _FieldBase:
         scoping : :class:`ansys.dpf.core.scoping.Scoping`
         
         """
-        request = field_pb2.GetRequest()
-        request.field.CopyFrom(self._message)
-        message = self._stub.GetScoping(request)
-        return scoping.Scoping(scoping=message.scoping, server = self._server)
+        if getattr(self, "_scoping_cache", None) is None:
+            request = field_pb2.GetRequest()
+            request.field.CopyFrom(self._message)
+            message = self._stub.GetScoping(request)
+            self._scoping_cache = scoping.Scoping(scoping=message.scoping, server = self._server)
+            self._scoping_cache._owner_metadata = self._metadata_snapshot
+        return self._scoping_cache
 
     @property
     def scoping(self):
@@ -253,14 +305,17 @@ class _FieldBase:
         request = field_pb2.GetElementaryDataRequest()
         request.field.CopyFrom(self._message)
         request.index = index
-        list_message = self._stub.GetElementaryData(request, metadata=[(b'float_or_double', b'double')])
+        data_type, dtype = self._get_data_type()
+        list_message = self._stub.GetElementaryData(request, metadata=[(b'float_or_double', data_type.encode())])
         data = []
         if list_message.elemdata_containers.data.HasField("datadouble"):
             data = list_message.elemdata_containers.data.datadouble.rep_double
         elif list_message.elemdata_containers.data.HasField("dataint"):
             data = list_message.elemdata_containers.data.dataint.rep_int
+        elif list_message.elemdata_containers.data.HasField("datafloat"):
+            data = list_message.elemdata_containers.data.datafloat.rep_float
 
-        array = np.array(data)
+        array = np.array(data, dtype=dtype)
         if self.component_count !=1:
             n_comp = self.component_count
             array = array.reshape((len(data)//n_comp, n_comp))
@@ -307,6 +362,64 @@ class _FieldBase:
             raise ValueError(f'The ID {id} must be greater than 0.')
         return self.get_entity_data(index)
 
+    def get_entities_data(self, indices):
+        """Retrieve the elementary data of several scoping indices at once.
+        
+        The data, and the data pointers of a field with a variable number of 
+        values per entity, are streamed in a single transfer instead of 
+        requesting each entity separately.
+        
+        Parameters
+        ----------
+        indices : list of int or numpy.ndarray
+            Indices of the entities in the scoping.
+        
+        Returns
+        -------
+        numpy.ndarray or tuple
+            For a field without data pointers, the elementary data of the 
+            entities stacked in an array of shape ``(len(indices), n_comp)``.
+            Otherwise, a ``(values, offsets)`` pair, where the data of 
+            the ``i``-th entity is ``values[offsets[i]:offsets[i+1]]``.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> disp = model.results.displacement().outputs.fields_container()[0]
+        >>> disp.get_entities_data([0, 1]).shape
+        (2, 3)
+        >>> stress = model.results.stress().outputs.fields_container()[0]
+        >>> values, offsets = stress.get_entities_data([0, 1])
+        >>> offsets
+        array([ 0,  8, 16])
+        
+        """
+        data_pointer = self._data_pointer
+        return _gather_entities_data(self._get_data(), data_pointer, 
+                                     self.component_count, indices)
+
+    def get_entities_data_by_ids(self, ids):
+        """Retrieve the elementary data of several scoping IDs at once.
+        
+        The scoping IDs are streamed once and looked up on the client.
+        
+        Parameters
+        ----------
+        ids : list of int or numpy.ndarray
+            IDs of the entities in the scoping.
+        
+        Returns
+        -------
+        numpy.ndarray or tuple
+            Stacked elementary data or ``(values, offsets)`` pair, as 
+            returned by :func:`get_entities_data`.
+        """
+        indices = self.scoping.indices_of(ids)
+        scoping._check_found(indices, ids)
+        return self.get_entities_data(indices)
+
     def append(self, data, scopingid):
         """Add an entity data to the existing data.
 
@@ -344,6 +457,52 @@ class _FieldBase:
 
         request.field.CopyFrom(self._message)
         self._stub.AddData(request)
+        self._invalidate_metadata()
+
+    def append_many(self, ids, data, offsets=None):
+        """Add the data of several entities to the existing data.
+        
+        The server has no request to append data, so each call downloads 
+        the whole field, appends the entities locally, and sends the whole 
+        field back. Only the download is skipped when the field is empty.
+        
+        Parameters
+        ----------
+        ids : list of int or numpy.ndarray
+            Scoping IDs of the entities.
+        data : list or numpy.ndarray
+            Data of the entities, flat or with one row per elementary data.
+        offsets : list of int or numpy.ndarray, optional
+            For entities with a variable number of elementary data, 
+            ``len(ids) + 1`` offsets in rows such that the data of the 
+            ``i``-th entity is ``data[offsets[i]:offsets[i+1]]``. The default 
+            is ``None``, in which case each entity holds one elementary data.
+        
+        Notes
+        -----
+        Calling this method in a loop transfers the field once per call. To 
+        append several batches, call ``append_many`` on the field returned 
+        by :func:`as_local_field`, which sends the data once when released.
+                
+        Examples
+        --------
+        >>> from ansys.dpf.core import fields_factory
+        >>> import numpy as np
+        >>> field = fields_factory.create_3d_vector_field(3)
+        >>> field.append_many([1, 2, 3], np.ones((3, 3)))
+        >>> field.scoping.ids
+        [1, 2, 3]
+        
+        Append several batches with a single transfer.
+        
+        >>> with field.as_local_field() as f:
+        ...     for i in range(4, 10, 2):
+        ...         f.append_many([i, i + 1], np.ones((2, 3)))
+        
+        """
+        local_field = self.as_local_field()
+        local_field.append_many(ids, data, offsets)
+        local_field.release_data()
            
     @property
     def _data_pointer(self):
@@ -391,16 +550,15 @@ class _FieldBase:
         
            
     def _set_data_pointer(self,data):
-        if isinstance(data,  (np.ndarray, np.generic)):
-            data = np.array(data.reshape(data.size), dtype=np.int32)
-        else:
-            data = np.array(data, dtype=np.int32)
+        data = np.asarray(data, dtype=np.int32).reshape(-1)
         if data.size ==0:
             return
         metadata=[(u"size_int", f"{len(data)}")]
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(self._message)
-        self._stub.UpdateDataPointer(scoping._data_chunk_yielder(request, data), metadata=metadata)
+        self._stub.UpdateDataPointer(scoping._data_chunk_yielder(request, data, self._server.chunk_size), 
+                                     metadata=metadata)
+        self._invalidate_metadata()
         
         
     @property
@@ -445,15 +603,37 @@ class _FieldBase:
          """
         return self._get_data(np_array=False)
     
-    def _get_data(self, np_array=True):
+    def _get_data_type(self, dtype=None):
+        """Type of the data to request to the server.
+        
+        Parameters
+        ----------
+        dtype : numpy.float32 or numpy.float64, optional
+            Precision of floating point data. The default is ``None``, in 
+            which case the server's ``float_dtype`` is used. Ignored for 
+            integer data.
+        
+        Returns
+        -------
+        data_type : str
+            ``"int"``, ``"float"`` or ``"double"``.
+        dtype : numpy.dtype
+        """
+        if self._message.datatype == u"int":
+            return u"int", np.int32
+        if dtype is None:
+            dtype = self._server.float_dtype
+        dtype = np.dtype(dtype)
+        if dtype == np.float32:
+            return u"float", np.float32
+        elif dtype == np.float64:
+            return u"double", np.float64
+        raise ValueError('dtype must be numpy.float32 or numpy.float64')
+    
+    def _get_data(self, np_array=True, dtype=None):
         request = field_pb2.ListRequest()
         request.field.CopyFrom(self._message)
-        if self._message.datatype == u"int":
-            data_type = u"int"
-            dtype = np.int32
-        else:
-            data_type = u"double"
-            dtype = np.float
+        data_type, dtype = self._get_data_type(dtype)
         service = self._stub.List(request, metadata=[(u"float_or_double", data_type)])
         array= scoping._data_get_chunk_(dtype, service, np_array)
         
@@ -464,6 +644,126 @@ class _FieldBase:
         return array
     
     
+    def read_into(self, out):
+        """Stream the data of the field into an existing array.
+        
+        The data is written chunk by chunk in ``out`` as it arrives, without
+        allocating any other array of the size of the field.
+        
+        Parameters
+        ----------
+        out : numpy.ndarray
+            C-contiguous array, for example a ``numpy.memmap``, with as many
+            values as the field. Its type, ``numpy.float32`` or 
+            ``numpy.float64`` (``numpy.int32`` for property fields), sets 
+            the precision in which the data is streamed.
+        
+        Returns
+        -------
+        numpy.ndarray
+            ``out``, filled with the data of the field.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> field = model.results.displacement().outputs.fields_container()[0]
+        >>> out = np.empty(field.shape, dtype=np.float32)
+        >>> out = field.read_into(out)
+        
+        """
+        data_type, dtype = self._check_out(out)
+        request = field_pb2.ListRequest()
+        request.field.CopyFrom(self._message)
+        service = self._stub.List(request, metadata=[(u"float_or_double", data_type)])
+        return scoping._data_get_chunk_(dtype, service, out=out)
+    
+    def _check_out(self, out):
+        if not isinstance(out, np.ndarray) or not out.flags.c_contiguous:
+            raise ValueError("out must be a C-contiguous numpy array")
+        data_type, dtype = self._get_data_type(out.dtype)
+        if out.dtype != dtype:
+            raise ValueError(f"out must be an array of {np.dtype(dtype).name}")
+        return data_type, dtype
+    
+    def to_memmap(self, path, dtype=None):
+        """Stream the data of the field into a memory-mapped ``.npy`` file.
+        
+        The file can be reopened lazily in a later session with 
+        ``numpy.load(path, mmap_mode="r")``.
+        
+        Parameters
+        ----------
+        path : str
+            Path of the ``.npy`` file to create.
+        dtype : numpy.float32 or numpy.float64, optional
+            Precision of floating point data. The default is ``None``, in 
+            which case the server's ``float_dtype`` is used.
+        
+        Returns
+        -------
+        numpy.memmap
+            Array mapped on the file, with the shape of the field.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> field = model.results.displacement().outputs.fields_container()[0]
+        >>> disp = field.to_memmap("disp.npy")
+        
+        """
+        data_type, dtype = self._get_data_type(dtype)
+        shape = self.shape if self.component_count != 1 else (self.shape,)
+        out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+        self.read_into(out)
+        out.flush()
+        return out
+    
+    def iter_data_chunks(self, max_bytes=2**24, dtype=None):
+        """Iterate over the data of the field by blocks of whole entities.
+        
+        The blocks are yielded while the data is streamed from the server, 
+        so that the field never needs to fit in memory at once.
+        
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Target size in bytes of each block. A block is larger only when 
+            a single entity holds more data. The default is ``2**24``.
+        dtype : numpy.float32 or numpy.float64, optional
+            Precision of floating point data. The default is ``None``, in 
+            which case the server's ``float_dtype`` is used.
+        
+        Yields
+        ------
+        numpy.ndarray
+            Rows of consecutive entities, of shape ``(n_rows, n_comp)``. 
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> field = model.results.displacement().outputs.fields_container()[0]
+        >>> norm_max = max(np.linalg.norm(block, axis=1).max()
+        ...                for block in field.iter_data_chunks(max_bytes=1024))
+        
+        """
+        data_type, dtype = self._get_data_type(dtype)
+        ncomp = self.component_count
+        data_pointer = self._data_pointer
+        request = field_pb2.ListRequest()
+        request.field.CopyFrom(self._message)
+        service = self._stub.List(request, metadata=[(u"float_or_double", data_type)])
+        block_size = max(int(max_bytes)//np.dtype(dtype).itemsize, 1)
+        yield from _iter_entity_blocks(scoping._data_iter_chunks_(dtype, service),
+                                       data_pointer, ncomp, block_size)
+    
     @data.setter
     def data(self, data):
         self._set_data(data)
@@ -472,21 +772,316 @@ class _FieldBase:
         if self._message.datatype == u"int":
             if not isinstance(data[0], int)and not isinstance(data[0], np.int32):
                 raise errors.InvalidTypeError("data", "list of int")
-            data = np.array(data, dtype=np.int32)
+            data = np.asarray(data, dtype=np.int32).reshape(-1)
             metadata=[(u"size_int", f"{len(data)}")]
         else:
             if isinstance(data,  (np.ndarray, np.generic)):
                 if 0 != self.size and self.component_count >1 and data.size//self.component_count != data.size/self.component_count:
                     raise ValueError(f'An array of shape {self.shape} is expected and shape {data.shape} is in input')
-                else:
-                    data = np.array(data.reshape(data.size), dtype=float)
-            else:
-                data = np.array(data, dtype=float)
+            data = np.asarray(data, dtype=float).reshape(-1)
             metadata=[(u"float_or_double", u"double"), (u"size_double", f"{len(data)}")]
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(self._message)
-        self._stub.UpdateData(scoping._data_chunk_yielder(request, data), metadata=metadata)
+        self._stub.UpdateData(scoping._data_chunk_yielder(request, data, self._server.chunk_size), 
+                              metadata=metadata)
+        self._invalidate_metadata()
+    
+    def _copy_data_to(self, field):
+        """Pipe the data and data pointer of this field into another field, 
+        possibly on another server.
+        
+        Each chunk received from this field's server is sent to the other 
+        server as soon as it arrives, so that the data is never fully held 
+        on the client.
+        
+        Parameters
+        ----------
+        field : _FieldBase
+            Field with the same type of data.
+        """
+        request = field_pb2.ListRequest()
+        request.field.CopyFrom(self._message)
+        update = field_pb2.UpdateDataRequest()
+        update.field.CopyFrom(field._message)
+        
+        if self._message.datatype == u"int":
+            service = self._stub.List(request, metadata=[(u"float_or_double", u"int")])
+            size = scoping._stream_size(service)//np.dtype(np.int32).itemsize
+            metadata=[(u"size_int", f"{size}")]
+        else:
+            service = self._stub.List(request, metadata=[(u"float_or_double", u"double")])
+            size = scoping._stream_size(service)//np.dtype(np.float64).itemsize
+            metadata=[(u"float_or_double", u"double"), (u"size_double", f"{size}")]
+        field._stub.UpdateData(scoping._data_forwarder(service, update), metadata=metadata)
+        
+        try:
+            service = self._stub.ListDataPointer(request)
+            size = scoping._stream_size(service)//np.dtype(np.int32).itemsize
+            if size > 0:
+                field._stub.UpdateDataPointer(scoping._data_forwarder(service, update), 
+                                              metadata=[(u"size_int", f"{size}")])
+        except:
+            pass
+        field._invalidate_metadata()
+    
+
+def _gather_entities_data(data, data_pointer, ncomp, indices):
+    """Gather the elementary data of several entities.
+    
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Data of the field.
+    data_pointer : numpy.ndarray
+        First index of each entity data in the flat data, or an empty 
+        array if each entity holds ``ncomp`` values.
+    ncomp : int
+        Number of components.
+    indices : list of int or numpy.ndarray
+        Indices of the entities to gather.
+    
+    Returns
+    -------
+    numpy.ndarray or tuple
+        Stacked rows when ``data_pointer`` is empty, ``(values, offsets)`` 
+        otherwise, with ``offsets`` counted in rows.
+    """
+    data = np.asarray(data).reshape(-1)
+    data_pointer = np.asarray(data_pointer, dtype=np.int64).reshape(-1)
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+    n_entities = data_pointer.size if data_pointer.size > 0 else data.size // ncomp
+    if indices.size > 0 and (indices.min() < 0 or indices.max() >= n_entities):
+        raise ValueError(f"indices must be in [0, {n_entities}[")
+    
+    if data_pointer.size == 0:
+        rows = data.reshape(-1, ncomp)[indices]
+        return rows if ncomp != 1 else rows.reshape(-1)
+    
+    starts = data_pointer[indices]
+    lengths = np.append(data_pointer[1:], data.size)[indices] - starts
+    offsets = np.zeros(indices.size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    # position of each gathered value in the flat data
+    positions = np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], lengths)
+    values = data[positions]
+    if ncomp != 1:
+        return values.reshape(-1, ncomp), offsets // ncomp
+    return values, offsets
+
+
+def _iter_entity_blocks(chunks, data_pointer, ncomp, block_size, copy=True):
+    """Regroup streamed data chunks into blocks of whole entities.
+    
+    Parameters
+    ----------
+    chunks : iterable of numpy.ndarray
+        Consecutive parts of the flat data of a field.
+    data_pointer : numpy.ndarray
+        First index of each entity data in the flat data, or an empty 
+        array if each entity holds ``ncomp`` values.
+    ncomp : int
+        Number of components.
+    block_size : int
+        Target number of values in each block. A block is larger when a 
+        single entity holds more values.
+    copy : bool, optional
+        Whether blocks lying in a single chunk are copied. When ``False``, 
+        these blocks are views on the chunk.
+    
+    Yields
+    ------
+    numpy.ndarray
+        Rows of consecutive entities.
+    """
+    data_pointer = np.asarray(data_pointer, dtype=np.int64).reshape(-1)
+    
+    def next_cut(start):
+        # last entity boundary before start + block_size, or the end of the entity 
+        # starting at start if it is larger than block_size
+        limit = start + block_size
+        if data_pointer.size == 0:
+            cut = limit - limit % ncomp
+            return cut if cut > start else start + ncomp
+        i = np.searchsorted(data_pointer, limit, side="right") - 1
+        if data_pointer[i] > start:
+            return data_pointer[i]
+        i = np.searchsorted(data_pointer, start, side="right")
+        return data_pointer[i] if i < data_pointer.size else np.inf
+    
+    def as_rows(block):
+        return block.reshape(-1, ncomp) if ncomp != 1 else block
+    
+    pending = []
+    n_pending = 0
+    start = 0 # index in the flat data of the first pending value
+    for chunk in chunks:
+        pending.append(chunk)
+        n_pending += chunk.size
+        if n_pending < block_size:
+            continue
+        values = np.concatenate(pending) if copy or len(pending) > 1 else pending[0]
+        offset = 0
+        while values.size - offset >= block_size:
+            cut = next_cut(start)
+            if cut > start + values.size - offset:
+                break
+            yield as_rows(values[offset:offset + cut - start])
+            offset += cut - start
+            start = cut
+        pending = [values[offset:]]
+        n_pending = values.size - offset
+    if n_pending > 0:
+        yield as_rows(np.concatenate(pending) if copy or len(pending) > 1 else pending[0])
+
+
+class _MetadataSnapshot:
+    """Metadata of a server field, shared by all the fields wrapping it.
+    
+    ``values`` is ``None`` until the metadata is loaded, and is reset to 
+    ``None`` to invalidate it.
+    """
+    __slots__ = ("values", "__weakref__")
+    
+    _instances = weakref.WeakValueDictionary()
+    # the fields are also created and deleted by the worker threads of 
+    # the data transfers
+    _lock = threading.Lock()
+    
+    def __init__(self):
+        self.values = None
+    
+    @classmethod
+    def of(cls, server, message):
+        """Snapshot of a server field, shared while a field wraps it."""
+        key = (id(server), message.id.id)
+        with cls._lock:
+            snapshot = cls._instances.get(key)
+            if snapshot is None:
+                snapshot = cls()
+                cls._instances[key] = snapshot
+            return snapshot
+    
+    @classmethod
+    def release(cls, server, message, snapshot):
+        """Stop sharing the snapshot of a deleted field, so that a field 
+        reusing its ID on the server does not get it."""
+        key = (id(server), message.id.id)
+        with cls._lock:
+            if cls._instances.get(key) is snapshot:
+                del cls._instances[key]
+
+
+_BLOCK_SIZE = 16
+# largest number of modified entities sent with one unary request each, 
+# beyond which the whole data is streamed
+_MAX_ENTITY_UPDATES = 16
+# first server version updating the data of a single entity
+_UPDATE_ELEMENTARY_DATA_VERSION = "3.0"
+_MIX_PRIMES = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xBF58476D1CE4E5B9), 
+               np.uint64(0x94D049BB133111EB))
+
+
+def _block_checksums(values):
+    """64-bit checksum of each block of ``_BLOCK_SIZE`` consecutive values.
+    
+    The bit pattern of each value, offset by its position in the block, 
+    goes through the non-linear mixing function of ``splitmix64`` before 
+    being summed modulo ``2**64``, so that sign changes, swaps, and other 
+    ordinary modifications change the checksum of their block except with 
+    a probability of about ``2**-64``. The checksums are computed by slices 
+    to bound the temporary memory.
     
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values with an item size of 4 or 8 bytes.
+    
+    Returns
+    -------
+    numpy.ndarray
+        Checksums as ``numpy.uint64``.
+    """
+    values = np.ascontiguousarray(values).reshape(-1)
+    words = values.view(np.uint64 if values.itemsize == 8 else np.uint32)
+    n_blocks = -(-words.size // _BLOCK_SIZE)
+    checksums = np.empty(n_blocks, dtype=np.uint64)
+    golden, first, second = _MIX_PRIMES
+    positions = np.arange(1, _BLOCK_SIZE + 1, dtype=np.uint64) * golden
+    step = _BLOCK_SIZE * 2**16
+    with np.errstate(over="ignore"):
+        for start in range(0, words.size, step):
+            part = words[start:start + step].astype(np.uint64)
+            padding = -part.size % _BLOCK_SIZE
+            if padding:
+                part = np.append(part, np.zeros(padding, dtype=np.uint64))
+            part = part.reshape(-1, _BLOCK_SIZE) + positions
+            part = (part ^ (part >> np.uint64(30))) * first
+            part = (part ^ (part >> np.uint64(27))) * second
+            part ^= part >> np.uint64(31)
+            first_block = start // _BLOCK_SIZE
+            checksums[first_block:first_block + part.shape[0]] = part.sum(axis=1, dtype=np.uint64)
+    return checksums
+
+
+class _GrowableArray:
+    """Contiguous typed buffer with amortized growth.
+    
+    The capacity of the underlying array is doubled each time it is exceeded,
+    so that appending ``n`` values costs ``O(n)`` in total. Views returned by
+    :attr:`view` are not copies, but they stop reflecting the buffer once it 
+    is reallocated by a growth.
+    
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Type of the values stored.
+    values : array_like, optional
+        Initial content of the buffer.
+    """
+    
+    def __init__(self, dtype, values=None):
+        self._buffer = np.empty(0, dtype=dtype)
+        self._size = 0
+        if values is not None:
+            self.set(values)
+    
+    def __len__(self):
+        return self._size
+    
+    @property
+    def view(self):
+        """Filled part of the buffer as a numpy view."""
+        return self._buffer[:self._size]
+    
+    def reserve(self, capacity):
+        """Make room for at least ``capacity`` values."""
+        if capacity > self._buffer.size:
+            buffer = np.empty(max(capacity, 2*self._buffer.size, 16), dtype=self._buffer.dtype)
+            buffer[:self._size] = self._buffer[:self._size]
+            self._buffer = buffer
+    
+    def set(self, values):
+        """Replace the content of the buffer by ``values``."""
+        values = np.asarray(values, dtype=self._buffer.dtype).reshape(-1)
+        self._size = 0
+        self.reserve(values.size)
+        self._buffer[:values.size] = values
+        self._size = values.size
+    
+    def extend(self, values):
+        """Append ``values`` at the end of the buffer."""
+        values = np.asarray(values, dtype=self._buffer.dtype).reshape(-1)
+        end = self._size + values.size
+        self.reserve(end)
+        self._buffer[self._size:end] = values
+        self._size = end
+    
+    def append(self, value):
+        """Append a single value at the end of the buffer."""
+        self.reserve(self._size + 1)
+        self._buffer[self._size] = value
+        self._size += 1
+
 
 class _LocalFieldBase(_FieldBase):
     """Caches the internal data of the field so that it can be modified locally.
@@ -509,12 +1104,52 @@ class _LocalFieldBase(_FieldBase):
         
     def __cache_data__(self):
         self._ncomp = super().component_count
-        self._data_copy = super().data_as_list
-        self._num_entities_reserved = len(self._data_copy)
-        self._data_pointer_copy = super()._data_pointer_as_list
-        self._scoping_ids_copy = super().scoping.ids
+        dtype = np.int32 if self._is_property_field else np.float64
+        # nothing to download when the field is built from scratch
+        empty = super().elementary_data_count == 0
+        # always in full precision, whatever the server's float_dtype
+        self._data_copy = _GrowableArray(
+            dtype, None if empty else super()._get_data(dtype=dtype))
+        self._data_pointer_copy = _GrowableArray(
+            np.int32, None if empty else super()._data_pointer)
+        self._scoping_ids_copy = _GrowableArray(np.int32, super().scoping.ids)
         self._num_entities = len(self._scoping_ids_copy)
-        self._has_data_pointer = len(self._data_pointer_copy)>0
+        self._id_to_index = None
+        self._take_snapshot()
+        
+    def _take_snapshot(self):
+        """Record the size and block checksums of the local data, data 
+        pointers and scoping IDs, against which modifications are detected 
+        on release. The checksums use one sixteenth of the memory of the 
+        data in double precision."""
+        self._snapshot = {name: (len(buffer), _block_checksums(buffer.view)) 
+                          for name, buffer in self._buffers().items()}
+        
+    def _buffers(self):
+        return {"data": self._data_copy, 
+                "data_pointer": self._data_pointer_copy, 
+                "scoping_ids": self._scoping_ids_copy}
+    
+    def _changed_blocks(self):
+        """Find what was modified since the last snapshot.
+        
+        Modifications made through the views returned by ``data``, 
+        ``get_entity_data`` or ``_data_pointer`` are detected as well.
+        
+        Returns
+        -------
+        dict
+            For each buffer, ``None`` if its size changed, otherwise the 
+            indices of its modified blocks of ``_BLOCK_SIZE`` values.
+        """
+        changes = {}
+        for name, buffer in self._buffers().items():
+            size, checksums = self._snapshot[name]
+            if len(buffer) != size:
+                changes[name] = None
+            else:
+                changes[name] = np.flatnonzero(_block_checksums(buffer.view) != checksums)
+        return changes
     
     @property
     def size(self):
@@ -566,21 +1201,19 @@ class _LocalFieldBase(_FieldBase):
            1.52268930e+07  6.09583280e+07]]
         
         """
-        if index > self._num_entities:
-            raise ValueError(f"asked scoping {index} is greater than the number of available indices {len(self._scoping_ids_copy)}")
-        if self._has_data_pointer:
-            first_index = self._data_pointer_copy[index]
-            if index < len(self._data_pointer_copy) -1:
-                last_index =  self._data_pointer_copy[index+1]-1
+        if index >= self._num_entities:
+            raise ValueError(f"asked scoping {index} is greater than the number of available indices {self._num_entities}")
+        data_pointer = self._data_pointer_copy.view
+        if data_pointer.size > 0:
+            first_index = data_pointer[index]
+            if index < data_pointer.size -1:
+                last_index = data_pointer[index+1]
             else:
-                last_index = len(self._data_copy)-1
+                last_index = len(self._data_copy)
         else:
             first_index = self._ncomp * index
-            last_index = self._ncomp * (index+1)-1
-        if self._is_property_field:
-            array = np.array(self._data_copy[first_index:last_index+1], dtype=np.int32)
-        else:
-            array = np.array(self._data_copy[first_index:last_index+1])
+            last_index = self._ncomp * (index+1)
+        array = self._data_copy.view[first_index:last_index]
             
         if self._ncomp>1:
             return array.reshape((array.size//self._ncomp,self._ncomp))
@@ -624,11 +1257,51 @@ class _LocalFieldBase(_FieldBase):
            7.69014221e+02  4.90502930e+02]]
 
         """
-        index = self._scoping_ids_copy.index(id)
+        if self._id_to_index is None:
+            ids = self._scoping_ids_copy.view
+            # reversed so that the first occurrence of an ID wins
+            self._id_to_index = dict(zip(ids[::-1].tolist(), range(ids.size-1, -1, -1)))
+        index = self._id_to_index.get(id, -1)
         if index < 0:
             raise ValueError(f"The id {id} doesn't exist in the scoping")
         return self.get_entity_data(index)
     
+    def get_entities_data(self, indices):
+        """Retrieve the elementary data of several scoping indices at once.
+        
+        Parameters
+        ----------
+        indices : list of int or numpy.ndarray
+            Indices of the entities in the scoping.
+        
+        Returns
+        -------
+        numpy.ndarray or tuple
+            For a field without data pointers, the elementary data of the 
+            entities stacked in an array of shape ``(len(indices), n_comp)``.
+            Otherwise, a ``(values, offsets)`` pair, where the data of 
+            the ``i``-th entity is ``values[offsets[i]:offsets[i+1]]``.
+        """
+        return _gather_entities_data(self._data_copy.view, self._data_pointer_copy.view,
+                                     self._ncomp, indices)
+    
+    def get_entities_data_by_ids(self, ids):
+        """Retrieve the elementary data of several scoping IDs at once.
+        
+        Parameters
+        ----------
+        ids : list of int or numpy.ndarray
+            IDs of the entities in the scoping.
+        
+        Returns
+        -------
+        numpy.ndarray or tuple
+            Stacked elementary data or ``(values, offsets)`` pair, as 
+            returned by :func:`get_entities_data`.
+        """
+        indices = scoping._ids_to_indices(self._scoping_ids_copy.view, ids)
+        return self.get_entities_data(indices)
+    
     def append(self, data, scopingid):
         """Add an entity data to the existing data.
 
@@ -649,30 +1322,64 @@ class _LocalFieldBase(_FieldBase):
         ...         f.append([[0.1*i,0.2*i, 0.3*i],[0.1*i,0.2*i, 0.3*i]],i)
                     
         """
+        data = np.asarray(data)
         if self._is_property_field:
-            if isinstance(data[0], np.int64):
-                data = np.array(data, dtype=np.int32)
-            if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
+            if data.size > 0 and not np.issubdtype(data.dtype, np.integer):
                 raise errors.InvalidTypeError("data", "list of int")
-        if (len(data)>0 and isinstance(data, list)) or isinstance(data,  (np.ndarray, np.generic)):
-                data=np.array(data).flatten().tolist()
             
-        data_size =len(self._data_copy)      
-        self._scoping_ids_copy.append(scopingid)
-        if len(self._data_pointer_copy)>0:
-            self._data_pointer_copy.append(data_size)
+        if len(self._data_pointer_copy)>0 or data.size != self._ncomp:
+            if len(self._data_pointer_copy) == 0:
+                # all the entities added so far have ncomp values
+                self._data_pointer_copy.extend(np.arange(self._num_entities)*self._ncomp)
+            self._data_pointer_copy.append(len(self._data_copy))
 
         self._data_copy.extend(data)
+        self._scoping_ids_copy.append(scopingid)
+        if self._id_to_index is not None:
+            self._id_to_index.setdefault(scopingid, self._num_entities)
         self._num_entities+=1
-        if self._has_data_pointer==False:
-            if isinstance(data,  (np.ndarray, np.generic)):
-                data_size = data.size
-            else:
-                data_size=len(data)
-            if data_size>self._ncomp:
-                self._data_pointer_copy=[i*self._ncomp for i in range(0,self._num_entities) ]
-                self._has_data_pointer=True   
+    
+    def append_many(self, ids, data, offsets=None):
+        """Add the data of several entities to the existing data.
+
+        Parameters
+        ----------
+        ids : list of int or numpy.ndarray
+            Scoping IDs of the entities.
+        data : list or numpy.ndarray
+            Data of the entities, flat or with one row per elementary data.
+        offsets : list of int or numpy.ndarray, optional
+            For entities with a variable number of elementary data, 
+            ``len(ids) + 1`` offsets in rows such that the data of the 
+            ``i``-th entity is ``data[offsets[i]:offsets[i+1]]``. The default 
+            is ``None``, in which case each entity holds one elementary data.
+        """
+        ids = np.asarray(ids).reshape(-1)
+        data = np.asarray(data).reshape(-1)
+        if self._is_property_field:
+            if data.size > 0 and not np.issubdtype(data.dtype, np.integer):
+                raise errors.InvalidTypeError("data", "list of int")
+        if offsets is None:
+            offsets = np.arange(ids.size+1)
+        offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+        if offsets.size != ids.size+1 or offsets[0] != 0 or np.any(np.diff(offsets) < 0):
+            raise ValueError("offsets must be non decreasing, start at 0 and have one more value than ids")
+        if offsets[-1]*self._ncomp != data.size:
+            raise ValueError(f"{offsets[-1]*self._ncomp} values are expected in data and {data.size} are in input")
+            
+        data_pointer = offsets[:-1]*self._ncomp + len(self._data_copy)
+        if len(self._data_pointer_copy)>0 or np.any(np.diff(offsets) != 1):
+            if len(self._data_pointer_copy) == 0:
+                # all the entities added so far have ncomp values
+                self._data_pointer_copy.extend(np.arange(self._num_entities)*self._ncomp)
+            self._data_pointer_copy.extend(data_pointer)
+        
+        self._data_copy.extend(data)
+        self._scoping_ids_copy.extend(ids)
+        self._num_entities += ids.size
+        self._id_to_index = None
                 
+    @property
     def data_as_list(self):
         """Retrieve the data in the field as a Python list.
 
@@ -694,12 +1401,15 @@ class _LocalFieldBase(_FieldBase):
         ...     my_data_list = f.data_as_list
          
         """
-        return self._data_copy   
+        return self._data_copy.view.tolist()
     
      
     @property
     def data(self):
         """Data in the field.
+        
+        The returned array is a view on the local data: modifying it modifies 
+        the local field.
 
         Returns
         -------
@@ -725,28 +1435,65 @@ class _LocalFieldBase(_FieldBase):
          [ 1.03542516e-02 -3.53018374e-03 -3.98914380e-05]]
         
         """
-        
+        data = self._data_copy.view
         if self._ncomp>1:
-            return np.array(self._data_copy).reshape(len(self._data_copy)//self._ncomp,self._ncomp)
+            return data.reshape(data.size//self._ncomp,self._ncomp)
         else:
-            return np.array(self._data_copy)
+            return data
         
     
+    def read_into(self, out):
+        """Copy the local data of the field into an existing array.
+        
+        Parameters
+        ----------
+        out : numpy.ndarray
+            C-contiguous array with as many values as the field.
+        
+        Returns
+        -------
+        numpy.ndarray
+            ``out``, filled with the data of the field.
+        """
+        self._check_out(out)
+        data = self._data_copy.view
+        if out.size != data.size:
+            raise ValueError(f"out has {out.size} values while the field has {data.size}")
+        out.reshape(-1)[:] = data
+        return out
+        
+    def iter_data_chunks(self, max_bytes=2**24, dtype=None):
+        """Iterate over the local data of the field by blocks of whole entities.
+        
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Target size in bytes of each block. The default is ``2**24``.
+        dtype : optional
+            Unused, the blocks have the type of the local data.
+        
+        Yields
+        ------
+        numpy.ndarray
+            Rows of consecutive entities, as views on the local data.
+        """
+        data = self._data_copy.view
+        block_size = max(int(max_bytes)//data.itemsize, 1)
+        yield from _iter_entity_blocks([data], self._data_pointer_copy.view, 
+                                       self._ncomp, block_size, copy=False)
+        
     @data.setter
     def data(self, data):
         if self._is_property_field:
-            if not isinstance(data[0], int)and not isinstance(data[0], np.int32):
+            data = np.asarray(data)
+            if data.size > 0 and not np.issubdtype(data.dtype, np.integer):
                 raise errors.InvalidTypeError("data", "list of int")
         else:
             if isinstance(data,  (np.ndarray, np.generic)):
-                if data.shape !=  self.shape and 0 != self.size:
+                shape = self.shape if self._ncomp != 1 else (self.shape,)
+                if data.shape != shape and 0 != self.size:
                     raise ValueError(f'An array of shape {self.shape} is expected and shape {data.shape} is in input')
-        if isinstance(data,  (np.ndarray, np.generic)):
-            self._data_copy = data.flatten().tolist()
-        elif len(data)>0 and isinstance(data, list):
-            self._data_copy=np.array(data).flatten().tolist()
-        else:
-            self._data_copy = data
+        self._data_copy.set(data)
         
         
     @property
@@ -760,7 +1507,7 @@ class _LocalFieldBase(_FieldBase):
            
         """
         if (hasattr(self, "_data_copy")):
-            return len(self._data_copy) / self._ncomp
+            return len(self._data_copy) // self._ncomp
         else:
             return super().elementary_data_count
     
@@ -787,7 +1534,7 @@ class _LocalFieldBase(_FieldBase):
         numpy.ndarray
             Array of first indexes of each entity data.
         """
-        return np.array(self._data_pointer_copy)
+        return self._data_pointer_copy.view
     
     @property
     def _data_pointer_as_list(self):
@@ -798,17 +1545,12 @@ class _LocalFieldBase(_FieldBase):
         List 
             List of first indexes of each entity data.
         """
-        return self._data_pointer_copy
+        return self._data_pointer_copy.view.tolist()
     
     
     @_data_pointer.setter
     def _data_pointer(self, data):
-        if isinstance(data,  (np.ndarray, np.generic)):
-            self._data_pointer_copy = data.tolist()
-        else:
-            self._data_pointer_copy = data
-        if self._has_data_pointer == False and len(data)>0:
-            self._has_data_pointer=True
+        self._data_pointer_copy.set(data)
     
     @property
     def scoping_ids(self):
@@ -816,22 +1558,95 @@ class _LocalFieldBase(_FieldBase):
         
         Returns
         -------
-        list
-            List of integers representing the scoping IDs of the field. 
+        numpy.ndarray
+            Array of integers representing the scoping IDs of the field. 
         """
-        return self._scoping_ids_copy
+        return self._scoping_ids_copy.view
     
     @scoping_ids.setter
     def scoping_ids(self, data):
-        self._scoping_ids_copy =data
-        self._num_entities =len(data)
+        self._scoping_ids_copy.set(data)
+        self._num_entities =len(self._scoping_ids_copy)
+        self._id_to_index = None
     
         
     def release_data(self):
-        """Release the data."""
-        super()._set_data(self._data_copy)
-        super()._set_data_pointer(self._data_pointer_copy)
-        super().scoping.ids = self._scoping_ids_copy
+        """Release the data.
+        
+        Only the data, data pointers, and scoping IDs modified since the field
+        was copied locally, or since the last release, are sent to the server.
+        When a few entities of the data are modified in place, only these 
+        entities are updated.
+        """
+        changes = self._changed_blocks()
+        def changed(name):
+            return changes[name] is None or changes[name].size > 0
+        
+        if changed("data"):
+            if changes["data"] is None or changed("data_pointer") \
+                    or not self._update_entities_data(changes["data"]):
+                super()._set_data(self._data_copy.view)
+        if changed("data_pointer"):
+            super()._set_data_pointer(self._data_pointer_copy.view)
+        if changed("scoping_ids"):
+            super().scoping.ids = self._scoping_ids_copy.view
+        self._take_snapshot()
+        self._owner_field._invalidate_metadata()
+        
+    def _update_entities_data(self, blocks):
+        """Send the data of the entities overlapping modified blocks with one 
+        request per entity.
+        
+        Parameters
+        ----------
+        blocks : numpy.ndarray
+            Indices of the modified blocks of ``_BLOCK_SIZE`` values.
+        
+        Returns
+        -------
+        bool
+            ``False`` if nothing was sent because more than 
+            ``_MAX_ENTITY_UPDATES`` entities are modified, or because the 
+            server does not support it.
+        """
+        if not server_meet_version(_UPDATE_ELEMENTARY_DATA_VERSION, self._server):
+            return False
+        data = self._data_copy.view
+        data_pointer = self._data_pointer_copy.view
+        starts = blocks * _BLOCK_SIZE
+        stops = np.minimum(starts + _BLOCK_SIZE, data.size)
+        if data_pointer.size > 0:
+            n_entities = data_pointer.size
+            first = np.searchsorted(data_pointer, starts, side="right") - 1
+            last = np.searchsorted(data_pointer, stops, side="left")
+        else:
+            n_entities = data.size // self._ncomp
+            first = starts // self._ncomp
+            last = -(-stops // self._ncomp)
+        # mark the entities of each [first, last[ range
+        marks = np.zeros(n_entities + 1, dtype=np.int64)
+        np.add.at(marks, first, 1)
+        np.add.at(marks, last, -1)
+        entities = np.flatnonzero(np.cumsum(marks)[:n_entities] > 0)
+        
+        # each unary request costs a round trip
+        if entities.size > _MAX_ENTITY_UPDATES:
+            return False
+        
+        scoping_ids = self._scoping_ids_copy.view
+        for index in entities.tolist():
+            request = field_pb2.UpdateElementaryDataRequest()
+            request.field.CopyFrom(self._message)
+            request.elemdata_containers.scoping_index = index
+            if index < scoping_ids.size:
+                request.elemdata_containers.scoping_id = int(scoping_ids[index])
+            values = self.get_entity_data(index).reshape(-1)
+            if self._is_property_field:
+                request.elemdata_containers.data.dataint.rep_int.extend(values)
+            else:
+                request.elemdata_containers.data.datadouble.rep_double.extend(values)
+            self._stub.UpdateElementaryData(request)
+        return True
         
     def __enter__(self):
         return self
@@ -34,6 +34,7 @@ class FieldDefinition:
         else:
             request = base_pb2.Empty()
             self._messageDefinition = self._stub.Create(request)
+        self._owner_metadata = None
             
     @property
     def location(self):
@@ -121,6 +122,24 @@ class FieldDefinition:
             else:                
                 request.shell_layers = shell_layer+1
         self._stub.Update(request)
+        if self._owner_metadata is not None:
+            self._owner_metadata.values = None
+        
+    
+    def _get_properties(self):
+        """Retrieve the location, unit, shell layers, and dimensionality 
+        with a single request.
+        
+        Returns
+        -------
+        properties : dict
+        """
+        out = self._stub.List(self._messageDefinition)
+        dim = out.dimensionnality # typo exists on server side
+        return {"location": out.location.location,
+                "unit": out.unit.symbol,
+                "shell_layers": shell_layers(out.shell_layers.real-1),
+                "dimensionality": Dimensionality(list(dim.size), natures(dim.nature.real))}
         
     
     def __del__(self):
@@ -9,6 +9,11 @@ from ansys import dpf
 from ansys.dpf.core.collection import Collection
 from ansys.dpf.core.common import types
 from ansys.dpf.core import errors as dpf_errors
+from ansys.dpf.core.field import _SupportCopies
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
 
 class FieldsContainer(Collection):
@@ -416,10 +421,12 @@ class FieldsContainer(Collection):
         return super()._set_time_freq_support(value)
     
     
-    def deep_copy(self, server=None):
+    def deep_copy(self, server=None, max_workers=4):
         """Create a deep copy of the fields container's data (and its fields) on a given server.
         
         This method is useful for passing data from one server instance to another.
+        The fields are copied concurrently, each one being piped chunk by chunk 
+        from one server to the other, and their supports are copied only once.
         
         Parameters
         ----------
@@ -427,6 +434,8 @@ class FieldsContainer(Collection):
             Server with the channel connected to the remote or local instance. 
             The default is ``None``, in which case an attempt is made to use the 
             global server.
+        max_workers : int, optional
+            Maximum number of fields copied at the same time. The default is ``4``.
         
         Returns
         -------
@@ -447,10 +456,13 @@ class FieldsContainer(Collection):
         """
         fc = FieldsContainer(server=server)
         fc.labels= self.labels
-        for i,f in enumerate(self):
-            fc.add_field(self.get_label_space(i),f.deep_copy(server))        
+        supports = _SupportCopies(server)
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            copies = list(executor.map(lambda f: f._deep_copy(server, supports), self))
+        for i,f in enumerate(copies):
+            fc.add_field(self.get_label_space(i),f)        
         try:
-            fc.time_freq_support = self.time_freq_support.deep_copy(server)
+            fc.time_freq_support = supports.get(self.time_freq_support)
         except:
             pass
         return fc
@@ -465,6 +477,134 @@ class FieldsContainer(Collection):
         """
         return self.get_label_scoping("time")
     
+    def iter_data(self, prefetch=2, dtype=None):
+        """Iterate over the fields with their data, downloading the data of 
+        the next fields in the background.
+        
+        The data of up to ``prefetch`` fields following the current one is 
+        requested on background threads, over the same channel, while the 
+        current field is processed. At most ``prefetch + 1`` arrays are 
+        therefore held at any time.
+        
+        Parameters
+        ----------
+        prefetch : int, optional
+            Number of fields downloaded ahead. The default is ``2``. With 
+            ``0``, the data is downloaded when each field is reached.
+        dtype : numpy.float32 or numpy.float64, optional
+            Precision of floating point data. The default is ``None``, in 
+            which case the server's ``float_dtype`` is used.
+        
+        Yields
+        ------
+        field : Field
+            Field of the container, in the container's order.
+        data : numpy.ndarray
+            Data of the field.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> transient = examples.download_transient_result()
+        >>> model = dpf.Model(transient)
+        >>> disp = model.results.displacement.on_all_time_freqs()
+        >>> fields_container = disp.outputs.fields_container()
+        >>> maxima = [data.max() for field, data in fields_container.iter_data(prefetch=4)]
+        
+        """
+        fields = list(self)
+        if prefetch < 1:
+            for field in fields:
+                yield field, field._get_data(dtype=dtype)
+            return
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque()
+            try:
+                for i, field in enumerate(fields):
+                    while len(pending) <= prefetch and i + len(pending) < len(fields):
+                        pending.append(executor.submit(fields[i + len(pending)]._get_data, 
+                                                       dtype=dtype))
+                    yield field, pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+    
+    def to_numpy(self, label="time", label_space=None, dtype=np.float64):
+        """Stack the data of the fields into a single array.
+        
+        The fields are aligned on a common scoping, which is the union of 
+        their scopings, and their data is streamed directly into the 
+        preallocated array.
+        
+        Parameters
+        ----------
+        label : str, optional
+            Label along which the fields are stacked. The default is ``"time"``.
+        label_space : dict[str,int], optional
+            Values of the other labels, used to select one field per ID of 
+            ``label``. For example, ``{"complex": 0}``. The default is ``None``.
+        dtype : numpy.float32 or numpy.float64, optional
+            Precision of the array. The default is ``numpy.float64``.
+        
+        Returns
+        -------
+        data : numpy.ndarray
+            Array of shape ``(n_sets, n_entities, n_comp)``, with ``NaN`` 
+            where an entity is not in the scoping of a field.
+        label_ids : numpy.ndarray
+            ID of ``label`` for each set.
+        entity_ids : numpy.ndarray
+            ID of each entity.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> transient = examples.download_transient_result()
+        >>> model = dpf.Model(transient)
+        >>> disp = model.results.displacement.on_all_time_freqs()
+        >>> fields_container = disp.outputs.fields_container()
+        >>> data, time_ids, node_ids = fields_container.to_numpy()
+        
+        """
+        label_space = dict(label_space or {})
+        label_ids = []
+        fields = []
+        for label_id in sorted(self.get_available_ids_for_label(label)):
+            label_space[label] = label_id
+            entries = self.get_fields(label_space)
+            if entries is None:
+                continue
+            if len(entries) > 1:
+                raise ValueError(f"{len(entries)} fields have the label space {label_space},"
+                                 " use label_space to select one of them.")
+            label_ids.append(label_id)
+            fields.append(entries[0])
+        
+        scopings_ids = [field.scoping._get_ids(np_array=True) for field in fields]
+        if len(fields) > 0 and all(np.array_equal(ids, scopings_ids[0]) for ids in scopings_ids):
+            entity_ids = scopings_ids[0]
+        elif scopings_ids:
+            entity_ids = np.unique(np.concatenate(scopings_ids))
+        else:
+            entity_ids = np.zeros(0, dtype=np.int32)
+        component_counts = {field.component_count for field in fields}
+        if len(component_counts) > 1:
+            raise ValueError(f"the fields have different numbers of components: {component_counts}")
+        n_comp = component_counts.pop() if component_counts else 1
+        
+        data = np.full((len(fields), entity_ids.size, n_comp), np.nan, dtype=dtype)
+        for i, (field, ids) in enumerate(zip(fields, scopings_ids)):
+            if field.elementary_data_count != ids.size:
+                raise ValueError("fields with several values per entity can't be stacked")
+            if np.array_equal(ids, entity_ids):
+                field.read_into(data[i])
+            else:
+                values = field.read_into(np.empty((ids.size, n_comp), dtype=dtype))
+                data[i, np.searchsorted(entity_ids, ids)] = values
+        return data, np.array(label_ids, dtype=np.int32), np.array(entity_ids)
+    
     def __add__(self, fields_b):
         """Add two fields or two fields containers.
                 
@@ -0,0 +1,608 @@
+"""
+Interpolator
+============
+Evaluate results at arbitrary points of a mesh on the client side.
+"""
+import hashlib
+
+import numpy as np
+
+from ansys.dpf.core.common import locations
+from ansys.dpf.core.elements import element_types
+from ansys.dpf.core.nodes import _grid_shape
+
+
+class Interpolator:
+    """Interpolates nodal and elemental results at arbitrary points of a mesh.
+
+    The points are located in the elements of the mesh once, with the
+    shape functions of the elements inverted at each point. The resulting
+    interpolation weights are kept, so that interpolating a field, or all
+    the fields of a fields container, is a product of these weights with
+    the field's data without any other request to the server. The rows of
+    the data used at each point are kept in the topology cache of the mesh
+    for each scoping, so that the cost of interpolating a field only
+    depends on the number of points.
+
+    Solid, shell and line elements are supported. Only the corner nodes of
+    the quadratic wedges and pyramids are used. Points that are not in any
+    supported element get ``nan`` values.
+
+    Parameters
+    ----------
+    mesh : MeshedRegion
+        Mesh supporting the results to interpolate.
+    coordinates : list, numpy.ndarray
+        ``(n_points, 3)`` coordinates of the points.
+    tolerance : float, optional
+        Distance, relative to the size of an element, under which a point
+        is considered to be in the element. Points close to shell and line
+        elements are projected on them. The default is ``1e-4``.
+
+    Examples
+    --------
+    Evaluate the displacement at two points for all the time steps.
+
+    >>> import ansys.dpf.core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.download_transient_result())
+    >>> mesh = model.metadata.meshed_region
+    >>> interpolator = dpf.Interpolator(mesh, [[0.02, 0.02, 0.02], [0.03, 0.03, 0.03]])
+    >>> disp = model.results.displacement.on_all_time_freqs()
+    >>> values = interpolator.interpolate(disp.outputs.fields_container())
+
+    """
+
+    def __init__(self, mesh, coordinates, tolerance=1e-4):
+        self._mesh = mesh
+        self._coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+        locator = mesh.topology_cache._get(
+            "element_locator", lambda: _ElementLocator(mesh.nodes._coordinates,
+                                                       mesh.elements._types,
+                                                       *mesh.elements._connectivity))
+        self._element_indices, self._node_indices, self._weights = locator.locate(
+            self._coordinates, tolerance)
+        # identifies the interpolation in the cached rows of the fields
+        self._digest = hashlib.blake2b(self._node_indices.tobytes() 
+                                       + self._element_indices.tobytes(),
+                                       digest_size=16).digest()
+
+    @property
+    def coordinates(self):
+        """Coordinates of the points.
+
+        Returns
+        -------
+        coordinates : numpy.ndarray
+            ``(n_points, 3)`` coordinates.
+        """
+        return self._coordinates
+
+    @property
+    def found(self):
+        """Whether each point is in an element of the mesh.
+
+        Returns
+        -------
+        found : numpy.ndarray
+            Boolean array of size ``n_points``.
+        """
+        return self._element_indices >= 0
+
+    @property
+    def element_indices(self):
+        """Index of the element holding each point, ``-1`` for the points
+        that are not in the mesh.
+
+        Returns
+        -------
+        element_indices : numpy.ndarray
+        """
+        return self._element_indices
+
+    def interpolate(self, field_or_fields_container, prefetch=2):
+        """Interpolate a field, or each field of a fields container, at the points.
+
+        Parameters
+        ----------
+        field_or_fields_container : Field or FieldsContainer
+            Nodal or elemental field, or fields container of such fields,
+            on the mesh of the interpolator.
+        prefetch : int, optional
+            Number of fields of a fields container downloaded ahead, while
+            the current field is interpolated. The default is ``2``.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            ``(n_points, n_components)`` values for a field, or
+            ``(n_fields, n_points, n_components)`` values for a fields
+            container, ``nan`` for the points that are not in the mesh or
+            for the entities missing from a field. The components axis is
+            dropped for scalar fields.
+        """
+        from ansys.dpf.core.field import Field
+        if isinstance(field_or_fields_container, Field):
+            return self._interpolate_field(field_or_fields_container,
+                                           field_or_fields_container.data)
+        values = [self._interpolate_field(field, data) for field, data
+                  in field_or_fields_container.iter_data(prefetch=prefetch)]
+        if not values:
+            return np.zeros((0, self._coordinates.shape[0]))
+        return np.stack(values)
+
+    def _interpolate_field(self, field, data):
+        """Interpolate the data of a field, given in the order of its scoping."""
+        location = field.location
+        if location not in (locations.nodal, locations.elemental):
+            raise ValueError("Only nodal and elemental fields can be interpolated.")
+        data = np.asarray(data, dtype=float)
+        scoping = field.scoping
+        layout = hashlib.blake2b(self._digest, digest_size=16)
+        layout.update(np.ascontiguousarray(scoping._get_ids(np_array=True)).tobytes())
+        key = ("interpolation_rows", location, layout.hexdigest())
+        rows, missing = self._mesh.topology_cache._get(
+            key, lambda: self._field_rows(location, scoping))
+        if data.shape[0] == 0:
+            return np.full((self._coordinates.shape[0],) + data.shape[1:], np.nan)
+        if location == locations.nodal:
+            values = np.einsum("pn,pn...->p...", self._weights, data[rows])
+        else:
+            values = data[rows]
+        values[missing] = np.nan
+        return values
+
+    def _field_rows(self, location, scoping):
+        """Rows of the data of a field interpolated at each point.
+
+        Returns
+        -------
+        rows : numpy.ndarray
+            ``(n_points, max_nodes)`` rows of the nodes for a nodal field,
+            or ``n_points`` rows of the elements for an elemental field, 
+            ``0`` for the padding and the missing entities.
+        missing : numpy.ndarray
+            Whether each point is not in the mesh, or uses entities
+            missing from the field.
+        """
+        entities = self._mesh.nodes if location == locations.nodal else self._mesh.elements
+        indices, mask = entities.map_scoping(scoping)
+        # one more entity for the padding and the points out of the mesh
+        entity_rows = np.full(len(entities._ids) + 1, -1, dtype=np.int64)
+        entity_rows[indices] = np.flatnonzero(mask)
+        if location == locations.nodal:
+            rows = entity_rows[self._node_indices]
+            missing = np.any((rows < 0) & (self._node_indices >= 0), axis=1)
+        else:
+            rows = entity_rows[self._element_indices]
+            missing = rows < 0
+        missing |= ~self.found
+        return np.maximum(rows, 0), missing
+
+
+def _simplex_shape(dim, quadratic):
+    """Shape functions of linear or quadratic triangles and tetrahedra,
+    with the node ordering of VTK.
+
+    Returns a function computing the ``(n_points, n_nodes)`` shape functions
+    and their ``(n_points, n_nodes, dim)`` derivatives at ``(n_points, dim)``
+    parametric coordinates.
+    """
+    edges = [(0, 1), (1, 2), (2, 0), (0, 3), (1, 3), (2, 3)][:3 * (dim - 1)]
+    # derivatives of the barycentric coordinates
+    d_barycentric = np.vstack((-np.ones(dim), np.eye(dim)))
+
+    def evaluate(xi):
+        barycentric = np.hstack((1. - xi.sum(axis=1, keepdims=True), xi))
+        d_l = np.broadcast_to(d_barycentric, barycentric.shape + (dim,))
+        if not quadratic:
+            return barycentric, d_l
+        first, second = np.array(edges).T
+        shape = np.hstack((barycentric * (2. * barycentric - 1.),
+                           4. * barycentric[:, first] * barycentric[:, second]))
+        d_shape = np.concatenate((
+            (4. * barycentric - 1.)[:, :, np.newaxis] * d_l,
+            4. * (barycentric[:, second, np.newaxis] * d_l[:, first]
+                  + barycentric[:, first, np.newaxis] * d_l[:, second])), axis=1)
+        return shape, d_shape
+    return evaluate
+
+
+def _tensor_shape(signs, edges=None):
+    """Shape functions of lines, quadrangles and hexahedra, serendipity when
+    ``edges`` gives the corner nodes of the midside nodes, with the node
+    ordering of VTK.
+
+    Returns a function like :func:`_simplex_shape`.
+    """
+    signs = np.asarray(signs, dtype=float)
+    if edges is not None:
+        signs = np.vstack((signs, [(signs[i] + signs[j]) / 2. for i, j in edges]))
+    n_nodes, dim = signs.shape
+
+    def others_product(factors, j):
+        return np.prod(np.delete(factors, j, axis=1), axis=1)
+
+    def evaluate(xi):
+        shape = np.empty((xi.shape[0], n_nodes))
+        d_shape = np.empty((xi.shape[0], n_nodes, dim))
+        for i, sign in enumerate(signs):
+            # factors are 1 along the direction of a midside node
+            factors = 1. + xi * sign
+            product = factors.prod(axis=1)
+            midside = np.flatnonzero(sign == 0)
+            if midside.size:
+                m = midside[0]
+                scale = 0.5 ** (dim - 1)
+                bubble = 1. - xi[:, m] ** 2
+                shape[:, i] = scale * bubble * product
+                for j in range(dim):
+                    if j == m:
+                        d_shape[:, i, j] = -2. * scale * xi[:, m] * product
+                    else:
+                        d_shape[:, i, j] = scale * bubble * sign[j] * others_product(factors, j)
+            elif edges is not None:
+                scale = 0.5 ** dim
+                corner = xi @ sign - dim + 1.
+                shape[:, i] = scale * product * corner
+                for j in range(dim):
+                    d_shape[:, i, j] = scale * sign[j] * (others_product(factors, j) * corner + product)
+            else:
+                scale = 0.5 ** dim
+                shape[:, i] = scale * product
+                for j in range(dim):
+                    d_shape[:, i, j] = scale * sign[j] * others_product(factors, j)
+        return shape, d_shape
+    return evaluate
+
+
+def _wedge_shape(xi):
+    """Shape functions of linear wedges, triangles extruded along ``xi[:, 2]``."""
+    triangle, d_triangle = _simplex_shape(2, False)(xi[:, :2])
+    bottom, top = (1. - xi[:, 2:]) / 2., (1. + xi[:, 2:]) / 2.
+    shape = np.hstack((triangle * bottom, triangle * top))
+    d_shape = np.empty((xi.shape[0], 6, 3))
+    d_shape[:, :3, :2] = d_triangle * bottom[:, :, np.newaxis]
+    d_shape[:, 3:, :2] = d_triangle * top[:, :, np.newaxis]
+    d_shape[:, :3, 2] = -triangle / 2.
+    d_shape[:, 3:, 2] = triangle / 2.
+    return shape, d_shape
+
+
+def _pyramid_shape(xi):
+    """Shape functions of linear pyramids, with parametric coordinates in
+    ``[0, 1]`` and the apex at ``xi[:, 2] = 1``."""
+    r, s, t = xi.T
+    shape = np.stack(((1 - r) * (1 - s) * (1 - t), r * (1 - s) * (1 - t),
+                      r * s * (1 - t), (1 - r) * s * (1 - t), t), axis=1)
+    d_shape = np.stack((
+        np.stack((-(1 - s) * (1 - t), -(1 - r) * (1 - t), -(1 - r) * (1 - s)), axis=1),
+        np.stack(((1 - s) * (1 - t), -r * (1 - t), -r * (1 - s)), axis=1),
+        np.stack((s * (1 - t), r * (1 - t), -r * s), axis=1),
+        np.stack((-s * (1 - t), (1 - r) * (1 - t), -(1 - r) * s), axis=1),
+        np.stack((np.zeros_like(r), np.zeros_like(r), np.ones_like(r)), axis=1)), axis=1)
+    return shape, d_shape
+
+
+def _inside_simplex(xi, tolerance):
+    return np.all(xi >= -tolerance, axis=1) & (xi.sum(axis=1) <= 1. + tolerance)
+
+
+def _inside_cube(xi, tolerance):
+    return np.all(np.abs(xi) <= 1. + tolerance, axis=1)
+
+
+def _inside_wedge(xi, tolerance):
+    return _inside_simplex(xi[:, :2], tolerance) & (np.abs(xi[:, 2]) <= 1. + tolerance)
+
+
+def _inside_unit_cube(xi, tolerance):
+    return np.all((xi >= -tolerance) & (xi <= 1. + tolerance), axis=1)
+
+
+class _ElementFamily:
+    """Shape functions and parametric domain of similar elements.
+
+    Parameters
+    ----------
+    n_nodes : int
+        Number of nodes used by the shape functions, the first nodes of
+        the elements.
+    shape : callable
+        Function computing the shape functions and their derivatives.
+    inside : callable
+        Function testing whether parametric coordinates are in the element.
+    center : list
+        Parametric coordinates of the center of the element.
+    """
+
+    def __init__(self, n_nodes, shape, inside, center):
+        self.n_nodes = n_nodes
+        self.shape = shape
+        self.inside = inside
+        self.center = np.asarray(center, dtype=float)
+        self.dim = self.center.size
+
+
+_HEX_SIGNS = [(-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+              (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)]
+_HEX_EDGES = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4),
+              (0, 4), (1, 5), (2, 6), (3, 7)]
+_QUAD_SIGNS = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+_QUAD_EDGES = [(0, 1), (1, 2), (2, 3), (3, 0)]
+
+_TET4 = _ElementFamily(4, _simplex_shape(3, False), _inside_simplex, [0.25] * 3)
+_TET10 = _ElementFamily(10, _simplex_shape(3, True), _inside_simplex, [0.25] * 3)
+_HEX8 = _ElementFamily(8, _tensor_shape(_HEX_SIGNS), _inside_cube, [0.] * 3)
+_HEX20 = _ElementFamily(20, _tensor_shape(_HEX_SIGNS, _HEX_EDGES), _inside_cube, [0.] * 3)
+_WEDGE6 = _ElementFamily(6, _wedge_shape, _inside_wedge, [1. / 3., 1. / 3., 0.])
+_PYRAMID5 = _ElementFamily(5, _pyramid_shape, _inside_unit_cube, [0.5, 0.5, 0.25])
+_TRI3 = _ElementFamily(3, _simplex_shape(2, False), _inside_simplex, [1. / 3.] * 2)
+_TRI6 = _ElementFamily(6, _simplex_shape(2, True), _inside_simplex, [1. / 3.] * 2)
+_QUAD4 = _ElementFamily(4, _tensor_shape(_QUAD_SIGNS), _inside_cube, [0.] * 2)
+_QUAD8 = _ElementFamily(8, _tensor_shape(_QUAD_SIGNS, _QUAD_EDGES), _inside_cube, [0.] * 2)
+_LINE2 = _ElementFamily(2, _tensor_shape([(-1,), (1,)]), _inside_cube, [0.])
+_LINE3 = _ElementFamily(3, _tensor_shape([(-1,), (1,)], [(0, 1)]), _inside_cube, [0.])
+
+# shape functions of each supported element type
+_ELEMENT_FAMILIES = {
+    element_types.Tet10.value: _TET10,
+    element_types.Hex20.value: _HEX20,
+    element_types.Wedge15.value: _WEDGE6,
+    element_types.Pyramid13.value: _PYRAMID5,
+    element_types.Tri6.value: _TRI6,
+    element_types.TriShell6.value: _TRI6,
+    element_types.Quad8.value: _QUAD8,
+    element_types.QuadShell8.value: _QUAD8,
+    element_types.Line3.value: _LINE3,
+    element_types.Tet4.value: _TET4,
+    element_types.Hex8.value: _HEX8,
+    element_types.Wedge6.value: _WEDGE6,
+    element_types.Pyramid5.value: _PYRAMID5,
+    element_types.Tri3.value: _TRI3,
+    element_types.TriShell3.value: _TRI3,
+    element_types.Quad4.value: _QUAD4,
+    element_types.QuadShell4.value: _QUAD4,
+    element_types.Line2.value: _LINE2,
+    element_types.Surface3.value: _TRI3,
+    element_types.Surface4.value: _QUAD4,
+    element_types.Surface6.value: _TRI6,
+    element_types.Surface8.value: _QUAD8,
+}
+
+
+class _ElementLocator:
+    """Levels of uniform grids of cells bucketing the bounding boxes of the
+    elements, to find the elements holding points.
+
+    Parameters
+    ----------
+    coordinates : numpy.ndarray
+        ``(n_nodes, 3)`` coordinates of the nodes.
+    types : numpy.ndarray
+        Type of each element.
+    connectivity : numpy.ndarray
+        Node indices of all the elements, one element after the other.
+    offsets : numpy.ndarray
+        ``n_elements + 1`` offsets of the elements in ``connectivity``.
+    """
+
+    # number of point and element pairs tested at once
+    CHUNK_SIZE = 2 ** 16
+    # maximum number of iterations of the inverse mapping
+    MAX_ITERATIONS = 10
+    # ratio between the sizes of the cells of consecutive grid levels
+    LEVEL_RATIO = 4
+    # maximum number of cells along each axis overlapped by an element
+    CELLS_PER_AXIS = 3
+
+    def __init__(self, coordinates, types, connectivity, offsets):
+        self.coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+        self.types = np.asarray(types).reshape(-1)
+        self.connectivity = np.asarray(connectivity).reshape(-1)
+        self.offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+        sizes = np.diff(self.offsets)
+        supported = np.zeros(self.types.size, dtype=bool)
+        for element_type, family in _ELEMENT_FAMILIES.items():
+            supported |= (self.types == element_type) & (sizes >= family.n_nodes)
+        # the elements with missing nodes cannot be located
+        node_elements = np.repeat(np.arange(self.types.size), sizes)
+        supported[node_elements[self.connectivity[self.offsets[0]:self.offsets[-1]] < 0]] = False
+        self.elements = np.flatnonzero(supported)
+
+        # bounding boxes of the elements
+        element_sizes = sizes[self.elements]
+        positions = (np.repeat(self.offsets[self.elements], element_sizes) + np.arange(element_sizes.sum())
+                     - np.repeat(np.cumsum(element_sizes) - element_sizes, element_sizes))
+        node_coordinates = self.coordinates[self.connectivity[positions]]
+        starts = np.cumsum(element_sizes) - element_sizes
+        if self.elements.size:
+            self.lower_bounds = np.minimum.reduceat(node_coordinates, starts)
+            self.upper_bounds = np.maximum.reduceat(node_coordinates, starts)
+        else:
+            self.lower_bounds = self.upper_bounds = np.zeros((0, 3))
+        self.element_size = np.linalg.norm(self.upper_bounds - self.lower_bounds, axis=1)
+
+        # levels of uniform grids, the first one with cells of about the
+        # size of the elements and at most one cell per element, each level
+        # having cells LEVEL_RATIO times larger than the previous one, so
+        # that each element is registered in a few cells of the first level
+        # where it overlaps at most CELLS_PER_AXIS cells along each axis
+        if self.elements.size:
+            lower = self.lower_bounds.min(axis=0)
+            extent = self.upper_bounds.max(axis=0) - lower
+            cell_size = np.median(self.element_size)
+        else:
+            lower = np.zeros(3)
+            extent = np.zeros(3)
+            cell_size = 1.
+        n_cells = _grid_shape(extent, cell_size, max(self.elements.size, 1))
+        self.levels = []
+        remaining = np.arange(self.elements.size)
+        while True:
+            level = _GridLevel(lower, extent, n_cells)
+            lower_cells = level.cell_indices(self.lower_bounds[remaining])
+            upper_cells = level.cell_indices(self.upper_bounds[remaining])
+            fits = np.all(upper_cells - lower_cells < self.CELLS_PER_AXIS, axis=1)
+            if np.all(n_cells == 1):
+                fits[:] = True
+            level.register(remaining[fits], lower_cells[fits], upper_cells[fits])
+            self.levels.append(level)
+            remaining = remaining[~fits]
+            if remaining.size == 0:
+                break
+            n_cells = -(-n_cells // self.LEVEL_RATIO)
+
+    def _cached_arrays(self):
+        arrays = [self.elements, self.lower_bounds, self.upper_bounds, self.element_size]
+        for level in self.levels:
+            arrays.extend((level.cell_elements, level.starts))
+        return arrays
+
+    def locate(self, points, tolerance):
+        """Find the element holding each point and the interpolation weights.
+
+        Returns
+        -------
+        element_indices : numpy.ndarray
+            Index of the element holding each point, ``-1`` if none.
+        node_indices : numpy.ndarray
+            ``(n_points, max_nodes)`` indices of the nodes interpolated at
+            each point, padded with ``-1``.
+        weights : numpy.ndarray
+            ``(n_points, max_nodes)`` weight of each node, padded with ``0``.
+        """
+        n_points = points.shape[0]
+        max_nodes = max([_ELEMENT_FAMILIES[element_type].n_nodes for element_type
+                         in np.unique(self.types[self.elements]).tolist()] or [1])
+        element_indices = np.full(n_points, -1, dtype=np.int64)
+        node_indices = np.full((n_points, max_nodes), -1, dtype=np.int64)
+        weights = np.zeros((n_points, max_nodes))
+        if n_points == 0 or self.elements.size == 0:
+            return element_indices, node_indices, weights
+
+        # candidate elements whose inflated bounding box holds the point, 
+        # the points out of the grid being tested against its closest cells
+        margin = tolerance * self.element_size[:, np.newaxis]
+        pairs = [level.candidates(points) for level in self.levels]
+        pair_points = np.concatenate([pair[0] for pair in pairs])
+        pair_elements = np.concatenate([pair[1] for pair in pairs])
+        in_box = np.all((points[pair_points] >= self.lower_bounds[pair_elements] - margin[pair_elements]) &
+                        (points[pair_points] <= self.upper_bounds[pair_elements] + margin[pair_elements]),
+                        axis=1)
+        pair_points, pair_elements = pair_points[in_box], pair_elements[in_box]
+
+        for family in set(_ELEMENT_FAMILIES.values()):
+            family_types = [element_type for element_type, element_family 
+                            in _ELEMENT_FAMILIES.items() if element_family is family]
+            of_family = np.isin(self.types[self.elements[pair_elements]], family_types)
+            family_points, family_elements = pair_points[of_family], pair_elements[of_family]
+            for start in range(0, family_points.size, self.CHUNK_SIZE):
+                chunk_points = family_points[start:start + self.CHUNK_SIZE]
+                chunk_elements = family_elements[start:start + self.CHUNK_SIZE]
+                # points already found in another element are skipped
+                not_found = element_indices[chunk_points] < 0
+                chunk_points, chunk_elements = chunk_points[not_found], chunk_elements[not_found]
+                elements = self.elements[chunk_elements]
+                nodes = self.connectivity[self.offsets[elements][:, np.newaxis] + np.arange(family.n_nodes)]
+                shape, inside = self._invert(family, self.coordinates[nodes], points[chunk_points],
+                                             tolerance, tolerance * self.element_size[chunk_elements])
+                # a point is assigned to the first element holding it
+                chunk_points, first = np.unique(chunk_points[inside], return_index=True)
+                element_indices[chunk_points] = elements[inside][first]
+                node_indices[chunk_points, :family.n_nodes] = nodes[inside][first]
+                weights[chunk_points, :family.n_nodes] = shape[inside][first]
+        return element_indices, node_indices, weights
+
+    def _invert(self, family, node_coordinates, points, tolerance, distance_tolerance):
+        """Invert the mapping of elements at points with Newton iterations.
+
+        Returns
+        -------
+        shape : numpy.ndarray
+            Shape functions at the points.
+        inside : numpy.ndarray
+            Whether each point is in its element.
+        """
+        xi = np.tile(family.center, (points.shape[0], 1))
+        for _ in range(self.MAX_ITERATIONS):
+            shape, d_shape = family.shape(xi)
+            residual = points - np.einsum("pn,pnc->pc", shape, node_coordinates)
+            jacobian = np.einsum("pnc,pnd->pcd", node_coordinates, d_shape)
+            # least squares step, for shells and lines embedded in 3D
+            normal = np.einsum("pcd,pce->pde", jacobian, jacobian)
+            rhs = np.einsum("pcd,pc->pd", jacobian, residual)
+            singular = np.abs(np.linalg.det(normal)) <= 1e-300
+            normal[singular] = np.eye(family.dim)
+            rhs[singular] = 0.
+            step = np.linalg.solve(normal, rhs[..., np.newaxis])[..., 0]
+            # keep diverging points near the element
+            xi = np.clip(xi + step, -2., 2.)
+            if np.all(np.abs(step) < 1e-10):
+                break
+        shape, _ = family.shape(xi)
+        residual = points - np.einsum("pn,pnc->pc", shape, node_coordinates)
+        distance = np.linalg.norm(residual, axis=1)
+        inside = family.inside(xi, tolerance) & (distance <= distance_tolerance) & ~singular
+        return shape, inside
+
+
+class _GridLevel:
+    """Uniform grid of cells holding the elements registered in it.
+
+    Parameters
+    ----------
+    lower : numpy.ndarray
+        Lower corner of the grid.
+    extent : numpy.ndarray
+        Size of the grid along each axis.
+    n_cells : numpy.ndarray
+        Number of cells along each axis.
+    """
+
+    def __init__(self, lower, extent, n_cells):
+        self.lower = lower
+        self.n_cells = n_cells
+        self.cell_size = np.where(extent > 0, extent / n_cells, 1.)
+        self.cell_elements = np.zeros(0, dtype=np.int64)
+        self.starts = np.zeros(np.prod(n_cells) + 1, dtype=np.int64)
+
+    def cell_indices(self, points):
+        """``(i, j, k)`` indices of the cells holding points, the points out
+        of the grid being assigned to its closest cells."""
+        indices = np.floor((points - self.lower) / self.cell_size)
+        return np.clip(indices, 0, self.n_cells - 1).astype(np.int64)
+
+    def keys(self, cell_indices):
+        n_i, n_j, _ = self.n_cells
+        return cell_indices[..., 0] + n_i * (cell_indices[..., 1] + n_j * cell_indices[..., 2])
+
+    def register(self, elements, lower_cells, upper_cells):
+        """Register each element in all the cells of a block."""
+        block = upper_cells - lower_cells + 1
+        counts = block.prod(axis=1)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        block = np.repeat(block, counts, axis=0)
+        cells = np.repeat(lower_cells, counts, axis=0) + np.stack((
+            local % block[:, 0], (local // block[:, 0]) % block[:, 1],
+            local // (block[:, 0] * block[:, 1])), axis=1)
+        keys = self.keys(cells)
+        order = np.argsort(keys, kind="stable")
+        self.cell_elements = np.repeat(elements, counts)[order]
+        self.starts = np.searchsorted(keys[order], np.arange(np.prod(self.n_cells) + 1))
+
+    def candidates(self, points):
+        """Pairs of points and elements registered in the cells of the points.
+
+        Returns
+        -------
+        pair_points : numpy.ndarray
+        pair_elements : numpy.ndarray
+        """
+        keys = self.keys(self.cell_indices(points))
+        begins = self.starts[keys]
+        counts = self.starts[keys + 1] - begins
+        pair_points = np.repeat(np.arange(points.shape[0]), counts)
+        pair_elements = self.cell_elements[
+            np.repeat(begins - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]
+        return pair_points, pair_elements
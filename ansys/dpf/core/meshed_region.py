@@ -2,6 +2,10 @@
 MeshedRegion
 ============
 """
+from collections import OrderedDict
+
+import numpy as np
+
 from ansys import dpf
 from ansys.grpc.dpf import meshed_region_pb2, meshed_region_pb2_grpc
 from ansys.dpf.core import scoping
@@ -9,7 +13,7 @@ from ansys.dpf.core.common import locations, types
 from ansys.dpf.core.plotter import Plotter as _DpfPlotter
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core.nodes import Nodes
-from ansys.dpf.core.elements import Elements, element_types
+from ansys.dpf.core.elements import Elements, element_types, _element_shape
 from ansys.dpf.core.check_version import server_meet_version
 
 
@@ -37,6 +41,9 @@ class MeshedRegion:
     elements : Elements
         Entity containing all elemental properties.
 
+    topology_cache : TopologyCache
+        Local copies of the arrays describing the mesh.
+
     Examples
     --------
     Extract a meshed region from a model.
@@ -84,7 +91,7 @@ class MeshedRegion:
             self._message.id = mesh.id
         
 
-        self._full_grid = None
+        self._topology_cache = TopologyCache()
         self._elements = None
         self._nodes = None
 
@@ -153,6 +160,32 @@ class MeshedRegion:
             self._nodes = Nodes(self)
         return self._nodes
     
+    @property
+    def topology_cache(self):
+        """Local copies of the arrays describing the mesh.
+        
+        The IDs, coordinates, element types and connectivities of the mesh 
+        are fetched once and shared by the grid, the mapping of scopings 
+        and the nodes and elements iterators. Call 
+        :func:`TopologyCache.invalidate` if the mesh is modified on the server.
+        
+        Returns
+        -------
+        topology_cache : TopologyCache
+        
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> meshed_region = model.metadata.meshed_region
+        >>> grid = meshed_region.grid
+        >>> meshed_region.topology_cache.nbytes > 0
+        True
+        
+        """
+        return self._topology_cache
+    
     @property
     def unit(self):
         """Unit of the meshed region.
@@ -272,41 +305,26 @@ class MeshedRegion:
     #     if not os.path.isfile(filename):
     #         raise FileNotFoundError('VTK mesh not written to disk')
 
-    # @property
-    # def skin(self):
-    #     """Surface of the meshed region."""
-    #     mesh = self._model.operator("mapdl::rst::MeshProvider")
-    #     mesh.connect(4, self._model.data_sources)
-
+    def _as_vtk(self, as_linear=True, include_ids=False, cache_dir=None):
+        """Convert DPF mesh to a PyVista unstructured grid.
         
-    #     skin = self._model.operator("meshed_skin_sector")
-    #     skin.connect(0, mesh, 0)
-    #     # skin.connect(4, self)
-
-    #     skin.get_output(0, types.meshed_region)
-
-    #     name = None
-    #     if self._name:
-    #         name = 'Skin of %s' % self._name
-    #     self._message = skin.get_output(0, types.meshed_region)
-    #     return MeshedRegion(self._server.channel, skin, self._model, name)
-    
-    def _as_vtk(self, as_linear=True, include_ids=False):
-        """Convert DPF mesh to a PyVista unstructured grid."""
-        nodes = self.nodes.coordinates_field.data
-        etypes = self.elements.element_types_field.data
-        conn = self.elements.connectivities_field.data
+        The arrays of the mesh are read from the topology cache. When 
+        ``cache_dir`` is set, the grid is saved to, or read from, a 
+        ``.vtu`` file of this directory named after the content of the mesh.
+        """
         try:
             from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
         except ModuleNotFoundError:
             raise ModuleNotFoundError("to use plotting capabilities, please install pyvista with :\n pip install pyvista>=0.24.0")
        
-        grid = dpf_mesh_to_vtk(nodes, etypes, conn, as_linear)
+        connectivity, offsets = self.elements._connectivity
+        grid = dpf_mesh_to_vtk(self.nodes._coordinates, self.elements._types, 
+                               connectivity, as_linear, offsets=offsets, 
+                               cache_dir=cache_dir)
 
-        # consider adding this when scoping request is faster
         if include_ids:
-            grid['node_ids'] = self.nodes.scoping.ids
-            grid['element_ids'] = self.elements.scoping.ids
+            grid['node_ids'] = self.nodes._ids
+            grid['element_ids'] = self.elements._ids
 
         return grid
 
@@ -339,9 +357,66 @@ class MeshedRegion:
         >>> mesh = grid.extract_surface()
             
         """
-        if self._full_grid is None:
-            self._full_grid = self._as_vtk()
-        return self._full_grid
+        return self._topology_cache._get("grid", self._as_vtk)
+
+    @property
+    def skin_grid(self):
+        """Unstructured grid in VTK format from PyVista of the external 
+        faces of the mesh.
+        
+        The faces of the solid elements that are not shared by two 
+        elements are kept as triangles and quadrangles, while the other 
+        elements, such as shells and beams, are kept as they are. Plotting 
+        this grid instead of :attr:`MeshedRegion.grid` gives the same 
+        picture with a fraction of the memory.
+
+        Returns
+        -------
+        pyvista.UnstructuredGrid
+            UnstructuredGrid of the external faces of the mesh.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> meshed_region = model.metadata.meshed_region
+        >>> skin_grid = meshed_region.skin_grid
+        >>> skin_grid.n_cells
+        24
+        
+        """
+        return self._topology_cache._get("skin_grid", self._skin_as_vtk)
+
+    @property
+    def _skin(self):
+        """External faces of the mesh, kept in the topology cache.
+        
+        Returns
+        -------
+        node_indices : numpy.ndarray
+            Index in the mesh of each point of the skin.
+        element_indices : numpy.ndarray
+            Index in the mesh of the element of each cell of the skin.
+        element_types : numpy.ndarray
+            Type of each cell of the skin.
+        connectivity : numpy.ndarray
+            Point indices of the cells of the skin, one cell after the other.
+        offsets : numpy.ndarray
+            ``n_cells + 1`` offsets of the cells in ``connectivity``.
+        """
+        return self._topology_cache._get(
+            "skin", lambda: _skin(self.elements._types, *self.elements._connectivity))
+
+    def _skin_as_vtk(self):
+        """Convert the external faces of the mesh to a PyVista unstructured grid."""
+        try:
+            from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError("to use plotting capabilities, please install pyvista with :\n pip install pyvista>=0.24.0")
+        node_indices, _, etypes, connectivity, offsets = self._skin
+        return dpf_mesh_to_vtk(self.nodes._coordinates[node_indices], etypes, 
+                               connectivity, offsets=offsets)
 
     def plot(self, field_or_fields_container=None, notebook=None,
              shell_layers=None, off_screen=None, show_axes=True, **kwargs):
@@ -420,22 +495,159 @@ class MeshedRegion:
         >>> deep_copy = meshed_region.deep_copy(server=other_server)
         
         """
-        node_ids = self.nodes.scoping.ids
-        element_ids = self.elements.scoping.ids
+        node_ids = self.nodes._ids
+        element_ids = self.elements._ids
         mesh = MeshedRegion(num_nodes=len(node_ids), num_elements=len(element_ids),server=server)
-        with self.nodes.coordinates_field.as_local_field() as coord:
-            for i,node in enumerate(mesh.nodes.add_nodes(len(node_ids))):
-                node.id = node_ids[i]
-                node.coordinates = coord.get_entity_data(i)
-        with self.elements.connectivities_field.as_local_field() as connect :
-            with self.elements.element_types_field.as_local_field() as types:
-                for i,elem in enumerate(mesh.elements.add_elements(len(element_ids))):
-                    elem.id = element_ids[i]
-                    elem.connectivity = connect.get_entity_data(i)
-                    elem.shape = element_types.shape(types.get_entity_data(i)[0])
+        connectivity, offsets = self.elements._connectivity
+        mesh._add_nodes_and_elements(node_ids, self.nodes._coordinates,
+                                     element_ids, _element_shapes(self.elements._types), 
+                                     connectivity, offsets)
         mesh.unit = self.unit
         return mesh
     
+    @classmethod
+    def from_arrays(cls, node_ids, coordinates, element_ids, element_types, 
+                    connectivity, offsets, materials=None, server=None):
+        """Create a meshed region from arrays describing all its nodes and elements.
+        
+        The mesh is sent with a few ``Add`` requests holding many nodes or 
+        elements each, instead of one object per node or element.
+        
+        Parameters
+        ----------
+        node_ids : numpy.ndarray
+            ID of each node.
+        coordinates : numpy.ndarray
+            ``(n_nodes, 3)`` coordinates of the nodes.
+        element_ids : numpy.ndarray
+            ID of each element.
+        element_types : numpy.ndarray
+            Type of each element, as values of 
+            :class:`ansys.dpf.core.elements.element_types`. The server 
+            deduces the type of each element from its shape and its number 
+            of nodes.
+        connectivity : numpy.ndarray
+            Node indices (not IDs) of all the elements, one element after 
+            the other.
+        offsets : numpy.ndarray
+            Index of the first node of each element in ``connectivity``, 
+            with an optional last offset equal to the size of ``connectivity``.
+        materials : numpy.ndarray, optional
+            Material ID of each element. The default is ``None``.
+        server : ansys.dpf.core.server, optional
+            Server with the channel connected to the remote or local instance. 
+            The default is ``None``, in which case an attempt is made to use the 
+            global server.
+        
+        Returns
+        -------
+        mesh : MeshedRegion
+        
+        Examples
+        --------
+        Create a mesh of two quadrangles.
+        
+        >>> import numpy as np
+        >>> import ansys.dpf.core as dpf
+        >>> coordinates = [[0., 0., 0.], [1., 0., 0.], [2., 0., 0.], 
+        ...                [0., 1., 0.], [1., 1., 0.], [2., 1., 0.]]
+        >>> mesh = dpf.MeshedRegion.from_arrays(
+        ...     node_ids=np.arange(1, 7), coordinates=coordinates, 
+        ...     element_ids=[1, 2], element_types=[dpf.element_types.Quad4.value] * 2,
+        ...     connectivity=[0, 1, 4, 3, 1, 2, 5, 4], offsets=[0, 4])
+        
+        """
+        node_ids = np.asarray(node_ids).reshape(-1)
+        coordinates = np.asarray(coordinates, dtype=float)
+        element_ids = np.asarray(element_ids).reshape(-1)
+        element_types = np.asarray(element_types, dtype=np.int32).reshape(-1)
+        connectivity = np.asarray(connectivity, dtype=np.int64).reshape(-1)
+        offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+        if coordinates.shape != (node_ids.size, 3):
+            raise ValueError(f"coordinates must be of shape ({node_ids.size}, 3), "
+                             f"not {coordinates.shape}")
+        if element_types.size != element_ids.size:
+            raise ValueError(f"{element_types.size} element types are given for "
+                             f"{element_ids.size} elements")
+        if offsets.size == element_ids.size + 1:
+            if offsets[-1] != connectivity.size:
+                raise ValueError("the last offset must be the size of the connectivity")
+        elif offsets.size == element_ids.size:
+            offsets = np.append(offsets, connectivity.size)
+        else:
+            raise ValueError(f"{offsets.size} offsets are given for {element_ids.size} elements")
+        if np.any(np.diff(offsets) < 0) or (offsets.size > 0 and offsets[0] != 0):
+            raise ValueError("offsets must start at 0 and be increasing")
+        if connectivity.size > 0 and (connectivity.min() < 0 or connectivity.max() >= node_ids.size):
+            raise ValueError(f"connectivity must hold node indices in [0, {node_ids.size}[")
+        if materials is not None:
+            materials = np.asarray(materials).reshape(-1)
+            if materials.size != element_ids.size:
+                raise ValueError(f"{materials.size} materials are given for "
+                                 f"{element_ids.size} elements")
+        
+        mesh = cls(num_nodes=node_ids.size, num_elements=element_ids.size, server=server)
+        mesh._add_nodes_and_elements(node_ids, coordinates, element_ids, 
+                                     _element_shapes(element_types), connectivity, offsets)
+        if materials is not None:
+            materials_field = mesh.elements.materials_field
+            materials_field.scoping.ids = element_ids
+            materials_field.data = materials.astype(materials_field._get_data_type()[1])
+            mesh.elements._invalidate()
+        return mesh
+    
+    def _add_nodes_and_elements(self, node_ids, coordinates, element_ids, shapes, 
+                                connectivity, offsets):
+        """Add nodes and elements described by arrays.
+        
+        The nodes and elements are sent in batches, with ``Add`` requests 
+        of at most about ``_MAX_ADD_REQUEST_SIZE`` bytes.
+        
+        Parameters
+        ----------
+        node_ids : numpy.ndarray
+            ID of each node.
+        coordinates : numpy.ndarray
+            ``(n_nodes, 3)`` coordinates of the nodes.
+        element_ids : numpy.ndarray
+            ID of each element.
+        shapes : numpy.ndarray
+            ``meshed_region_pb2.ElementShape`` value of each element.
+        connectivity : numpy.ndarray
+            Flat node indices of all the elements.
+        offsets : numpy.ndarray
+            ``n_elements + 1`` offsets of the elements in ``connectivity``.
+        """
+        node_ids = np.asarray(node_ids).tolist()
+        coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 3).tolist()
+        nodes_per_request = max(_MAX_ADD_REQUEST_SIZE // _NODE_REQUEST_SIZE, 1)
+        for start in range(0, len(node_ids), nodes_per_request):
+            request = meshed_region_pb2.AddRequest(mesh=self._message)
+            for node_id, xyz in zip(node_ids[start:start + nodes_per_request], 
+                                    coordinates[start:start + nodes_per_request]):
+                request.nodes.add(id=node_id, coordinates=xyz)
+            self._stub.Add(request)
+        
+        offsets = np.asarray(offsets, dtype=np.int64)
+        # estimated size of the requests up to each element
+        sizes = offsets * _CONNECTIVITY_REQUEST_SIZE + np.arange(offsets.size) * _ELEMENT_REQUEST_SIZE
+        connectivity = np.asarray(connectivity, dtype=np.int32).reshape(-1).tolist()
+        element_ids = np.asarray(element_ids).tolist()
+        shapes = np.asarray(shapes).tolist()
+        offsets = offsets.tolist()
+        start = 0
+        while start < len(element_ids):
+            stop = int(np.searchsorted(sizes, sizes[start] + _MAX_ADD_REQUEST_SIZE, side="right")) - 1
+            stop = min(max(stop, start + 1), len(element_ids))
+            request = meshed_region_pb2.AddRequest(mesh=self._message)
+            for i in range(start, stop):
+                request.elements.add(id=element_ids[i], shape=shapes[i],
+                                     connectivity=connectivity[offsets[i]:offsets[i+1]])
+            self._stub.Add(request)
+            start = stop
+        self.nodes._invalidate()
+        self.elements._invalidate()
+    
     
     def __send_init_request(self, num_nodes=0, num_elements=0):
         request = meshed_region_pb2.CreateRequest()
@@ -444,3 +656,260 @@ class MeshedRegion:
         if num_elements:
             request.num_elements_reserved = num_elements
         self._message = self._stub.Create(request)
+
+
+# estimated sizes in bytes of the parts of an ``Add`` request
+_MAX_ADD_REQUEST_SIZE = 2**22
+_NODE_REQUEST_SIZE = 40
+_ELEMENT_REQUEST_SIZE = 16
+_CONNECTIVITY_REQUEST_SIZE = 5
+
+
+def _element_shapes(types):
+    """``meshed_region_pb2.ElementShape`` value of each element type."""
+    unique_types, type_indices = np.unique(np.asarray(types).reshape(-1), return_inverse=True)
+    shapes = np.array([meshed_region_pb2.ElementShape.Value(_element_shape(etype).upper())
+                       for etype in unique_types.tolist()], dtype=np.int32)
+    return shapes[type_indices]
+
+
+class TopologyCache:
+    """Local copies of the arrays describing the topology of a mesh.
+    
+    The node and element IDs, coordinates, element types, connectivities 
+    and VTK grid of a meshed region are fetched from the server the first 
+    time that they are needed, and then shared by all their consumers, 
+    such as :attr:`MeshedRegion.grid`, ``map_scoping`` or the nodes and 
+    elements iterators.
+    
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum number of bytes used by the cached arrays. When this 
+        limit is exceeded, the least recently used arrays are dropped 
+        and fetched again when needed. The default is ``None``, in which 
+        case the memory used is not limited.
+    
+    Examples
+    --------
+    >>> import ansys.dpf.core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.static_rst)
+    >>> meshed_region = model.metadata.meshed_region
+    >>> cache = meshed_region.topology_cache
+    >>> cache.max_bytes = 2**30
+    >>> grid = meshed_region.grid
+    >>> cache.invalidate()
+    
+    """
+    
+    def __init__(self, max_bytes=None):
+        self._entries = OrderedDict()
+        self._max_bytes = max_bytes
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __contains__(self, key):
+        return key in self._entries
+    
+    def __str__(self):
+        return (f"DPF topology cache with {len(self)} entries "
+                f"using {self.nbytes} bytes\n")
+    
+    @property
+    def nbytes(self):
+        """Number of bytes used by the cached arrays.
+        
+        Returns
+        -------
+        nbytes : int
+        """
+        return _nbytes(list(self._entries.values()))
+    
+    @property
+    def max_bytes(self):
+        """Maximum number of bytes used by the cached arrays, or ``None``.
+        
+        Returns
+        -------
+        max_bytes : int
+        """
+        return self._max_bytes
+    
+    @max_bytes.setter
+    def max_bytes(self, value):
+        self._max_bytes = value
+        self._shrink()
+    
+    def invalidate(self, key=None):
+        """Drop cached arrays, which are fetched again when needed.
+        
+        Parameters
+        ----------
+        key : str, optional
+            Name of the array to drop. The default is ``None``, in which 
+            case all the arrays are dropped.
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+    
+    def _get(self, key, loader):
+        """Return a cached value, loading it first if needed.
+        
+        Parameters
+        ----------
+        key : str
+            Name of the value.
+        loader : callable
+            Function without arguments fetching the value.
+        """
+        try:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        except KeyError:
+            value = loader()
+            self._entries[key] = value
+            self._shrink(keep=key)
+            return value
+    
+    def _shrink(self, keep=None):
+        """Drop the least recently used values until the byte limit is met."""
+        if self._max_bytes is None:
+            return
+        for key in list(self._entries):
+            if self.nbytes <= self._max_bytes:
+                break
+            if key != keep:
+                del self._entries[key]
+
+
+def _nbytes(value, seen=None):
+    """Number of bytes used by a value of the topology cache, counting 
+    only once the arrays shared by several values."""
+    if seen is None:
+        seen = set()
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(item, seen) for item in value)
+    if hasattr(value, "_cached_arrays"):
+        return _nbytes(value._cached_arrays(), seen)
+    if isinstance(value, np.ndarray):
+        # a view uses the memory of its base array
+        base = value if value.base is None else value.base
+        if id(base) in seen:
+            return 0
+        seen.add(id(base))
+        return base.nbytes if isinstance(base, np.ndarray) else value.nbytes
+    if hasattr(value, "GetActualMemorySize"):
+        # VTK data sets report their size in kibibytes
+        return value.GetActualMemorySize() * 1024
+    return 0
+
+
+# faces of the solid elements, as the indices of their corner nodes 
+# ordered for the normals to point outwards
+_TET_FACES = ((0, 1, 3), (1, 2, 3), (2, 0, 3), (0, 2, 1))
+_HEX_FACES = ((0, 4, 7, 3), (1, 2, 6, 5), (0, 1, 5, 4), (3, 7, 6, 2), (0, 3, 2, 1), (4, 5, 6, 7))
+_WEDGE_FACES = ((0, 1, 2), (3, 5, 4), (0, 3, 4, 1), (1, 4, 5, 2), (2, 5, 3, 0))
+_PYRAMID_FACES = ((0, 3, 2, 1), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4))
+_SOLID_FACES = {
+    element_types.Tet10.value: _TET_FACES,
+    element_types.Tet4.value: _TET_FACES,
+    element_types.Hex20.value: _HEX_FACES,
+    element_types.Hex8.value: _HEX_FACES,
+    element_types.Wedge15.value: _WEDGE_FACES,
+    element_types.Wedge6.value: _WEDGE_FACES,
+    element_types.Pyramid13.value: _PYRAMID_FACES,
+    element_types.Pyramid5.value: _PYRAMID_FACES,
+}
+# element type of the faces with 3 and 4 nodes
+_FACE_TYPES = {3: element_types.Tri3.value, 4: element_types.Quad4.value}
+
+
+def _skin(types, connectivity, offsets):
+    """Compute the external faces of a mesh.
+    
+    The faces of the solid elements are hashed by their sorted node 
+    indices, and only the faces found once are kept. The other elements 
+    are kept as they are.
+    
+    Parameters
+    ----------
+    types : numpy.ndarray
+        Type of each element.
+    connectivity : numpy.ndarray
+        Node indices of all the elements, one element after the other.
+    offsets : numpy.ndarray
+        ``n_elements + 1`` offsets of the elements in ``connectivity``.
+    
+    Returns
+    -------
+    tuple
+        Node indices, element indices, types, connectivity and offsets 
+        of the skin, as described in :attr:`MeshedRegion._skin`.
+    """
+    types = np.asarray(types).reshape(-1)
+    connectivity = np.asarray(connectivity).reshape(-1)
+    offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+    is_solid = np.zeros(types.size, dtype=bool)
+    faces = {n_nodes: ([], []) for n_nodes in _FACE_TYPES}
+    for element_type, element_faces in _SOLID_FACES.items():
+        elements = np.flatnonzero(types == element_type)
+        if elements.size == 0:
+            continue
+        is_solid[elements] = True
+        starts = offsets[elements][:, np.newaxis]
+        for face in element_faces:
+            face_nodes, face_elements = faces[len(face)]
+            face_nodes.append(connectivity[starts + np.asarray(face)])
+            face_elements.append(elements)
+
+    cell_types, cell_elements, cell_sizes, cell_nodes = [], [], [], []
+    for n_nodes, (face_nodes, face_elements) in faces.items():
+        if not face_nodes:
+            continue
+        face_nodes = np.concatenate(face_nodes)
+        face_elements = np.concatenate(face_elements)
+        external = _single_faces(face_nodes)
+        cell_types.append(np.full(external.size, _FACE_TYPES[n_nodes]))
+        cell_elements.append(face_elements[external])
+        cell_sizes.append(np.full(external.size, n_nodes))
+        cell_nodes.append(face_nodes[external].reshape(-1))
+
+    others = np.flatnonzero(~is_solid)
+    sizes = np.diff(offsets)[others]
+    first_nodes = np.repeat(offsets[others], sizes)
+    positions = np.arange(first_nodes.size) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    cell_types.append(types[others])
+    cell_elements.append(others)
+    cell_sizes.append(sizes)
+    cell_nodes.append(connectivity[first_nodes + positions])
+
+    cell_sizes = np.concatenate(cell_sizes)
+    skin_offsets = np.zeros(cell_sizes.size + 1, dtype=np.int64)
+    np.cumsum(cell_sizes, out=skin_offsets[1:])
+    cell_nodes = np.concatenate(cell_nodes)
+    # number the nodes of the skin, leaving the missing nodes (-1) as they are
+    valid = cell_nodes >= 0
+    node_indices, skin_connectivity = np.unique(cell_nodes[valid], return_inverse=True)
+    cell_nodes = np.full(cell_nodes.size, -1, dtype=np.int64)
+    cell_nodes[valid] = skin_connectivity
+    return (node_indices, np.concatenate(cell_elements), 
+            np.concatenate(cell_types).astype(np.int32), cell_nodes, skin_offsets)
+
+
+def _single_faces(face_nodes):
+    """Indices of the faces, given as ``(n_faces, n_nodes)`` node indices, 
+    that are not shared with another face."""
+    if face_nodes.shape[0] == 0:
+        return np.zeros(0, dtype=np.int64)
+    keys = np.sort(face_nodes, axis=1)
+    order = np.lexsort(keys.T[::-1])
+    keys = keys[order]
+    first = np.ones(keys.shape[0], dtype=bool)
+    first[1:] = np.any(keys[1:] != keys[:-1], axis=1)
+    starts = np.flatnonzero(first)
+    counts = np.diff(np.append(starts, keys.shape[0]))
+    return np.sort(order[starts[counts == 1]])
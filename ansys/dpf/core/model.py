@@ -207,8 +207,8 @@ class Model:
         >>> model.plot()
         
         """
-        self.metadata.meshed_region.grid.plot(color=color,
-                                              show_edges=show_edges, **kwargs)
+        self.metadata.meshed_region.skin_grid.plot(color=color,
+                                                   show_edges=show_edges, **kwargs)
 
 
 
@@ -7,7 +7,7 @@ import numpy as np
 
 
 from ansys import dpf
-from ansys.dpf.core import  field, property_field
+from ansys.dpf.core import  field, property_field, scoping
 from ansys.grpc.dpf import meshed_region_pb2
 from ansys.dpf.core.errors import protect_grpc
 
@@ -27,7 +27,8 @@ class Node:
     nodeindex : int
         Index of the node.
     coordinates : list
-        List of ``[x, y, z]`` coordinates for the node.
+        List of ``[x, y, z]`` coordinates for the node. When ``None``, the 
+        coordinates are read from the arrays cached by the mesh's nodes.
 
     Examples
     --------
@@ -46,6 +47,8 @@ class Node:
     
     """
 
+    __slots__ = ("_mesh", "_id", "_index", "_coordinates")
+
     def __init__(self, mesh, nodeid, index, coordinates):
         self._id = nodeid
         self._index = index
@@ -72,6 +75,8 @@ class Node:
         [0.015, 0.045, 0.015]
         
         """
+        if self._coordinates is None:
+            return self._mesh.nodes._coordinates[self._index].tolist()
         return self._coordinates
     
     @property
@@ -82,7 +87,8 @@ class Node:
         -------
         nodal_connectivity : numpy.array
         """
-        return self._mesh.nodes.nodal_connectivity_field.get_entity_data(self.index)
+        element_indices, offsets = self._mesh.nodes._nodal_connectivity
+        return element_indices[offsets[self._index]:offsets[self._index + 1]]
 
     def __str__(self):
         txt = 'DPF Node     %7d\n' % self.id
@@ -93,6 +99,10 @@ class Node:
 
 class Nodes():
     """Provides a collection of DPF nodes.
+    
+    The IDs and coordinates of all the nodes are fetched once, as arrays,
+    the first time that a node is accessed. Nodes returned by indexing or 
+    iteration are lightweight views on these arrays.
 
     Parameters
     ----------
@@ -126,41 +136,159 @@ class Nodes():
         return self.n_nodes
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        for i, nodeid in enumerate(self._ids.tolist()):
+            yield Node(self._mesh, nodeid, i, None)
 
     def node_by_id(self, id):
         """Array of node coordinates ordered by ID."""
-        return self.__get_node(nodeid=id)
+        index = self._cached_scoping.index(id)
+        if index < 0:
+            raise ValueError(f"node {id} is not in the mesh")
+        return Node(self._mesh, int(id), index, None)
 
     def node_by_index(self, index):
         """Array of node coordinates ordered by index"""
-        return self.__get_node(nodeindex=index)
+        ids = self._ids
+        if not 0 <= index < ids.size:
+            raise IndexError(f"index {index} is out of range for {ids.size} nodes")
+        return Node(self._mesh, int(ids[index]), int(index), None)
 
-    @protect_grpc
-    def __get_node(self, nodeindex=None, nodeid=None):
-        """Retrieves the node by its ID or index.
+    @property
+    def _cached_scoping(self):
+        """Scoping of the nodes, with its IDs kept in the topology cache."""
+        return self._mesh.topology_cache._get("node_scoping", self._fetch_scoping)
+
+    @property
+    def _ids(self):
+        """IDs of all the nodes, kept in the topology cache."""
+        return self._mesh.topology_cache._get(
+            "node_ids", lambda: self._cached_scoping._get_ids(np_array=True))
+
+    @property
+    def _coordinates(self):
+        """``(n_nodes, 3)`` coordinates of all the nodes, kept in the topology cache."""
+        return self._mesh.topology_cache._get("coordinates", self._fetch_coordinates)
+
+    @property
+    def _nodal_connectivity(self):
+        """Element indices connected to each node in the CSR format, 
+        inverted from the connectivity of the elements and kept in the 
+        topology cache."""
+        return self._mesh.topology_cache._get(
+            "nodal_connectivity", 
+            lambda: _invert_csr(*self._mesh.elements._connectivity, len(self._ids)))
+
+    @property
+    def nodal_connectivity(self):
+        """Element indices connected to each node in the CSR format.
+
+        The connectivity is computed on the client from the connectivity 
+        of the elements, without any request to the server other than 
+        the ones fetching the connectivity of the elements, and is kept 
+        in the topology cache of the mesh.
+
+        Returns
+        -------
+        element_indices : numpy.ndarray
+            Element indices of all the nodes, one node after the other, 
+            in increasing order for each node.
+        offsets : numpy.ndarray
+            ``n_nodes + 1`` offsets, the element indices of node ``i`` 
+            being ``element_indices[offsets[i]:offsets[i+1]]``.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> element_indices, offsets = nodes.nodal_connectivity
+        >>> element_indices[offsets[1]:offsets[2]]
+        array([0, 2, 4, 6])
+
+        """
+        return self._nodal_connectivity
+
+    def connected_elements(self, node_indices):
+        """Elements connected to any of some nodes.
+
+        Parameters
+        ----------
+        node_indices : list, numpy.ndarray
+            Indices of the nodes.
+
+        Returns
+        -------
+        element_indices : numpy.ndarray
+            Sorted indices of the elements using at least one of the nodes.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> nodes.connected_elements([1])
+        array([0, 2, 4, 6])
+
+        """
+        return np.unique(_gather_csr(*self._nodal_connectivity, node_indices))
+
+    def rings(self, node_indices, n_rings=1):
+        """Nodes connected to some nodes through at most ``n_rings`` elements.
+
+        The first ring of a node is made of the nodes sharing an element 
+        with it, the second ring of the nodes sharing an element with the 
+        first ring, and so on.
 
         Parameters
         ----------
-        nodeid : int
-            ID of the node. The default is ``None``.
-        nodeindex : int
-            Index of the node. The default is ``None``.
+        node_indices : list, numpy.ndarray
+            Indices of the nodes to start from.
+        n_rings : int, optional
+            Number of rings. The default is ``1``.
 
         Returns
         -------
-        node : ansys.dpf.core.meshed_region.Node
-            Requested node
+        node_indices : numpy.ndarray
+            Sorted indices of the nodes in the rings, including the nodes 
+            started from.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> ring = nodes.rings([0], n_rings=2)
+
         """
-        request = meshed_region_pb2.GetRequest()
-        request.mesh.CopyFrom(self._mesh._message)
-        if nodeindex is None:
-            request.id = nodeid
-        else:
-            request.index = nodeindex
-        nodeOut = self._mesh._stub.GetNode(request)
-        return Node(self._mesh, nodeOut.id, nodeOut.index, nodeOut.coordinates)
+        connectivity, offsets = self._mesh.elements._connectivity
+        reached = np.unique(np.asarray(node_indices, dtype=np.int64).reshape(-1))
+        front = reached
+        for _ in range(n_rings):
+            if front.size == 0:
+                break
+            ring = np.unique(_gather_csr(connectivity, offsets, self.connected_elements(front)))
+            ring = ring[ring >= 0]
+            front = np.setdiff1d(ring, reached, assume_unique=True)
+            reached = np.union1d(reached, front)
+        return reached
+
+    def _fetch_scoping(self):
+        node_scoping = self.scoping
+        node_scoping._load_ids()
+        return node_scoping
+
+    def _fetch_coordinates(self):
+        coordinates = np.asarray(self.coordinates_field.data, dtype=float).reshape(-1, 3)
+        coordinates.flags.writeable = False
+        return coordinates
+
+    def _invalidate(self):
+        """Drop the arrays cached for the mesh, after nodes are added."""
+        self._mesh.topology_cache.invalidate()
+        self._mapping_id_to_index = None
 
     @property
     def scoping(self):
@@ -243,7 +371,7 @@ class Nodes():
 
     def _build_mapping_id_to_index(self):
         """Retrieve a mapping between IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return {eid: i for i, eid in enumerate(self._ids.tolist())}
 
     @property
     def mapping_id_to_index(self):
@@ -289,10 +417,125 @@ class Nodes():
         """
         if external_scope.location in ['Elemental', 'NodalElemental']:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+        indices = self._cached_scoping.indices_of(external_scope._get_ids(np_array=True))
+        mask = indices >= 0
+        return indices[mask], mask
+
+    @property
+    def _spatial_index(self):
+        """Uniform grid bucketing the nodes, kept in the topology cache."""
+        return self._mesh.topology_cache._get(
+            "node_grid", lambda: _NodeGrid(self._coordinates))
+
+    def _scoping_from_indices(self, indices):
+        """Nodal scoping of the nodes at some indices."""
+        return scoping.Scoping(ids=self._ids[indices], location=dpf.core.locations.nodal,
+                               server=self._mesh._server)
+
+    def nearest(self, points, k=1):
+        """Nodes closest to points.
+
+        The first query builds a spatial index of the nodes, which makes 
+        the queries much faster than computing the distance to each node.
+
+        Parameters
+        ----------
+        points : list, numpy.ndarray
+            ``[x, y, z]`` coordinates of a point, or ``(n_points, 3)`` 
+            coordinates of several points.
+        k : int, optional
+            Number of nodes to find for each point. The default is ``1``.
+
+        Returns
+        -------
+        scoping : Scoping
+            IDs of the ``k`` closest nodes of each point, point after point,
+            from the closest node to the farthest.
+
+        Notes
+        -----
+        The points are searched one after the other. Each search only 
+        visits the cells of the index around the point, but costs a few 
+        tens of microseconds of Python overhead, which dominates for many 
+        points. To find the nodes in a region, prefer :func:`in_box` or 
+        :func:`within_radius`, which are vectorized.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> nodes.nearest([0.015, 0.045, 0.015]).ids
+        [1]
+
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        k = int(k)
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        grid = self._spatial_index
+        indices = [grid.nearest(point, k) for point in points]
+        indices = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64)
+        return self._scoping_from_indices(indices)
+
+    def within_radius(self, center, radius):
+        """Nodes within a distance of a point.
+
+        Parameters
+        ----------
+        center : list, numpy.ndarray
+            ``[x, y, z]`` coordinates of the center of the sphere.
+        radius : float
+            Radius of the sphere.
+
+        Returns
+        -------
+        scoping : Scoping
+            IDs of the nodes in the sphere, in the order of the nodes.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> scop = nodes.within_radius([0.015, 0.045, 0.015], 0.01)
+
+        """
+        center = np.asarray(center, dtype=float).reshape(3)
+        return self._scoping_from_indices(self._spatial_index.within_radius(center, float(radius)))
+
+    def in_box(self, min_corner, max_corner):
+        """Nodes inside an axis-aligned box.
+
+        Parameters
+        ----------
+        min_corner : list, numpy.ndarray
+            ``[x, y, z]`` coordinates of the corner of the box with the 
+            smallest coordinates.
+        max_corner : list, numpy.ndarray
+            ``[x, y, z]`` coordinates of the corner of the box with the 
+            largest coordinates.
+
+        Returns
+        -------
+        scoping : Scoping
+            IDs of the nodes in the box, boundaries included, in the order 
+            of the nodes.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> scop = nodes.in_box([0.0, 0.0, 0.0], [0.01, 0.01, 0.01])
+
+        """
+        min_corner = np.asarray(min_corner, dtype=float).reshape(3)
+        max_corner = np.asarray(max_corner, dtype=float).reshape(3)
+        return self._scoping_from_indices(self._spatial_index.in_box(min_corner, max_corner))
     
     def add_node(self, id, coordinates):
         """Add a node in the mesh.
@@ -310,6 +553,7 @@ class Nodes():
         node_request.coordinates.extend(coordinates)
         request.nodes.append(node_request)
         self._mesh._stub.Add(request)
+        self._invalidate()
         
     def add_nodes(self, num):   
         """Add a number of nodes in the mesh. 
@@ -343,6 +587,7 @@ class Nodes():
             node_request.coordinates.extend(add.coordinates)
             request.nodes.append(node_request)
         self._mesh._stub.Add(request)
+        self._invalidate()
         
 
 class NodeAdder:
@@ -393,3 +638,198 @@ class NodeAdder:
         else:
             self._coordinates= xyz
     
+
+
+def _read_csr(field):
+    """Read-only data of a property field in the CSR format.
+    
+    Returns
+    -------
+    data : numpy.ndarray
+        Data of all the entities, one entity after the other.
+    offsets : numpy.ndarray
+        ``n_entities + 1`` offsets, the data of entity ``i`` being 
+        ``data[offsets[i]:offsets[i+1]]``.
+    """
+    data = np.asarray(field.data)
+    data.flags.writeable = False
+    offsets = np.asarray(field._data_pointer, dtype=np.int64)
+    if offsets.size == 0:
+        offsets = np.arange(data.size + 1, dtype=np.int64)
+    else:
+        offsets = np.append(offsets, data.size)
+    offsets.flags.writeable = False
+    return data, offsets
+
+
+class _NodeGrid:
+    """Uniform grid of cells bucketing the nodes for spatial queries.
+    
+    The size of the cells is chosen for each cell to hold a few nodes on 
+    average, so that a query only computes the distances to the nodes of 
+    the cells it overlaps.
+    
+    Parameters
+    ----------
+    coordinates : numpy.ndarray
+        ``(n_nodes, 3)`` coordinates of the nodes.
+    """
+    
+    # mean number of nodes per cell
+    NODES_PER_CELL = 2
+    
+    def __init__(self, coordinates):
+        self.coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+        n_nodes = self.coordinates.shape[0]
+        if n_nodes:
+            self.lower = self.coordinates.min(axis=0)
+            extent = self.coordinates.max(axis=0) - self.lower
+        else:
+            self.lower = np.zeros(3)
+            extent = np.zeros(3)
+        # start from cubic cells filling the bounding box, the axes thinner 
+        # than a cell being then left undivided
+        active = extent > 0
+        cell_size = 1.
+        if active.any():
+            cell_size = (np.prod(extent[active]) * self.NODES_PER_CELL / n_nodes) ** (1. / active.sum())
+        self.n_cells = _grid_shape(extent, cell_size, max(n_nodes // self.NODES_PER_CELL, 1))
+        assert np.prod(self.n_cells) <= max(self.NODES_PER_CELL * n_nodes, 1)
+        self.cell_size = np.where(extent > 0, extent / self.n_cells, 1.)
+        
+        keys = self._keys(self._cell_indices(self.coordinates))
+        self.order = np.argsort(keys, kind="stable")
+        self.starts = np.searchsorted(keys[self.order], np.arange(np.prod(self.n_cells) + 1))
+    
+    def _cached_arrays(self):
+        return [self.order, self.starts]
+    
+    def _cell_indices(self, points):
+        """``(i, j, k)`` indices of the cells holding points, the points out 
+        of the grid being assigned to its closest cells."""
+        indices = np.floor((points - self.lower) / self.cell_size)
+        return np.clip(indices, 0, self.n_cells - 1).astype(np.int64)
+    
+    def _keys(self, cell_indices):
+        n_i, n_j, _ = self.n_cells
+        return cell_indices[..., 0] + n_i * (cell_indices[..., 1] + n_j * cell_indices[..., 2])
+    
+    def _nodes_in_cells(self, lower, upper):
+        """Indices of the nodes in a block of cells, bounds included."""
+        lower = np.clip(lower, 0, self.n_cells - 1)
+        upper = np.clip(upper, 0, self.n_cells - 1)
+        j = np.arange(lower[1], upper[1] + 1)
+        k = np.arange(lower[2], upper[2] + 1)
+        # the cells along i are contiguous in the order of the nodes
+        row_keys = lower[0] + self.n_cells[0] * (j[np.newaxis, :] + self.n_cells[1] * k[:, np.newaxis])
+        begins = self.starts[row_keys.reshape(-1)]
+        ends = self.starts[row_keys.reshape(-1) + upper[0] - lower[0] + 1]
+        lengths = ends - begins
+        positions = np.arange(lengths.sum()) + np.repeat(begins - np.cumsum(lengths) + lengths, lengths)
+        return self.order[positions]
+    
+    def in_box(self, lower, upper):
+        """Sorted indices of the nodes inside a box."""
+        if np.any(upper < lower) or self.coordinates.shape[0] == 0:
+            return np.zeros(0, dtype=np.int64)
+        candidates = self._nodes_in_cells(self._cell_indices(lower), self._cell_indices(upper))
+        coordinates = self.coordinates[candidates]
+        inside = np.all((coordinates >= lower) & (coordinates <= upper), axis=1)
+        return np.sort(candidates[inside])
+    
+    def within_radius(self, center, radius):
+        """Sorted indices of the nodes inside a sphere."""
+        candidates = self.in_box(center - radius, center + radius)
+        distances = np.sum((self.coordinates[candidates] - center) ** 2, axis=1)
+        return candidates[distances <= radius ** 2]
+    
+    def nearest(self, point, k):
+        """Indices of the ``k`` nodes closest to a point, closest first."""
+        k = min(k, self.coordinates.shape[0])
+        if k == 0:
+            return np.zeros(0, dtype=np.int64)
+        # grow a block of cells around the point until it holds k nodes
+        cell = self._cell_indices(point)
+        layers = 0
+        while True:
+            candidates = self._nodes_in_cells(cell - layers, cell + layers)
+            if candidates.size >= k:
+                break
+            layers = max(1, 2 * layers)
+        distances = np.sum((self.coordinates[candidates] - point) ** 2, axis=1)
+        # the k closest nodes are at most as far as the k-th candidate
+        radius = np.sqrt(np.partition(distances, k - 1)[k - 1])
+        candidates = self._nodes_in_cells(self._cell_indices(point - radius), 
+                                          self._cell_indices(point + radius))
+        distances = np.sum((self.coordinates[candidates] - point) ** 2, axis=1)
+        return candidates[np.lexsort((candidates, distances))[:k]]
+
+
+def _grid_shape(extent, cell_size, max_cells):
+    """Number of cells along each axis of a uniform grid.
+    
+    The cells are about cubes of size ``cell_size``, which is increased 
+    until the grid has at most ``max_cells`` cells. The axes along which 
+    the grid is thinner than a cell are not divided, so that flat and 
+    thin regions do not get many cells in their other directions.
+    
+    Parameters
+    ----------
+    extent : numpy.ndarray
+        Size of the grid along each axis.
+    cell_size : float
+        Initial size of the cells.
+    max_cells : int
+        Maximum number of cells.
+    
+    Returns
+    -------
+    n_cells : numpy.ndarray
+        Number of cells along each axis.
+    """
+    extent = np.asarray(extent, dtype=float)
+    cell_size = max(float(cell_size), 1e-300)
+    while True:
+        active = extent > cell_size
+        n_cells = np.where(active, np.ceil(extent / cell_size), 1.)
+        total = np.prod(n_cells)
+        if total <= max_cells:
+            return n_cells.astype(np.int64)
+        cell_size *= max((total / max_cells) ** (1. / active.sum()), 1.01)
+
+
+def _invert_csr(data, offsets, n_targets):
+    """Invert an adjacency in the CSR format, such as the nodes of the 
+    elements into the elements of the nodes.
+
+    Negative values of ``data`` are ignored.
+
+    Returns
+    -------
+    sources : numpy.ndarray
+        Sources of all the targets, one target after the other, in 
+        increasing order for each target.
+    offsets : numpy.ndarray
+        ``n_targets + 1`` offsets of the targets in ``sources``.
+    """
+    data = np.asarray(data).reshape(-1)[offsets[0]:offsets[-1]]
+    sources = np.repeat(np.arange(offsets.size - 1), np.diff(offsets))
+    valid = data >= 0
+    data, sources = data[valid], sources[valid]
+    # a stable sort keeps the sources in increasing order for each target
+    order = np.argsort(data, kind="stable")
+    inverse_offsets = np.zeros(n_targets + 1, dtype=np.int64)
+    np.cumsum(np.bincount(data, minlength=n_targets), out=inverse_offsets[1:])
+    sources = sources[order]
+    sources.flags.writeable = False
+    inverse_offsets.flags.writeable = False
+    return sources, inverse_offsets
+
+
+def _gather_csr(data, offsets, indices):
+    """Concatenated data of some entities of a CSR array."""
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+    begins = offsets[indices]
+    lengths = offsets[indices + 1] - begins
+    positions = np.arange(lengths.sum()) + np.repeat(begins - np.cumsum(lengths) + lengths, lengths)
+    return data[positions]
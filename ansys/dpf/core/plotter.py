@@ -69,7 +69,7 @@ class Plotter:
         """
         kwargs.setdefault('color', 'w')
         kwargs.setdefault('show_edges', True)
-        return self._mesh.grid.plot(**kwargs)
+        return self._mesh.skin_grid.plot(**kwargs)
 
     def plot_chart(self, fields_container):
         """Plot the minimum/maximum result values over time.
@@ -218,15 +218,23 @@ class Plotter:
                 break
 
         # Merge field data into a single array
+        n_entities = mesh_location._ids.size
         if component_count > 1:
-            overall_data = np.full((len(mesh_location), component_count), np.nan)
+            overall_data = np.full((n_entities, component_count), np.nan)
         else:
-            overall_data = np.full(len(mesh_location), np.nan)
+            overall_data = np.full(n_entities, np.nan)
 
         for field in fields_container:
             ind, mask = mesh_location.map_scoping(field.scoping)
             overall_data[ind] = field.data[mask]
 
+        # only the external faces of the mesh are plotted
+        node_indices, element_indices = mesh._skin[:2]
+        if location == locations.nodal:
+            overall_data = overall_data[node_indices]
+        else:
+            overall_data = overall_data[element_indices]
+
         # create the plotter and add the meshes
         background = kwargs.pop('background', None)
         
@@ -240,7 +248,7 @@ class Plotter:
         kwargs.setdefault('show_edges', True)
         kwargs.setdefault('nan_color', 'grey')
         kwargs.setdefault('stitle', name)
-        plotter.add_mesh(mesh.grid, scalars=overall_data, **kwargs)
+        plotter.add_mesh(mesh.skin_grid, scalars=overall_data, **kwargs)
 
         if background is not None:
             plotter.set_background(background)
@@ -9,13 +9,10 @@ from ansys.grpc.dpf import scoping_pb2, scoping_pb2_grpc, base_pb2
 from ansys.dpf.core.common import locations,_common_progress_bar
 from ansys.dpf.core.misc import DEFAULT_FILE_CHUNK_SIZE
 from ansys.dpf.core import errors as dpf_errors
-from ansys.dpf.core.check_version import version_requires, server_meet_version
+from ansys.dpf.core.check_version import version_requires, server_meet_version, _PRE_2_1_MAX_IDS
 import numpy as np
 import array
 
-
-import sys
-
 class Scoping:
     """Represents a scoping, which is a subset of a model support.
 
@@ -65,6 +62,11 @@ class Scoping:
 
         self._server = server
         self._stub = self._connect()
+        self._ids_cache = None
+        self._runs_cache = None
+        self._sorted_ids_cache = None
+        self._id_table_cache = None
+        self._owner_metadata = None
 
         if scoping is None:
             request = base_pb2.Empty()
@@ -125,21 +127,30 @@ class Scoping:
         -----
         Print a progress bar.
         """
-        # must convert to a list for gRPC
-        if isinstance(ids, range):
-            ids = np.array(list(ids), dtype=np.int32)
-        elif not isinstance(ids,(np.ndarray, np.generic)):            
-            ids= np.array(ids, dtype=np.int32)
+        # contiguous IDs are kept as runs, and only expanded to int32 chunks for gRPC
+        if isinstance(ids, _RunLengthIds):
+            runs = ids
+        elif isinstance(ids, range):
+            runs = _RunLengthIds.from_range(ids)
+            if runs is None:
+                ids = np.arange(ids.start, ids.stop, ids.step, dtype=np.int32)
         else:
-            ids = np.array(list(ids), dtype=np.int32)
+            ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+            runs = _RunLengthIds.from_array(ids)
+        if runs is not None:
+            ids = runs
         
         metadata=[(u"size_int", f"{len(ids)}")]
         request = scoping_pb2.UpdateIdsRequest()
         request.scoping.CopyFrom(self._message)
         if server_meet_version("2.1", self._server):
-            self._stub.UpdateIds(_data_chunk_yielder(request, ids), metadata=metadata)
+            self._stub.UpdateIds(_data_chunk_yielder(request, ids, self._server.chunk_size), metadata=metadata)
         else:
-            self._stub.UpdateIds(_data_chunk_yielder(request, ids, 8.0e6), metadata=metadata)
+            # at most _PRE_2_1_MAX_IDS IDs, checked by version_requires, in one message
+            max_bytes = _PRE_2_1_MAX_IDS * np.dtype(np.int32).itemsize
+            self._stub.UpdateIds(_data_chunk_yielder(request, ids, max_bytes), metadata=metadata)
+        self._invalidate_ids()
+        self._runs_cache = runs
         
 
     def _get_ids(self, np_array=False):
@@ -147,26 +158,100 @@ class Scoping:
         Returns
         -------
         ids : list[int], numpy.array (if np_array==True)
-            List of IDs.    
+            List of IDs. The array is the read-only local copy of the IDs.
         
         Notes
         -----
-        Print a progress bar.
+        Print a progress bar the first time that the IDs are fetched.
+        """
+        self._load_ids()
+        if self._ids_cache is None:
+            # expanded from the runs once, then kept next to them
+            ids = self._runs_cache.dense()
+            ids.flags.writeable = False
+            self._ids_cache = ids
+        ids = self._ids_cache
+        if np_array:
+            return ids
+        else:
+            return ids.tolist()
+    
+    def _load_ids(self):
+        """Fetch the IDs if there is no local copy of them.
+        
+        The IDs are kept as runs when they are mostly contiguous, and as a 
+        read-only int32 array otherwise. The array of IDs kept as runs is 
+        only expanded when requested.
         """
+        if self._ids_cache is not None or self._runs_cache is not None:
+            return
         if server_meet_version("2.1", self._server):  
             service = self._stub.List(self._message)
-            dtype = np.int32
-            return _data_get_chunk_(dtype, service,np_array)
+            ids = _data_get_chunk_(np.int32, service)
         else:
             out = []
-                    
             service = self._stub.List(self._message)
             for chunk in service:
                 out.extend(chunk.ids.rep_int)
-            if np_array:
-                return np.array(out, dtype = np.int32)
-            else:
-                return out
+            ids = np.array(out, dtype = np.int32)
+        self._runs_cache = _RunLengthIds.from_array(ids)
+        if self._runs_cache is None:
+            ids.flags.writeable = False
+            self._ids_cache = ids
+    
+    def _get_sorted_ids(self):
+        """Lazily sort the local copy of the IDs for the ID to index lookups.
+        
+        Returns
+        -------
+        order : numpy.ndarray
+            Indices sorting the IDs.
+        sorted_ids : numpy.ndarray
+            Sorted IDs.
+        """
+        if self._sorted_ids_cache is None:
+            self._sorted_ids_cache = _sort_ids(self._get_ids(np_array=True))
+        return self._sorted_ids_cache
+    
+    def _get_id_table(self):
+        """Lazily build a direct-address table from ID to index, when the IDs 
+        are dense enough for the table to be at most twice as large as them.
+        
+        Returns
+        -------
+        tuple or None
+            Smallest ID and table of the index of each ID from it, ``-1`` 
+            for the missing IDs, or ``None`` if the IDs are too sparse.
+        """
+        if self._id_table_cache is None:
+            table = _build_id_table(self._get_ids(np_array=True))
+            self._id_table_cache = _NO_ID_TABLE if table is None else table
+        if self._id_table_cache is _NO_ID_TABLE:
+            return None
+        return self._id_table_cache
+    
+    def _cached_arrays(self):
+        """Arrays of the local copy of the IDs and of its lookup tables."""
+        arrays = []
+        for cache in (self._ids_cache, self._sorted_ids_cache, self._id_table_cache):
+            if isinstance(cache, tuple):
+                arrays.extend(array for array in cache if isinstance(array, np.ndarray))
+            elif isinstance(cache, np.ndarray):
+                arrays.append(cache)
+        if self._runs_cache is not None:
+            runs = self._runs_cache
+            arrays.extend((runs.starts, runs.lengths, runs.offsets))
+        return arrays
+    
+    def _invalidate_ids(self):
+        """Drop the local copy of the IDs, which is fetched again when needed,
+        and the metadata of the field owning the scoping."""
+        self._ids_cache = None
+        self._runs_cache = None
+        self._sorted_ids_cache = None
+        self._id_table_cache = None
+        if getattr(self, "_owner_metadata", None) is not None:
+            self._owner_metadata.values = None
 
     def set_id(self, index, scopingid):
         """Set the ID of a scoping's index.
@@ -183,6 +268,7 @@ class Scoping:
         request.index_id.index = index
         request.scoping.CopyFrom(self._message)
         self._stub.Update(request)
+        self._invalidate_ids()
 
     def _get_id(self, index):
         """Retrieve the index that the scoping ID is located on.
@@ -223,6 +309,8 @@ class Scoping:
     def id(self, index:int):
         """Retrieve the ID at a given index.
         
+        The ID is read from the local copy of the IDs.
+        
         Parameters
         ----------
         index : int
@@ -233,11 +321,16 @@ class Scoping:
         size : int
     
         """
-        return self._get_id(index)
+        size = self.size
+        if not 0 <= index < size:
+            raise IndexError(f"index {index} is out of range for a scoping of size {size}")
+        return int(self.ids_at([index])[0])
 
     def index(self, id:int):
         """Retrieve the index of a given ID.
         
+        The index is found with the local copy of the IDs.
+        
         Parameters
         ----------
         id : int
@@ -246,9 +339,69 @@ class Scoping:
         Returns
         -------
         size : int
+            Index of the ID, or ``-1`` if the ID is not in the scoping.
     
         """
-        return self._get_index(id)
+        return int(self.indices_of([id])[0])
+    
+    def indices_of(self, ids):
+        """Retrieve the indices of several IDs.
+        
+        The indices are found with a local table from ID to index when the 
+        IDs are dense, and with a sorted local copy of the IDs otherwise.
+        
+        Parameters
+        ----------
+        ids : list of int or numpy.ndarray
+            IDs for the indices to retrieve.
+        
+        Returns
+        -------
+        numpy.ndarray
+            Index of each ID, or ``-1`` for the IDs not in the scoping.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[4, 7, 9])
+        >>> scoping.indices_of([9, 4, 5])
+        array([ 2,  0, -1])
+        
+        """
+        self._load_ids()
+        if self._runs_cache is not None and self._runs_cache.is_sorted:
+            return self._runs_cache.index_of(ids)
+        id_table = self._get_id_table()
+        if id_table is not None:
+            return _lookup_id_table(*id_table, ids)
+        order, sorted_ids = self._get_sorted_ids()
+        return _lookup_sorted_ids(order, sorted_ids, ids)
+    
+    def ids_at(self, indices):
+        """Retrieve the IDs at several indices.
+        
+        Parameters
+        ----------
+        indices : list of int or numpy.ndarray
+            Indices for the IDs to retrieve.
+        
+        Returns
+        -------
+        numpy.ndarray
+            IDs at the indices.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[4, 7, 9])
+        >>> scoping.ids_at([2, 0])
+        array([9, 4], dtype=int32)
+        
+        """
+        self._load_ids()
+        if self._runs_cache is not None:
+            return self._runs_cache.take(indices)
+        return self._ids_cache[np.asarray(indices, dtype=np.int64)]
 
     @property
     def ids(self):
@@ -261,7 +414,8 @@ class Scoping:
         
         Notes
         -----
-        Print a progress bar.
+        The IDs are fetched once and kept locally until they are modified 
+        through this scoping. Print a progress bar the first time.
         """
         return self._get_ids()
 
@@ -290,11 +444,12 @@ class Scoping:
         return scoping_pb2_grpc.ScopingServiceStub(self._server.channel)
 
     def __len__(self):
-        return self._count()
+        return self.size
 
     def __del__(self):
         try:
             self._stub.Delete(self._message)
+            self._invalidate_ids()
         except:
             pass
         
@@ -304,6 +459,9 @@ class Scoping:
     def __getitem__(self, key):
         """Retrieve the ID at a requested index."""
         return self.id(key)
+    
+    def __contains__(self, id):
+        return self.index(id) >= 0
 
     @property
     def size(self):
@@ -314,6 +472,10 @@ class Scoping:
         size : int
     
         """
+        if self._runs_cache is not None:
+            return self._runs_cache.size
+        if self._ids_cache is not None:
+            return self._ids_cache.size
         return self._count()
 
     def __str__(self):
@@ -343,30 +505,358 @@ class Scoping:
         scoping_copy : Scoping
         """
         scop = Scoping(server=server)
-        scop.ids = self.ids
+        if self._runs_cache is not None:
+            scop.ids = self._runs_cache
+        elif self._ids_cache is not None:
+            scop.ids = self._ids_cache
+        elif server_meet_version("2.1", self._server) and server_meet_version("2.1", scop._server):
+            # pipe the IDs chunk by chunk from one server to the other
+            service = self._stub.List(self._message)
+            metadata = [(u"size_int", f"{_stream_size(service)//np.dtype(np.int32).itemsize}")]
+            request = scoping_pb2.UpdateIdsRequest()
+            request.scoping.CopyFrom(scop._message)
+            scop._stub.UpdateIds(_data_forwarder(service, request), metadata=metadata)
+        else:
+            scop.ids = self._get_ids(np_array=True)
         scop.location =self.location
         return scop
 
 
-def _data_chunk_yielder(request, data, chunk_size=DEFAULT_FILE_CHUNK_SIZE): 
-    length = data.size
+    def union(self, other):
+        """Create a scoping with the IDs that are in this scoping or in another one.
+        
+        The operation is done locally, without any operator.
+        
+        Parameters
+        ----------
+        other : Scoping, list of int or numpy.ndarray
+            Other IDs.
+        
+        Returns
+        -------
+        union : Scoping
+            Scoping with the sorted unique IDs and the same location as 
+            this scoping.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[4, 7, 9])
+        >>> scoping.union([1, 4]).ids
+        [1, 4, 7, 9]
+        
+        """
+        return self._combine(other, np.logical_or, np.union1d)
+    
+    def intersection(self, other):
+        """Create a scoping with the IDs that are in both this scoping and another one.
+        
+        The operation is done locally, without any operator.
+        
+        Parameters
+        ----------
+        other : Scoping, list of int or numpy.ndarray
+            Other IDs.
+        
+        Returns
+        -------
+        intersection : Scoping
+            Scoping with the sorted unique IDs and the same location as 
+            this scoping.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[4, 7, 9])
+        >>> scoping.intersection([9, 1, 4]).ids
+        [4, 9]
+        
+        """
+        return self._combine(other, np.logical_and, np.intersect1d)
+    
+    def difference(self, other):
+        """Create a scoping with the IDs of this scoping that are not in another one.
+        
+        The operation is done locally, without any operator.
+        
+        Parameters
+        ----------
+        other : Scoping, list of int or numpy.ndarray
+            IDs to remove.
+        
+        Returns
+        -------
+        difference : Scoping
+            Scoping with the sorted unique IDs and the same location as 
+            this scoping.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[4, 7, 9])
+        >>> scoping.difference([9, 1]).ids
+        [4, 7]
+        
+        """
+        return self._combine(other, lambda in_self, in_other: in_self & ~in_other,
+                             np.setdiff1d)
+    
+    def isin(self, other):
+        """Check which IDs of this scoping are in another one.
+        
+        Parameters
+        ----------
+        other : Scoping, list of int or numpy.ndarray
+            Other IDs.
+        
+        Returns
+        -------
+        numpy.ndarray
+            Boolean mask of the size of this scoping.
+        
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[4, 7, 9])
+        >>> scoping.isin([9, 1, 4])
+        array([ True, False,  True])
+        
+        """
+        ids = self._get_ids(np_array=True)
+        if isinstance(other, Scoping):
+            return other.indices_of(ids) >= 0
+        return np.isin(ids, np.asarray(other, dtype=np.int32))
+    
+    def _local_ids(self):
+        """Local copy of the IDs, as sorted runs when possible or as an array."""
+        self._load_ids()
+        if self._runs_cache is not None and self._runs_cache.is_sorted:
+            return self._runs_cache
+        return self._get_ids(np_array=True)
+    
+    def _combine(self, other, keep, dense_operation):
+        """Create a scoping from a set operation on the IDs.
+        
+        Parameters
+        ----------
+        other : Scoping, list of int or numpy.ndarray
+            Other IDs.
+        keep : callable
+            Elementwise operation on the membership masks of both IDs, used 
+            when both IDs are stored as sorted runs.
+        dense_operation : callable
+            numpy set operation used otherwise.
+        """
+        ids = self._local_ids()
+        if isinstance(other, Scoping):
+            other_ids = other._local_ids()
+        else:
+            other_ids = np.asarray(other, dtype=np.int32).reshape(-1)
+        if isinstance(ids, _RunLengthIds) and isinstance(other_ids, _RunLengthIds):
+            out = _combine_runs(ids, other_ids, keep)
+            if out.size < out.starts.size * _RunLengthIds.MIN_MEAN_RUN_LENGTH:
+                out = out.dense()
+        else:
+            if isinstance(ids, _RunLengthIds):
+                ids = ids.dense()
+            if isinstance(other_ids, _RunLengthIds):
+                other_ids = other_ids.dense()
+            out = dense_operation(ids, other_ids).astype(np.int32)
+        scop = Scoping(server=self._server)
+        scop.ids = out
+        location = self.location
+        if location:
+            scop.location = location
+        return scop
+
+
+class _RunLengthIds:
+    """IDs stored as runs of consecutive integers.
+    
+    Contiguous or piecewise-contiguous IDs, such as ``range(1, n + 1)``, 
+    are kept with a memory proportional to their number of runs. They are 
+    only expanded to a dense array when required, for example one chunk 
+    at a time when they are sent to the server.
+    
+    Parameters
+    ----------
+    starts : numpy.ndarray
+        First ID of each run.
+    lengths : numpy.ndarray
+        Number of IDs in each run.
+    """
+    
+    # minimum number of IDs per run for the IDs to be stored as runs
+    MIN_MEAN_RUN_LENGTH = 8
+    
+    def __init__(self, starts, lengths):
+        self.starts = np.asarray(starts, dtype=np.int64).reshape(-1)
+        self.lengths = np.asarray(lengths, dtype=np.int64).reshape(-1)
+        self.offsets = np.zeros(self.starts.size + 1, dtype=np.int64)
+        np.cumsum(self.lengths, out=self.offsets[1:])
+        self._is_sorted = None
+    
+    @staticmethod
+    def from_range(ids):
+        """Store a ``range`` of step 1 as a single run.
+        
+        Returns
+        -------
+        _RunLengthIds or None
+            ``None`` if the step of the range is not 1.
+        """
+        if ids.step != 1:
+            return None
+        if len(ids) == 0:
+            return _RunLengthIds([], [])
+        return _RunLengthIds([ids.start], [len(ids)])
+    
+    @staticmethod
+    def from_array(ids):
+        """Split an array of IDs, for example from ``numpy.arange``, in runs.
+        
+        Returns
+        -------
+        _RunLengthIds or None
+            ``None`` if the runs are too short for the compression to pay off.
+        """
+        ids = np.asarray(ids).reshape(-1)
+        if ids.size == 0 or not np.issubdtype(ids.dtype, np.integer):
+            return None
+        breaks = np.flatnonzero(np.diff(ids) != 1) + 1
+        if (breaks.size + 1) * _RunLengthIds.MIN_MEAN_RUN_LENGTH > ids.size:
+            return None
+        bounds = np.concatenate(([0], breaks, [ids.size]))
+        return _RunLengthIds(ids[bounds[:-1]], np.diff(bounds))
+    
+    @property
+    def size(self):
+        return int(self.offsets[-1])
+    
+    def __len__(self):
+        return self.size
+    
+    def __getitem__(self, key):
+        """Expand a slice of the IDs to a dense int32 array."""
+        start, stop, step = key.indices(self.size)
+        return self.take(np.arange(start, stop, step))
+    
+    def dense(self):
+        """Expand all the IDs to a dense int32 array."""
+        return self.take(np.arange(self.size))
+    
+    def take(self, indices):
+        """Retrieve the IDs at several indices.
+        
+        Parameters
+        ----------
+        indices : numpy.ndarray
+        
+        Returns
+        -------
+        numpy.ndarray
+            IDs as int32.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if indices.size > 0 and (indices.min() < 0 or indices.max() >= self.size):
+            raise IndexError(f"indices must be in [0, {self.size}[")
+        runs = np.searchsorted(self.offsets, indices, side="right") - 1
+        return (self.starts[runs] + indices - self.offsets[runs]).astype(np.int32)
+    
+    @property
+    def is_sorted(self):
+        """Whether the IDs are strictly increasing, which is required by 
+        :func:`index_of`."""
+        if self._is_sorted is None:
+            self._is_sorted = bool(np.all(self.starts[1:] >= self.starts[:-1] + self.lengths[:-1]))
+        return self._is_sorted
+    
+    def index_of(self, ids):
+        """Find the indices of several IDs in strictly increasing runs.
+        
+        Returns
+        -------
+        numpy.ndarray
+            Index of each ID, ``-1`` if it is missing.
+        """
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        if self.starts.size == 0:
+            return np.full(ids.size, -1, dtype=np.int64)
+        runs = np.maximum(np.searchsorted(self.starts, ids, side="right") - 1, 0)
+        shift = ids - self.starts[runs]
+        inside = (shift >= 0) & (shift < self.lengths[runs])
+        return np.where(inside, self.offsets[runs] + shift, -1)
+
+
+def _combine_runs(runs, other_runs, keep):
+    """Set operation between two IDs stored as strictly increasing runs.
+    
+    The bounds of all the runs split the IDs in segments that are either 
+    fully in or fully out of each operand, so that the operation is done 
+    per segment instead of per ID.
+    
+    Parameters
+    ----------
+    runs : _RunLengthIds
+    other_runs : _RunLengthIds
+    keep : callable
+        Operation on the membership masks of the segments in ``runs`` and 
+        in ``other_runs``, returning the mask of the segments to keep.
+    
+    Returns
+    -------
+    _RunLengthIds
+        Strictly increasing runs.
+    """
+    ends = runs.starts + runs.lengths
+    other_ends = other_runs.starts + other_runs.lengths
+    bounds = np.unique(np.concatenate((runs.starts, ends, other_runs.starts, other_ends)))
+    seg_starts, seg_ends = bounds[:-1], bounds[1:]
+    
+    def covered(starts, ends):
+        return (np.searchsorted(starts, seg_starts, side="right") 
+                > np.searchsorted(ends, seg_starts, side="right"))
+    
+    mask = keep(covered(runs.starts, ends), covered(other_runs.starts, other_ends))
+    seg_starts, seg_ends = seg_starts[mask], seg_ends[mask]
+    if seg_starts.size == 0:
+        return _RunLengthIds([], [])
+    # merge the kept segments that touch each other
+    first = np.flatnonzero(np.concatenate(([True], seg_starts[1:] != seg_ends[:-1])))
+    last = np.append(first[1:] - 1, seg_starts.size - 1)
+    return _RunLengthIds(seg_starts[first], seg_ends[last] - seg_starts[first])
+
+
+def _data_chunk_yielder(request, data, chunk_size=DEFAULT_FILE_CHUNK_SIZE):
+    """Yield ``request`` once per chunk of ``data`` with its ``array`` set to the
+    raw bytes of the chunk.
+
+    Chunks are contiguous memoryview slices of the source buffer, sized from the
+    element size of ``data`` so that each message holds at most ``chunk_size``
+    bytes. Each byte is therefore copied only once, into the message. IDs 
+    stored as runs are expanded one chunk at a time.
+    """
+    if isinstance(data, _RunLengthIds):
+        dtype = np.dtype(np.int32)
+        buffer = data
+    else:
+        data = np.ascontiguousarray(data).reshape(-1)
+        dtype = data.dtype
+        buffer = memoryview(data)
+    length = len(buffer)
     need_progress_bar = length>1e6
     if need_progress_bar:
-        bar =_common_progress_bar("Sending data...", unit=data.dtype.name, tot_size =length)
+        bar =_common_progress_bar("Sending data...", unit=dtype.name, tot_size =length)
         bar.start()
-    sent_length =0
     if length == 0:
         yield request
         return
-    unitary_size =int(chunk_size//sys.getsizeof(data[0]))
-    if length-sent_length<unitary_size:
-        unitary_size= length-sent_length
+    unitary_size = max(int(chunk_size//dtype.itemsize), 1)
+    sent_length =0
     while sent_length<length:
-        currentcopy = data.take(range(sent_length,sent_length+unitary_size))
-        request.array= currentcopy.tobytes()
-        sent_length=sent_length+unitary_size
-        if length-sent_length<unitary_size:
-            unitary_size= length-sent_length
+        end = min(sent_length+unitary_size, length)
+        request.array = buffer[sent_length:end].tobytes()
+        sent_length = end
         yield request
         try:
             if need_progress_bar:
@@ -378,11 +868,24 @@ def _data_chunk_yielder(request, data, chunk_size=DEFAULT_FILE_CHUNK_SIZE):
             bar.finish()
     except:
         pass
-    
-    
 
 
-def _data_get_chunk_(dtype, service, np_array=True):
+def _data_get_chunk_(dtype, service, np_array=True, out=None):
+    """Receive the whole content of a ``List`` stream.
+    
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Type of the streamed values.
+    service : 
+        Response stream whose chunks hold raw bytes in ``array``.
+    np_array : bool, optional
+        Whether to return a numpy array or a list. The default is ``True``.
+    out : numpy.ndarray, optional
+        C-contiguous array of ``dtype`` with exactly as many values as 
+        the stream, which is filled in place and returned instead of 
+        allocating a new array.
+    """
     tupleMetaData = service.initial_metadata()
     
     need_progress_bar = False
@@ -392,14 +895,19 @@ def _data_get_chunk_(dtype, service, np_array=True):
             
         
     itemsize = np.dtype(dtype).itemsize
+    if out is not None and out.size != size//itemsize:
+        raise ValueError(f"out has {out.size} values while {size//itemsize} are streamed")
     need_progress_bar = size//itemsize>1e6
     if need_progress_bar:
         bar =_common_progress_bar("Receiving data...", unit=dtype.__name__+"s", tot_size = size//itemsize)
         bar.start()
         
         
-    if np_array:
-        arr = np.empty(size//itemsize, dtype)
+    if np_array or out is not None:
+        if out is None:
+            arr = np.empty(size//itemsize, dtype)
+        else:
+            arr = out.reshape(-1)
         i = 0
         for chunk in service:
             curr_size = len(chunk.array)//itemsize
@@ -410,15 +918,14 @@ def _data_get_chunk_(dtype, service, np_array=True):
                     bar.update(i)
             except:
                 pass
+        if out is not None:
+            arr = out
 
     else:
         arr=[]
-        if dtype==np.float:
-            dtype = 'd'
-        else:
-            dtype='i'
+        typecode = np.dtype(dtype).char
         for chunk in service:
-            arr.extend(array.array(dtype,chunk.array))
+            arr.extend(array.array(typecode,chunk.array))
             try:
                 if need_progress_bar:
                     bar.update(len(arr))
@@ -430,3 +937,156 @@ def _data_get_chunk_(dtype, service, np_array=True):
     except:
         pass
     return arr
+
+
+def _data_iter_chunks_(dtype, service):
+    """Yield the content of each chunk of a ``List`` stream as it arrives.
+    
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Type of the streamed values.
+    service : 
+        Response stream whose chunks hold raw bytes in ``array``.
+    
+    Yields
+    ------
+    numpy.ndarray
+        Read-only array over the values of the chunk. Bytes of a value split
+        between two chunks are carried over to the next array.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    remainder = b""
+    for chunk in service:
+        buffer = remainder + chunk.array if remainder else chunk.array
+        count = len(buffer)//itemsize
+        remainder = buffer[count*itemsize:]
+        if count > 0:
+            yield np.frombuffer(buffer, dtype, count=count)
+
+
+def _stream_size(service):
+    """Number of bytes announced in the ``size_tot`` metadata of a ``List`` stream."""
+    for meta in service.initial_metadata():
+        if meta.key == u"size_tot":
+            return int(meta.value)
+    return 0
+
+
+def _data_forwarder(service, request):
+    """Yield ``request`` once per chunk of a ``List`` stream, with its ``array``
+    set to the raw bytes of the chunk as soon as it arrives.
+    
+    Used to pipe data from one server to another without holding more than 
+    one chunk at a time.
+    """
+    empty = True
+    for chunk in service:
+        empty = False
+        request.array = chunk.array
+        yield request
+    if empty:
+        yield request
+
+
+def _sort_ids(scoping_ids):
+    """Sort the IDs of a scoping for lookups.
+    
+    Returns
+    -------
+    order : numpy.ndarray
+        Indices sorting the IDs, the first occurrence of an ID first.
+    sorted_ids : numpy.ndarray
+        Sorted IDs.
+    """
+    scoping_ids = np.asarray(scoping_ids).reshape(-1)
+    if np.all(scoping_ids[1:] >= scoping_ids[:-1]):
+        return np.arange(scoping_ids.size), scoping_ids
+    order = np.argsort(scoping_ids, kind="stable")
+    return order, scoping_ids[order]
+
+
+def _lookup_sorted_ids(order, sorted_ids, ids):
+    """Find the indices of several IDs with the output of :func:`_sort_ids`.
+    
+    Returns
+    -------
+    indices : numpy.ndarray
+        Index of the first occurrence of each ID, ``-1`` if it is missing.
+    """
+    ids = np.asarray(ids).reshape(-1)
+    positions = np.searchsorted(sorted_ids, ids)
+    found = positions < sorted_ids.size
+    found[found] = sorted_ids[positions[found]] == ids[found]
+    indices = np.full(ids.size, -1, dtype=np.int64)
+    indices[found] = order[positions[found]]
+    return indices
+
+
+# marks scopings whose IDs are too sparse for a table from ID to index
+_NO_ID_TABLE = object()
+
+
+def _build_id_table(scoping_ids):
+    """Build a direct-address table from ID to index.
+    
+    Returns
+    -------
+    tuple or None
+        Smallest ID and index of each ID from it, the first occurrence of 
+        an ID winning, or ``None`` if the table would be more than twice 
+        as large as the IDs.
+    """
+    scoping_ids = np.asarray(scoping_ids).reshape(-1)
+    if scoping_ids.size == 0:
+        return None
+    min_id = int(scoping_ids.min())
+    span = int(scoping_ids.max()) - min_id + 1
+    if span > 2 * scoping_ids.size:
+        return None
+    table = np.full(span, -1, dtype=np.int64)
+    unique_ids, first_indices = np.unique(scoping_ids, return_index=True)
+    table[unique_ids.astype(np.int64) - min_id] = first_indices
+    return min_id, table
+
+
+def _lookup_id_table(min_id, table, ids):
+    """Find the indices of several IDs with the output of :func:`_build_id_table`.
+    
+    Returns
+    -------
+    indices : numpy.ndarray
+        Index of each ID, ``-1`` if it is missing.
+    """
+    shifted = np.asarray(ids, dtype=np.int64).reshape(-1) - min_id
+    inside = (shifted >= 0) & (shifted < table.size)
+    indices = np.full(shifted.size, -1, dtype=np.int64)
+    indices[inside] = table[shifted[inside]]
+    return indices
+
+
+def _ids_to_indices(scoping_ids, ids):
+    """Find the indices of several IDs in the IDs of a scoping.
+    
+    Parameters
+    ----------
+    scoping_ids : numpy.ndarray
+        IDs of the scoping.
+    ids : list of int or numpy.ndarray
+        IDs to look for.
+    
+    Returns
+    -------
+    indices : numpy.ndarray
+        Index of the first occurrence of each ID in ``scoping_ids``.
+    """
+    indices = _lookup_sorted_ids(*_sort_ids(scoping_ids), ids)
+    _check_found(indices, ids)
+    return indices
+
+
+def _check_found(indices, ids):
+    missing = indices < 0
+    if missing.any():
+        ids = np.asarray(ids).reshape(-1)
+        raise ValueError(f"The ids {ids[missing][:10].tolist()} don't exist in the scoping")
@@ -12,13 +12,14 @@ import os
 import socket
 import subprocess
 import grpc
+import numpy as np
 import psutil
 import weakref
 import atexit
 import copy
 
 from ansys import dpf
-from ansys.dpf.core.misc import find_ansys, is_ubuntu
+from ansys.dpf.core.misc import find_ansys, is_ubuntu, DEFAULT_FILE_CHUNK_SIZE
 from ansys.dpf.core import errors
 
 from ansys.dpf.core._version import __ansys_version__
@@ -314,6 +315,8 @@ class DpfServer:
         self._input_ip = ip
         self._input_port = port
         self._own_process = launch_server
+        self._chunk_size = DEFAULT_FILE_CHUNK_SIZE
+        self._float_dtype = np.float64
         
     @property
     def _base_service(self):
@@ -371,6 +374,46 @@ class DpfServer:
         """
         return self._base_service.server_info["server_version"]
 
+    @property
+    def chunk_size(self):
+        """Maximum size in bytes of each message streamed to the server.
+        
+        This size is used when sending field data, data pointers, and scoping 
+        IDs. The default is ``65536``.
+        
+        Returns
+        -------
+        chunk_size : int
+        """
+        return self._chunk_size
+    
+    @chunk_size.setter
+    def chunk_size(self, value):
+        if int(value) <= 0:
+            raise ValueError('Chunk size must be a positive integer')
+        self._chunk_size = int(value)
+
+    @property
+    def float_dtype(self):
+        """Default precision of the floating point data received from the server.
+        
+        Setting ``numpy.float32`` halves the volume of field data transferred 
+        and the memory used on the client side, at the cost of the precision. 
+        The default is ``numpy.float64``.
+        
+        Returns
+        -------
+        float_dtype : numpy.float32 or numpy.float64
+        """
+        return self._float_dtype
+    
+    @float_dtype.setter
+    def float_dtype(self, value):
+        dtype = np.dtype(value)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError('Float dtype must be numpy.float32 or numpy.float64')
+        self._float_dtype = dtype.type
+
     def __str__(self): 
         return f'DPF Server: {self.info}'
 
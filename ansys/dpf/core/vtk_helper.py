@@ -1,3 +1,6 @@
+import hashlib
+import os
+
 import numpy as np
 from vtk import (VTK_EMPTY_CELL, VTK_EMPTY_CELL, VTK_VERTEX,
                  VTK_POLY_VERTEX, VTK_LINE, VTK_POLY_LINE,
@@ -11,8 +14,11 @@ from vtk import (VTK_EMPTY_CELL, VTK_EMPTY_CELL, VTK_VERTEX,
                  VTK_QUADRATIC_WEDGE, VTK_QUADRATIC_PYRAMID,
                  VTK_BIQUADRATIC_QUAD, VTK_TRIQUADRATIC_HEXAHEDRON,
                  VTK_QUADRATIC_LINEAR_QUAD,
-                 VTK_QUADRATIC_LINEAR_WEDGE,
-                 vtkVersion)
+                 VTK_QUADRATIC_LINEAR_WEDGE, VTK_CONVEX_POINT_SET,
+                 VTK_UNSIGNED_CHAR, vtkVersion, vtkCellArray, vtkPoints,
+                 vtkUnstructuredGrid)
+from vtk.util.numpy_support import (numpy_to_vtk, numpy_to_vtkIdTypeArray, 
+                                    ID_TYPE_CODE)
 import pyvista as pv
 
 VTK9 = vtkVersion().GetVTKMajorVersion() >= 9
@@ -49,7 +55,10 @@ SIZE_MAPPING = np.array([10,  # kAnsTet10
                          2,  # kAnsEdge2
                          3,  # kAnsEdge3
                          3,  # kAnsBeam3
-                         4])  # kAnsBeam4
+                         4,  # kAnsBeam4
+                         0,  # kAnsGeneralPlaceholder
+                         0,  # kAnsPolygon (any number of nodes)
+                         0])  # kAnsPolyhedron (any number of nodes)
 
 
 
@@ -87,7 +96,10 @@ VTK_MAPPING = np.array([VTK_QUADRATIC_TETRA,  # kAnsTet10 = 0,
                         0,  # kAnsEdge2 = 28,
                         0,  # kAnsEdge3 = 29,
                         0,  # kAnsBeam3 = 30,
-                        0])  # kAnsBeam4 = 31,
+                        0,  # kAnsBeam4 = 31,
+                        0,  # kAnsGeneralPlaceholder = 32,
+                        VTK_POLYGON,  # kAnsPolygon = 33,
+                        VTK_CONVEX_POINT_SET])  # kAnsPolyhedron = 34,
 
 
 # map all cells to linear
@@ -122,13 +134,104 @@ VTK_LINEAR_MAPPING = np.array([VTK_TETRA,  # kAnsTet10 = 0,
                                0,  # kAnsEdge2 = 28,
                                0,  # kAnsEdge3 = 29,
                                0,  # kAnsBeam3 = 30,
-                               0])  # kAnsBeam4 = 31,
+                               0,  # kAnsBeam4 = 31,
+                               0,  # kAnsGeneralPlaceholder = 32,
+                               VTK_POLYGON,  # kAnsPolygon = 33,
+                               VTK_CONVEX_POINT_SET])  # kAnsPolyhedron = 34,
+
+
+# Maps dpf cell types to the number of nodes of their VTK cell, the first 
+# nodes of the dpf element, -1 meaning all the nodes of the element
+VTK_SIZE_MAPPING = np.array([10,  # kAnsTet10
+                             20,  # kAnsHex20
+                             6,  # kAnsWedge15, as a linear wedge
+                             13,  # kAnsPyramid13
+                             6,  # kAnsTri6
+                             6,  # kAnsTriShell6
+                             8,  # kAnsQuad8
+                             8,  # kAnsQuadShell8
+                             3,  # kAnsLine3
+                             1,  # kAnsPoint1
+                             4,  # kAnsTet4
+                             8,  # kAnsHex8
+                             6,  # kAnsWedge6
+                             5,  # kAnsPyramid5
+                             3,  # kAnsTri3
+                             3,  # kAnsTriShell3
+                             4,  # kAnsQuad4
+                             4,  # kAnsQuadShell4
+                             2,  # kAnsLine2
+                             0,  # kAnsNumElementTypes
+                             0,  # kAnsUnknown
+                             0,  # kAnsEMagLine
+                             0,  # kAnsEMagArc
+                             0,  # kAnsEMagCircle
+                             3,  # kAnsSurface3
+                             4,  # kAnsSurface4
+                             6,  # kAnsSurface6
+                             8,  # kAnsSurface8
+                             0,  # kAnsEdge2
+                             0,  # kAnsEdge3
+                             0,  # kAnsBeam3
+                             0,  # kAnsBeam4
+                             0,  # kAnsGeneralPlaceholder
+                             -1,  # kAnsPolygon
+                             -1])  # kAnsPolyhedron
+
+
+# number of nodes of the VTK cells when all cells are mapped to linear: 
+# the corner nodes come first in the dpf connectivity
+VTK_LINEAR_SIZE_MAPPING = np.array([4,  # kAnsTet10
+                                    8,  # kAnsHex20
+                                    6,  # kAnsWedge15
+                                    5,  # kAnsPyramid13
+                                    3,  # kAnsTri6
+                                    3,  # kAnsTriShell6
+                                    4,  # kAnsQuad8
+                                    4,  # kAnsQuadShell8
+                                    2,  # kAnsLine3
+                                    1,  # kAnsPoint1
+                                    4,  # kAnsTet4
+                                    8,  # kAnsHex8
+                                    6,  # kAnsWedge6
+                                    5,  # kAnsPyramid5
+                                    3,  # kAnsTri3
+                                    3,  # kAnsTriShell3
+                                    4,  # kAnsQuad4
+                                    4,  # kAnsQuadShell4
+                                    2,  # kAnsLine2
+                                    0,  # kAnsNumElementTypes
+                                    0,  # kAnsUnknown
+                                    0,  # kAnsEMagLine
+                                    0,  # kAnsEMagArc
+                                    0,  # kAnsEMagCircle
+                                    3,  # kAnsSurface3
+                                    4,  # kAnsSurface4
+                                    6,  # kAnsSurface6
+                                    8,  # kAnsSurface8
+                                    0,  # kAnsEdge2
+                                    0,  # kAnsEdge3
+                                    0,  # kAnsBeam3
+                                    0,  # kAnsBeam4
+                                    0,  # kAnsGeneralPlaceholder
+                                    -1,  # kAnsPolygon
+                                    -1])  # kAnsPolyhedron
 
+# dpf cell types with any number of nodes
+VARIABLE_SIZE_TYPES = np.flatnonzero(VTK_SIZE_MAPPING < 0)
 
-def dpf_mesh_to_vtk(nodes, etypes, connectivity, as_linear=True):
+# version of the grids saved in the ``.vtu`` cache, to change when 
+# the grids built for the same mesh change
+_VTU_CACHE_VERSION = 1
+
+
+def dpf_mesh_to_vtk(nodes, etypes, connectivity, as_linear=True, 
+                    offsets=None, cache_dir=None):
     """Return a pyvista unstructured grid given DPF node and element
     definitions.
 
+    The input arrays are never modified.
+
     Parameters
     ----------
     nodes : np.ndarray
@@ -140,65 +243,121 @@ def dpf_mesh_to_vtk(nodes, etypes, connectivity, as_linear=True):
     connectivity : np.ndarray
         Array containing the nodes used by each element.
 
+    as_linear : bool, optional
+        Whether to only keep the corner nodes of the quadratic elements.
+        The default is ``True``.
+
+    offsets : np.ndarray, optional
+        Index of the first node of each element in ``connectivity``, with 
+        an optional last offset equal to the size of ``connectivity``, such 
+        as the data pointer of the connectivities field. The default is 
+        ``None``, in which case the number of nodes of each element is 
+        deduced from its type, which is not supported for polygons and 
+        polyhedra.
+
+    cache_dir : str, optional
+        Directory of ``.vtu`` files named after the content of the meshes.
+        The grid is read from this directory when it is already there, and 
+        saved to it otherwise. The default is ``None``, in which case the 
+        grid is always built.
+
     Returns
     -------
     grid : pyvista.UnstructuredGrid
         Unstructred grid of the DPF mesh.
+
+    Notes
+    -----
+    Polyhedra are built as VTK convex point sets since their faces are 
+    not part of the DPF connectivity.
     """
-    # could make this more efficient in C...
-    elem_size = SIZE_MAPPING[etypes]
-    insert_ind = np.cumsum(elem_size)
-    insert_ind = np.hstack(([0], insert_ind))[:-1]
+    nodes = np.asarray(nodes, dtype=float).reshape(-1, 3)
+    etypes = np.asarray(etypes).reshape(-1)
+    connectivity = np.asarray(connectivity).reshape(-1)
+    if offsets is None:
+        if np.isin(etypes, VARIABLE_SIZE_TYPES).any():
+            raise ValueError("offsets are required for meshes with polygons or polyhedra")
+        offsets = np.zeros(etypes.size + 1, dtype=np.int64)
+        np.cumsum(SIZE_MAPPING[etypes], out=offsets[1:])
+    else:
+        offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+        if offsets.size == etypes.size:
+            offsets = np.append(offsets, connectivity.size)
 
-    # TODO: Investigate why connectivity can be -1
-    nullmask = connectivity == -1
-    connectivity[nullmask] = 0
-    if nullmask.any():
-        nodes[0] = np.nan
+    if cache_dir is None:
+        return _build_grid(nodes, etypes, connectivity, offsets, as_linear)
 
-    # partition cells in vtk format
-    cells = np.insert(connectivity, insert_ind, elem_size)
+    path = os.path.join(cache_dir, _cache_key(nodes, etypes, connectivity, 
+                                              offsets, as_linear) + ".vtu")
+    if os.path.isfile(path):
+        return pv.read(path)
+    grid = _build_grid(nodes, etypes, connectivity, offsets, as_linear)
+    os.makedirs(cache_dir, exist_ok=True)
+    # write to a temporary file first for readers never to see a partial file
+    tmp_path = f"{path[:-4]}.{os.getpid()}.tmp.vtu"
+    grid.save(tmp_path)
+    os.replace(tmp_path, path)
+    return grid
 
-    def compute_offset():
-        """Return the starting point of a cell in the cells array"""
-        return insert_ind + np.arange(insert_ind.size)
 
-    # convert kAns to VTK cell type
-    offset = None
+def _build_grid(nodes, etypes, connectivity, offsets, as_linear):
+    """Build the grid from the connectivity of the elements in the CSR format."""
     if as_linear:
         vtk_cell_type = VTK_LINEAR_MAPPING[etypes]
-
-        # visualization bug within VTK with quadratic surf cells
-        ansquad8_mask = etypes == 6
-        if np.any(ansquad8_mask):  # kAnsQuad8
-
-            # simply copy the edge node indices to the midside points
-            offset = compute_offset()
-            cell_pos = offset[ansquad8_mask]
-            cells[cell_pos + 5] = cells[cell_pos + 1]
-            cells[cell_pos + 6] = cells[cell_pos + 2]
-            cells[cell_pos + 7] = cells[cell_pos + 3]
-            cells[cell_pos + 8] = cells[cell_pos + 4]
-
-        anstri6_mask = etypes == 4  # kAnsTri6 = 4
-        if np.any(anstri6_mask):
-            if offset is None:
-                offset = compute_offset()
-            cell_pos = offset[anstri6_mask]
-            cells[cell_pos + 4] = cells[cell_pos + 1]
-            cells[cell_pos + 5] = cells[cell_pos + 2]
-            cells[cell_pos + 6] = cells[cell_pos + 3]
-
+        max_sizes = VTK_LINEAR_SIZE_MAPPING[etypes]
     else:
         vtk_cell_type = VTK_MAPPING[etypes]
+        max_sizes = VTK_SIZE_MAPPING[etypes]
+
+    # VTK cells only use the first nodes of some elements, such as the 
+    # corner nodes of the quadratic elements when mapped to linear
+    cells = connectivity[offsets[0]:offsets[-1]]
+    cell_offsets = offsets - offsets[0]
+    sizes = np.diff(offsets)
+    cell_sizes = np.where(max_sizes < 0, sizes, np.minimum(sizes, max_sizes))
+    if not np.array_equal(cell_sizes, sizes):
+        position_in_element = np.arange(cells.size) - np.repeat(cell_offsets[:-1], sizes)
+        cells = cells[position_in_element < np.repeat(cell_sizes, sizes)]
+        cell_offsets = np.zeros(cell_sizes.size + 1, dtype=np.int64)
+        np.cumsum(cell_sizes, out=cell_offsets[1:])
+
+    # TODO: Investigate why connectivity can be -1
+    # missing nodes are replaced by the first node of their cell
+    null_positions = np.flatnonzero(cells < 0)
+    if null_positions.size:
+        cell_indices = np.searchsorted(cell_offsets, null_positions, side="right") - 1
+        cells = cells.copy()
+        cells[null_positions] = np.maximum(cells[cell_offsets[cell_indices]], 0)
 
-    # different treatment depending on the version of vtk
     if VTK9:
-        # compute offset array when < VTK v9
-        return pv.UnstructuredGrid(cells, vtk_cell_type, nodes)
+        cell_array = vtkCellArray()
+        cell_array.SetData(
+            numpy_to_vtkIdTypeArray(np.ascontiguousarray(cell_offsets, dtype=ID_TYPE_CODE), deep=True),
+            numpy_to_vtkIdTypeArray(np.ascontiguousarray(cells, dtype=ID_TYPE_CODE), deep=True))
+        points = vtkPoints()
+        points.SetData(numpy_to_vtk(np.ascontiguousarray(nodes), deep=True))
+        grid = vtkUnstructuredGrid()
+        grid.SetPoints(points)
+        grid.SetCells(numpy_to_vtk(vtk_cell_type.astype(np.uint8), deep=True,
+                                   array_type=VTK_UNSIGNED_CHAR), cell_array)
+        return pv.wrap(grid)
+
+    # before VTK 9, cells are stored as the number of nodes of each cell 
+    # followed by its nodes, and located by the position of their size
+    location = cell_offsets[:-1] + np.arange(cell_sizes.size)
+    legacy_cells = np.empty(cells.size + cell_sizes.size, dtype=ID_TYPE_CODE)
+    is_size = np.zeros(legacy_cells.size, dtype=bool)
+    is_size[location] = True
+    legacy_cells[location] = cell_sizes
+    legacy_cells[~is_size] = cells
+    return pv.UnstructuredGrid(location, legacy_cells, vtk_cell_type, nodes)
 
-    # might be computed when checking for VTK quadratic bug
-    if offset is None:
-        offset = compute_offset()
 
-    return pv.UnstructuredGrid(offset, cells, vtk_cell_type, nodes)
+def _cache_key(nodes, etypes, connectivity, offsets, as_linear):
+    """Name of the ``.vtu`` file of a mesh, hashed from its content."""
+    key = hashlib.blake2b(digest_size=20)
+    key.update(f"{_VTU_CACHE_VERSION}:{bool(as_linear)}:{nodes.shape[0]}:{etypes.size}".encode())
+    for array, dtype in ((nodes, np.float64), (etypes, np.int32), 
+                         (connectivity, np.int32), (offsets, np.int64)):
+        key.update(np.ascontiguousarray(array, dtype=dtype).data)
+    return key.hexdigest()
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from ansys import dpf
+
+
+@pytest.fixture()
+def simple_bar_model(simple_bar):
+    return dpf.core.Model(simple_bar)
+
+
+def test_elemental_nodal_to_nodal_averaging_kernel(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    stress = simple_bar_model.results.stress().outputs.fields_container()
+    kernel = dpf.core.AveragingKernel(mesh)
+    values = kernel.elemental_nodal_to_nodal(stress)
+    assert values.shape == (1, len(mesh.nodes.scoping.ids), 6)
+    nodal = stress[0].to_nodal()
+    ind, mask = mesh.nodes.map_scoping(nodal.scoping)
+    assert np.allclose(values[0][ind], nodal.data[mask])
+    plans = [key for key in mesh.topology_cache._entries if key[0] == "averaging_plan"]
+    assert len(plans) == 1
+    kernel.elemental_nodal_to_nodal(stress[0])
+    assert [key for key in mesh.topology_cache._entries if key[0] == "averaging_plan"] == plans
+    mesh.topology_cache.invalidate()
+    assert plans[0] not in mesh.topology_cache
+
+
+def test_elemental_nodal_by_body_averaging_kernel():
+    # two quadrangles of two bodies sharing the nodes 2 and 5
+    coordinates = [[0., 0., 0.], [1., 0., 0.], [2., 0., 0.],
+                   [0., 1., 0.], [1., 1., 0.], [2., 1., 0.]]
+    mesh = dpf.core.MeshedRegion.from_arrays(
+        node_ids=np.arange(1, 7), coordinates=coordinates,
+        element_ids=[1, 2], element_types=[dpf.core.element_types.Quad4.value] * 2,
+        connectivity=[0, 1, 4, 3, 1, 2, 5, 4], offsets=[0, 4], materials=[1, 2])
+    field = dpf.core.fields_factory.create_scalar_field(
+        2, location=dpf.core.locations.elemental_nodal)
+    field.append_many([1, 2], [1., 1., 1., 1., 3., 3., 3., 3.], offsets=[0, 4, 8])
+    kernel = dpf.core.AveragingKernel(mesh)
+    by_body = kernel.elemental_nodal_to_nodal(field, by_body=True)
+    assert np.allclose(by_body, [1., 1., 1., 1., 3., 3., 3., 3.])
+    nodal = kernel.elemental_nodal_to_nodal(field)
+    assert np.allclose(nodal, [1., 2., 3., 1., 2., 3.])
+
+
+def test_nodal_elemental_averaging_kernel(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    coordinates = mesh.nodes.coordinates_field
+    kernel = dpf.core.AveragingKernel(mesh)
+    centroids = kernel.nodal_to_elemental(coordinates)
+    assert centroids.shape == (len(mesh.elements.scoping.ids), 3)
+    connectivity, offsets = mesh.elements._connectivity
+    nodes = mesh.nodes._coordinates[connectivity[offsets[0]:offsets[1]]]
+    assert np.allclose(centroids[0], nodes.mean(axis=0))
+    elemental = dpf.core.fields_factory.field_from_array(centroids)
+    elemental.location = dpf.core.locations.elemental
+    elemental.scoping = mesh.elements.scoping
+    nodal = kernel.elemental_to_nodal(elemental)
+    assert nodal.shape == (len(mesh.nodes.scoping.ids), 3)
+    assert not np.isnan(nodal).any()
@@ -661,6 +661,48 @@ def test_get_set_data_elemental_nodal_local_field():
 
     
         
+def test_local_field_data_view():
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(2)
+    field_to_local.data = np.zeros((2,3))
+    field_to_local.scoping.ids = [1,2]
+    with field_to_local.as_local_field() as f:
+        f.data[1] = [1.,2.,3.]
+        f.get_entity_data_by_id(1)[0] = 4.
+        assert np.allclose(f.get_entity_data(1), [1.,2.,3.])
+        assert f.shape == (2,3)
+    assert np.allclose(field_to_local.data, [[4.,0.,0.],[1.,2.,3.]])
+    
+        
+def test_local_field_release_modified_data():
+    num_entities = 10000
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(num_entities)
+    data = np.zeros((num_entities, 3))
+    field_to_local.data = data
+    field_to_local.scoping.ids = range(1, num_entities+1)
+    with field_to_local.as_local_field() as f:
+        f.data[10] = [1., 2., 3.]
+        f.get_entity_data_by_id(5000)[0, 1] = 4.
+    data[10] = [1., 2., 3.]
+    data[4999, 1] = 4.
+    assert np.allclose(field_to_local.data, data)
+    with field_to_local.as_local_field() as f:
+        f.scoping_ids[0] = num_entities+1
+    assert field_to_local.scoping.ids[0] == num_entities+1
+    assert np.allclose(field_to_local.data, data)
+    
+        
+def test_local_field_release_negated_entity():
+    num_entities = 10
+    field_to_local = dpf.core.fields_factory.create_vector_field(num_entities, 6)
+    data = np.arange(1., 6*num_entities + 1).reshape(num_entities, 6)
+    field_to_local.data = data
+    field_to_local.scoping.ids = range(1, num_entities+1)
+    with field_to_local.as_local_field() as f:
+        f.data[1] *= -1
+    data[1] *= -1
+    assert np.allclose(field_to_local.data, data)
+    
+        
 def test_empty_data_field():
     field_to_local = dpf.core.fields_factory.create_3d_vector_field(100)
     data=[1.,2.,3.]
@@ -716,6 +758,181 @@ def test_field_huge_amount_of_data(allkindofcomplexity):
     assert np.allclose(new_modif_data, modif_data)
     
     
+def test_set_get_data_small_chunk_size_field():
+    server = dpf.core._global_server()
+    chunk_size = server.chunk_size
+    server.chunk_size = 1000
+    try:
+        field = dpf.core.fields_factory.create_3d_vector_field(10000)
+        data = np.arange(30000.).reshape(10000, 3)
+        field.data = data
+        field.scoping.ids = range(1, 10001)
+        assert np.allclose(field.data, data)
+        assert np.allclose(field.scoping.ids, range(1, 10001))
+    finally:
+        server.chunk_size = chunk_size
+    
+    
+def test_get_data_float32_field():
+    field = dpf.core.fields_factory.create_3d_vector_field(100)
+    data = np.arange(300).reshape(100,3)/7.
+    field.data = data
+    data_float = field.get_data(np.float32)
+    assert data_float.dtype == np.float32
+    assert np.allclose(data_float, data)
+    server = dpf.core._global_server()
+    server.float_dtype = np.float32
+    try:
+        assert field.data.dtype == np.float32
+        assert field.get_entity_data(0).dtype == np.float32
+        assert np.allclose(field.get_entity_data(0), data[0])
+    finally:
+        server.float_dtype = np.float64
+    assert field.data.dtype == np.float64
+    
+    
+def test_local_field_float32_server_keeps_precision():
+    field = dpf.core.fields_factory.create_3d_vector_field(100)
+    data = np.arange(300).reshape(100,3)/7.
+    field.data = data
+    field.scoping.ids = range(1, 101)
+    server = dpf.core._global_server()
+    server.float_dtype = np.float32
+    try:
+        with field.as_local_field() as f:
+            assert f.data.dtype == np.float64
+            f.data[0] = [1., 2., 3.]
+    finally:
+        server.float_dtype = np.float64
+    data[0] = [1., 2., 3.]
+    assert np.array_equal(field.data, data)
+    
+    
+def test_get_entities_data_field():
+    field = dpf.core.fields_factory.create_3d_vector_field(10)
+    field.data = np.arange(30.).reshape(10,3)
+    field.scoping.ids = range(11, 21)
+    assert np.allclose(field.get_entities_data([3, 1]), [[9., 10., 11.], [3., 4., 5.]])
+    assert np.allclose(field.get_entities_data_by_ids([20, 11]), [[27., 28., 29.], [0., 1., 2.]])
+    with pytest.raises(ValueError):
+        field.get_entities_data_by_ids([1])
+        
+        
+def test_get_entities_data_elemental_nodal_field():
+    num_entities = 3
+    field = dpf.core.fields_factory.create_3d_vector_field(num_entities, location=dpf.core.locations.elemental_nodal)
+    for i in range(1, num_entities+1):
+        field.append(np.full((i,3), float(i)), i)
+    values, offsets = field.get_entities_data_by_ids([3, 1])
+    assert np.allclose(offsets, [0, 3, 4])
+    assert np.allclose(values, [[3.]*3]*3 + [[1.]*3])
+    with field.as_local_field() as f:
+        values, offsets = f.get_entities_data([2, 0])
+        assert np.allclose(offsets, [0, 3, 4])
+        assert np.allclose(values, [[3.]*3]*3 + [[1.]*3])
+    
+    
+def test_iter_data_chunks_field():
+    field = dpf.core.fields_factory.create_3d_vector_field(1000)
+    data = np.arange(3000.).reshape(1000,3)
+    field.data = data
+    blocks = list(field.iter_data_chunks(max_bytes=1000))
+    assert len(blocks) > 1
+    for block in blocks:
+        assert block.shape[1] == 3
+    assert np.allclose(np.concatenate(blocks), data)
+    
+    
+def test_iter_data_chunks_elemental_nodal_field():
+    num_entities = 100
+    field = dpf.core.fields_factory.create_3d_vector_field(num_entities, location=dpf.core.locations.elemental_nodal)
+    with field.as_local_field() as f:
+        for i in range(1, num_entities+1):
+            f.append(np.full((i%4+1,3), float(i)), i)
+    data_pointer = field._data_pointer
+    blocks = list(field.iter_data_chunks(max_bytes=100))
+    assert np.allclose(np.concatenate(blocks), field.data)
+    ends = np.cumsum([block.shape[0] for block in blocks])*3
+    assert np.isin(ends[:-1], data_pointer).all()
+    
+    
+def test_read_into_field():
+    field = dpf.core.fields_factory.create_3d_vector_field(100)
+    data = np.arange(300).reshape(100,3)/7.
+    field.data = data
+    out = np.empty((100,3))
+    assert field.read_into(out) is out
+    assert np.allclose(out, data)
+    out = np.empty(300, dtype=np.float32)
+    field.read_into(out)
+    assert np.allclose(out, data.ravel())
+    with pytest.raises(ValueError):
+        field.read_into(np.empty(299))
+        
+        
+def test_to_memmap_field(tmpdir):
+    field = dpf.core.fields_factory.create_3d_vector_field(100)
+    data = np.arange(300).reshape(100,3)/7.
+    field.data = data
+    path = os.path.join(tmpdir, "field.npy")
+    out = field.to_memmap(path)
+    assert np.allclose(out, data)
+    del out
+    assert np.allclose(np.load(path, mmap_mode="r"), data)
+    
+    
+def test_append_many_field():
+    field = dpf.core.fields_factory.create_3d_vector_field(5)
+    field.append_many([1, 2, 3], np.arange(9.).reshape(3,3))
+    field.append_many(np.array([4, 5]), np.arange(6.))
+    assert field.shape == (5, 3)
+    assert np.allclose(field.scoping.ids, [1, 2, 3, 4, 5])
+    assert np.allclose(field.get_entity_data_by_id(4), [0., 1., 2.])
+    with pytest.raises(ValueError):
+        field.append_many([6, 7], np.ones(9))
+        
+        
+def test_append_many_elemental_nodal_field():
+    field = dpf.core.fields_factory.create_3d_vector_field(3, location=dpf.core.locations.elemental_nodal)
+    field.append_many([1, 2, 3], np.arange(18.).reshape(6,3), offsets=[0, 1, 4, 6])
+    assert np.allclose(field._data_pointer, [0, 3, 12])
+    assert np.allclose(field.get_entity_data_by_id(2), np.arange(3., 12.).reshape(3,3))
+    
+    
+def test_metadata_updated_after_mutation_field():
+    field = dpf.core.fields_factory.create_3d_vector_field(10)
+    field.data = np.zeros(30)
+    field.scoping.ids = range(1, 11)
+    assert field.shape == (10, 3)
+    assert field.location == dpf.core.locations.nodal
+    field.append([1., 2., 3.], 11)
+    assert field.shape == (11, 3)
+    field.unit = "mm"
+    assert field.unit == "mm"
+    field.location = dpf.core.locations.elemental
+    assert field.location == dpf.core.locations.elemental
+    with field.as_local_field() as f:
+        f.append([1., 2., 3.], 12)
+    assert field.shape == (12, 3)
+    
+    
+def test_metadata_updated_after_external_mutation_field():
+    field = dpf.core.fields_factory.create_3d_vector_field(10)
+    field.data = np.zeros(30)
+    field.scoping.ids = range(1, 11)
+    assert field.shape == (10, 3)
+    other = dpf.core.Field(field=field)
+    other.append([1., 2., 3.], 11)
+    assert field.shape == (11, 3)
+    field.unit
+    field.field_definition.unit = "mm"
+    assert field.unit == "mm"
+    assert field._metadata_snapshot.values is not None
+    field.scoping.set_id(0, 100)
+    assert field._metadata_snapshot.values is None
+    assert field.shape == (11, 3)
+    
+    
 def test_deep_copy_field():
     field = dpf.core.fields_factory.create_3d_vector_field(100)
     arr = np.arange(300).reshape(100,3)
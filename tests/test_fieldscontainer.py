@@ -124,6 +124,59 @@ def test_set_get_field_fields_container_new_label_default_value():
         assert fc.get_label_space(i)=={"time":i+1,"complex":0, 'shape':3}
 
 
+def test_entries_index_fields_container():
+    fc= FieldsContainer()
+    fc.labels =['time','complex']
+    for i in range(0,20):
+        fc.add_field({"time":i+1,"complex":0},Field(nentities=i+10))
+        fc.add_field({"time":i+1,"complex":1},Field(nentities=i+10))
+    fields = list(fc)
+    assert len(fields) == 40
+    assert fc[1] is fields[1]
+    assert fc.get_label_space(3)=={"time":2,"complex":1}
+    assert fc.get_available_ids_for_label("complex") == [0, 1]
+    assert len(fc.get_fields({"time":5})) == 2
+    assert fc.get_fields({"time":21}) is None
+    fc.add_field({"time":21,"complex":0},Field(nentities=2))
+    assert len(fc.get_fields({"time":21})) == 1
+    assert fc.get_available_ids_for_label() == list(range(1,22))
+    fc.add_label('shape',3)
+    assert fc.get_label_space(0)=={"time":1,"complex":0,"shape":3}
+
+
+def test_to_numpy_fields_container():
+    fc= FieldsContainer()
+    fc.labels =['time','complex']
+    for i in range(0,3):
+        field = fields_factory.create_3d_vector_field(2)
+        field.scoping.ids = [1, 2] if i != 1 else [3, 1]
+        field.data = np.arange(6, dtype=float) + 10 * i
+        fc.add_field({"time":i+1,"complex":0},field)
+    data, time_ids, node_ids = fc.to_numpy()
+    assert data.shape == (3, 3, 3)
+    assert np.allclose(time_ids, [1, 2, 3])
+    assert np.allclose(node_ids, [1, 2, 3])
+    assert np.allclose(data[0, :2], np.arange(6).reshape(2, 3))
+    assert np.isnan(data[0, 2]).all()
+    assert np.allclose(data[1, 0], [13, 14, 15])
+    assert np.isnan(data[1, 1]).all()
+
+
+def test_iter_data_fields_container():
+    fc= FieldsContainer()
+    fc.labels =['time','complex']
+    for i in range(0,5):
+        field = fields_factory.create_3d_vector_field(2)
+        field.scoping.ids = [1, 2]
+        field.data = np.arange(6, dtype=float) + 10 * i
+        fc.add_field({"time":i+1,"complex":0},field)
+    for prefetch in [0, 2, 10]:
+        datas = [data for field, data in fc.iter_data(prefetch=prefetch)]
+        assert len(datas) == 5
+        for i, data in enumerate(datas):
+            assert np.allclose(data, np.arange(6).reshape(2, 3) + 10 * i)
+
+
 def test_get_item_field_fields_container():
     fc= FieldsContainer()
     fc.labels =['time','complex']
@@ -309,6 +362,17 @@ def test_deep_copy_over_time_fields_container(velocity_acceleration):
     assert tf.time_frequencies.scoping.ids == copy.time_frequencies.scoping.ids
     
     
+def test_deep_copy_shared_support_fields_container(velocity_acceleration):
+    model = dpf.Model(velocity_acceleration)
+    stress = model.results.stress(time_scoping=[1,2,3])
+    fc = stress.outputs.fields_container()
+    copy = fc.deep_copy(max_workers=2)
+    
+    idenfc = dpf.operators.logic.identical_fc(fc,copy)
+    assert idenfc.outputs.boolean()
+    assert copy[0].meshed_region.nodes.n_nodes == fc[0].meshed_region.nodes.n_nodes
+    
+    
 def test_light_copy():
     fc = FieldsContainer()
     fc.labels = ["time"]
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from ansys import dpf
+
+
+@pytest.fixture()
+def simple_bar_model(simple_bar):
+    return dpf.core.Model(simple_bar)
+
+
+def test_interpolate_coordinates_at_nodes(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    coordinates = mesh.nodes.coordinates_field
+    points = coordinates.data[::50]
+    interpolator = dpf.core.Interpolator(mesh, points)
+    assert interpolator.found.all()
+    values = interpolator.interpolate(coordinates)
+    assert values.shape == points.shape
+    assert np.allclose(values, points)
+
+
+def test_interpolate_inside_and_outside(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    coordinates = mesh.nodes.coordinates_field
+    lower, upper = coordinates.data.min(axis=0), coordinates.data.max(axis=0)
+    points = [lower + (upper - lower) * 0.37, upper + (upper - lower)]
+    interpolator = dpf.core.Interpolator(mesh, points)
+    assert np.array_equal(interpolator.found, [True, False])
+    values = interpolator.interpolate(coordinates)
+    assert np.allclose(values[0], points[0])
+    assert np.isnan(values[1]).all()
+
+
+def test_interpolate_fields_container(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    displacements = simple_bar_model.results.displacement().outputs.fields_container()
+    points = mesh.nodes.coordinates_field.data[:3]
+    interpolator = dpf.core.Interpolator(mesh, points)
+    values = interpolator.interpolate(displacements)
+    assert values.shape == (len(displacements), 3, 3)
+    field = displacements[0]
+    ind, mask = mesh.nodes.map_scoping(field.scoping)
+    expected = np.full((len(mesh.nodes.scoping.ids), 3), np.nan)
+    expected[ind] = field.data[mask]
+    assert np.allclose(values[0], expected[:3])
@@ -134,6 +134,149 @@ def test_get_elements_meshedregion(simple_bar_model):
     assert el.nodes is not None
 
 
+def test_iter_nodes_elements_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    coordinates = mesh.nodes.coordinates_field.data
+    node_ids = mesh.nodes.scoping.ids
+    for i, node in enumerate(mesh.nodes):
+        assert node.id == node_ids[i]
+        assert node.index == i
+    assert np.allclose(node.coordinates, coordinates[-1])
+    connectivity = mesh.elements.connectivities_field
+    types = mesh.elements.element_types_field.data
+    elements = list(mesh.elements)
+    assert len(elements) == mesh.elements.n_elements
+    assert np.allclose(elements[5].connectivity, connectivity.get_entity_data(5))
+    assert elements[5].type.value == types[5]
+    assert elements[5].nodes[0].index == elements[5].connectivity[0]
+    assert mesh.elements.element_by_id(elements[5].id).index == 5
+
+
+def test_nodes_cache_updated_after_add_meshedregion():
+    mesh = dpf.core.MeshedRegion(num_nodes=2, num_elements=1)
+    mesh.nodes.add_node(1, [0.0,0.0,0.0])
+    assert len(list(mesh.nodes)) == 1
+    mesh.nodes.add_node(2, [1.0,0.0,0.0])
+    assert mesh.nodes.node_by_id(2).coordinates == [1.0,0.0,0.0]
+    mesh.elements.add_beam_element(1, [0,1])
+    assert mesh.elements[0].node_ids == [1, 2]
+
+
+def test_map_scoping_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    node_ids = mesh.nodes.scoping.ids
+    scop = dpf.core.Scoping(ids=[node_ids[3], -1, node_ids[0]], location=dpf.core.locations.nodal)
+    ind, mask = mesh.nodes.map_scoping(scop)
+    assert np.allclose(ind, [3, 0])
+    assert np.allclose(mask, [True, False, True])
+    element_ids = mesh.elements.scoping.ids
+    scop = dpf.core.Scoping(ids=element_ids[::-1], location=dpf.core.locations.elemental)
+    ind, mask = mesh.elements.map_scoping(scop)
+    assert np.allclose(ind, np.arange(len(element_ids))[::-1])
+    assert mask.all()
+
+
+def test_topology_cache_meshedregion(simple_bar_model, tmpdir):
+    mesh = simple_bar_model.metadata.meshed_region
+    grid = mesh.grid
+    cache = mesh.topology_cache
+    assert "grid" in cache and "connectivity" in cache
+    assert cache.nbytes > 0
+    assert mesh.grid is grid
+    node = mesh.nodes[0]
+    assert np.allclose(node.nodal_connectivity, 
+                       mesh.nodes.nodal_connectivity_field.get_entity_data(0))
+    cache.invalidate()
+    assert len(cache) == 0
+    assert mesh.grid is not grid
+    cache.max_bytes = 1
+    assert len(mesh.nodes._ids) == 3751
+    assert len(cache) == 1
+    grid = mesh._as_vtk(cache_dir=str(tmpdir))
+    assert len(tmpdir.listdir()) == 1
+    cached_grid = mesh._as_vtk(cache_dir=str(tmpdir))
+    assert cached_grid.n_cells == grid.n_cells == 3000
+    assert np.allclose(cached_grid.points, grid.points)
+
+
+def test_skin_grid_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    skin_grid = mesh.skin_grid
+    grid = mesh.grid
+    assert 0 < skin_grid.n_cells < grid.n_cells
+    assert all(skin_grid.celltypes == vtk.VTK_QUAD)
+    node_indices, element_indices = mesh._skin[:2]
+    assert skin_grid.n_points == len(node_indices) < grid.n_points
+    assert np.allclose(skin_grid.points, grid.points[node_indices])
+    assert len(element_indices) == skin_grid.n_cells
+    assert np.allclose(skin_grid.bounds, grid.bounds)
+    assert np.isclose(skin_grid.area, grid.extract_surface().area)
+
+
+def test_vtk_grid_polygons():
+    from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
+    nodes = np.array([[0., 0., 0.], [1., 0., 0.], [2., 0., 0.], [2., 1., 0.], [0., 1., 0.],
+                      [0.5, 0., 0.], [1., 0.5, 0.], [0.5, 0.5, 0.]])
+    connectivity = np.array([0, 1, 2, 3, 4, 0, 1, 4, 5, 6, 7])
+    connectivity_copy = connectivity.copy()
+    etypes = [dpf.core.element_types.Polygon.value, dpf.core.element_types.Tri6.value]
+    grid = dpf_mesh_to_vtk(nodes, etypes, connectivity, offsets=[0, 5])
+    assert np.allclose(grid.celltypes, [vtk.VTK_POLYGON, vtk.VTK_TRIANGLE])
+    assert grid.n_cells == 2
+    assert np.array_equal(connectivity, connectivity_copy)
+    grid = dpf_mesh_to_vtk(nodes, etypes, connectivity, as_linear=False, offsets=[0, 5])
+    assert np.allclose(grid.celltypes, [vtk.VTK_POLYGON, vtk.VTK_QUADRATIC_TRIANGLE])
+
+
+def test_spatial_queries_nodes(simple_bar_model):
+    nodes = simple_bar_model.metadata.meshed_region.nodes
+    coordinates = nodes.coordinates_field.data
+    ids = np.array(nodes.scoping.ids)
+    point = coordinates[10] + 1e-4
+    distances = np.linalg.norm(coordinates - point, axis=1)
+    closest = nodes.nearest(point, k=3)
+    assert closest.location == dpf.core.locations.nodal
+    assert np.allclose(closest.ids, ids[np.argsort(distances, kind="stable")[:3]])
+    assert np.allclose(nodes.nearest([point, point]).ids, [ids[10], ids[10]])
+    radius = np.sort(distances)[20]
+    assert np.allclose(nodes.within_radius(point, radius).ids, ids[distances <= radius])
+    lower, upper = coordinates.min(axis=0), coordinates.mean(axis=0)
+    inside = np.all((coordinates >= lower) & (coordinates <= upper), axis=1)
+    assert np.allclose(nodes.in_box(lower, upper).ids, ids[inside])
+
+
+def test_spatial_index_nearly_flat_nodes():
+    from ansys.dpf.core.nodes import _NodeGrid
+    coordinates = np.random.default_rng(0).random((20000, 3))
+    coordinates[:, 2] *= 1e-7
+    grid = _NodeGrid(coordinates)
+    assert grid.n_cells[2] == 1
+    assert np.prod(grid.n_cells) <= len(coordinates)
+    point = np.array([0.5, 0.5, 0.])
+    distances = np.linalg.norm(coordinates - point, axis=1)
+    assert np.allclose(grid.nearest(point, 4), np.argsort(distances)[:4])
+
+
+def test_nodal_connectivity_neighbors_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    element_indices, offsets = mesh.nodes.nodal_connectivity
+    assert len(offsets) == len(mesh.nodes) + 1
+    field = mesh.nodes.nodal_connectivity_field
+    for i in [0, 10, 200]:
+        assert np.allclose(np.sort(field.get_entity_data(i)), 
+                           element_indices[offsets[i]:offsets[i + 1]])
+    element = mesh.elements[5]
+    assert np.allclose(mesh.nodes.connected_elements(element.connectivity[:1]),
+                       element_indices[offsets[element.connectivity[0]]:offsets[element.connectivity[0] + 1]])
+    neighbors = mesh.elements.neighbors([5])
+    assert 5 not in neighbors
+    for neighbor in neighbors:
+        assert set(mesh.elements[int(neighbor)].connectivity) & set(element.connectivity)
+    ring = mesh.nodes.rings(element.connectivity[:1])
+    assert set(element.connectivity) <= set(ring)
+    assert set(ring) <= set(mesh.nodes.rings(element.connectivity[:1], n_rings=2))
+
+
 def test_str_meshedregion(simple_bar_model):
     meshed_region = simple_bar_model.metadata.meshed_region
     assert str(len(meshed_region.nodes)) in str(meshed_region)
@@ -297,6 +440,24 @@ def test_create_all_shaped_meshed_region():
     assert len(el.nodes)==4
     return mesh
 
+def test_create_from_arrays_meshed_region():
+    coordinates = [[0., 0., 0.], [1., 0., 0.], [2., 0., 0.], 
+                   [0., 1., 0.], [1., 1., 0.], [2., 1., 0.]]
+    mesh = dpf.core.MeshedRegion.from_arrays(
+        node_ids=np.arange(1, 7), coordinates=coordinates, 
+        element_ids=[1, 2, 3], 
+        element_types=[dpf.core.element_types.Quad4.value] * 2 + [dpf.core.element_types.Line2.value],
+        connectivity=[0, 1, 4, 3, 1, 2, 5, 4, 0, 5], offsets=[0, 4, 8, 10])
+    assert mesh.nodes.n_nodes == 6
+    assert mesh.elements.n_elements == 3
+    assert mesh.nodes.node_by_id(5).coordinates == [1., 1., 0.]
+    assert mesh.elements.element_by_id(2).connectivity == [1, 2, 5, 4]
+    assert mesh.elements.element_by_id(2).shape == "shell"
+    assert mesh.elements.element_by_id(3).shape == "beam"
+    with pytest.raises(ValueError):
+        dpf.core.MeshedRegion.from_arrays([1], [[0., 0., 0.]], [1], [0], [1], [0])
+
+
 def test_create_with_yield_meshed_region():
     ref_mesh = test_create_all_shaped_meshed_region()    
     mesh = dpf.core.MeshedRegion(num_nodes=ref_mesh.nodes.n_nodes, num_elements=ref_mesh.elements.n_elements)
@@ -80,6 +80,60 @@ def test_set_get_entity_data_scoping():
     assert scop._get_index(12)==1
     
 
+def test_local_id_index_scoping():
+    scop = Scoping()
+    ids=[1,2,3,5,8,9,10]
+    scop.ids= ids 
+    assert scop.id(3) == 5
+    assert scop[4] == 8
+    assert scop.index(9) == 5
+    assert scop.index(4) == -1
+    assert 10 in scop
+    assert 11 not in scop
+    assert np.allclose(scop.indices_of([10, 1, 4]), [6, 0, -1])
+    assert np.allclose(scop.ids_at([6, 0]), [10, 1])
+    scop.set_id(0,11)
+    assert scop.index(11) == 0
+    assert scop.id(0) == 11
+    scop.ids = [4, 3]
+    assert scop.index(3) == 1
+    assert len(scop) == 2
+    
+
+def test_contiguous_ids_scoping():
+    scop = Scoping()
+    scop.ids = range(1, 100001)
+    assert scop.size == 100000
+    assert scop.id(99999) == 100000
+    assert scop.index(500) == 499
+    assert scop.index(0) == -1
+    assert np.allclose(scop.ids[:3], [1, 2, 3])
+    scop.ids = np.concatenate([np.arange(100, 200), np.arange(10, 50)])
+    assert len(scop) == 140
+    assert np.allclose(scop.indices_of([10, 150, 60]), [100, 50, -1])
+    assert np.allclose(scop.ids_at([0, 139]), [100, 49])
+    copy = scop.deep_copy()
+    assert np.allclose(copy.ids, scop.ids)
+    ids = scop._get_ids(np_array=True)
+    assert ids is scop._get_ids(np_array=True)
+    assert not ids.flags.writeable
+    
+
+def test_set_operations_scoping():
+    scop = Scoping(ids=[1, 2, 3, 5, 8], location=dpf.core.locations.elemental)
+    other = Scoping(ids=[8, 3, 12])
+    assert scop.union(other).ids == [1, 2, 3, 5, 8, 12]
+    assert scop.intersection(other).ids == [3, 8]
+    assert scop.difference([3, 5]).ids == [1, 2, 8]
+    assert np.allclose(scop.isin(other), [False, False, True, False, True])
+    assert scop.union(other).location == dpf.core.locations.elemental
+    scop.ids = range(1, 1001)
+    other.ids = range(500, 2001)
+    assert scop.intersection(other).ids == list(range(500, 1001))
+    assert scop.difference(other).ids == list(range(1, 500))
+    assert scop.union(other).size == 2000
+    
+
 def test_print_scoping():
     scop = Scoping()
     ids=[1,2,3,5,8,9,10]